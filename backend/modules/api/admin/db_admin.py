@@ -8,9 +8,12 @@ import shutil
 import sqlite3
 from pydantic import BaseModel
 import re
-from modules.database.dependencies import get_users_db
+from modules.database.dependencies import get_analytics_db, get_users_db
 from modules.database.config import USERS_DATABASE_PATH
-from modules.database.session import users_engine
+from modules.database.analytics import refresh_analytics_replica
+from modules.database.indexes import explain_hot_queries
+from modules.database.health import database_metrics, read_health_report
+from modules.database.table_stats import table_page_counts, table_row_counts
 from utils.logger_config import configure_logger
 import os
 from dotenv import load_dotenv
@@ -87,28 +90,68 @@ async def backup_database():
     }
 
 
+@router.post(
+    "/analytics/refresh",
+    summary="Rafraîchir le réplica analytique",
+    response_model=dict,
+)
+def refresh_analytics():
+    """
+    Recopie immédiatement la base principale dans le réplica en lecture seule
+    utilisé par les rapports (classements de saison, exports, comptages).
+    """
+    if not refresh_analytics_replica():
+        raise HTTPException(
+            status_code=500, detail="Erreur lors du rafraîchissement du réplica."
+        )
+    return {"message": "Réplica analytique rafraîchi."}
+
+
 @router.get(
     "/monitor/tables",
     summary="Lister les tables et leur nombre de lignes",
     response_model=dict,
 )
-async def get_table_stats(db: Session = Depends(get_users_db)):
+def get_table_stats(
+    exact: bool = Query(
+        False, description="COUNT(*) exact sur chaque table (parcours complet)"
+    ),
+    sizes: bool = Query(False, description="Taille en pages (dbstat)"),
+    db: Session = Depends(get_analytics_db),
+):
     """
     Pour chaque table de la base, renvoie le nombre de lignes.
+    Par défaut, les nombres viennent de sqlite_stat1 (dernier ANALYZE) sans lire
+    les tables ; `exact=true` compte les lignes, `sizes=true` ajoute la taille en
+    pages quand SQLite fournit dbstat. Lu sur le réplica analytique : ces
+    lectures ne concurrencent pas la saisie des scores.
     """
-    inspector = inspect(users_engine)  # inspecte l'Engine SQLite
+    inspector = inspect(db.get_bind())  # inspecte l'Engine SQLite
     all_tables = inspector.get_table_names()
 
+    counts = {} if exact else table_row_counts(db)
+    pages = table_page_counts(db) if sizes else None
+
     stats = []
     for table in all_tables:
-        try:
-            # NB : SQLite n'a pas de schéma à qualifier, on met le nom brut
-            count_res = db.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar()
-        except Exception:
-            count_res = None
-        stats.append({"table": table, "rows": count_res})
+        if exact:
+            try:
+                # NB : SQLite n'a pas de schéma à qualifier, on met le nom brut
+                count_res = db.execute(text(f'SELECT COUNT(*) FROM "{table}"')).scalar()
+            except Exception:
+                count_res = None
+        else:
+            count_res = counts.get(table)
+        entry = {"table": table, "rows": count_res}
+        if pages is not None:
+            entry["pages"] = pages.get(table)
+        stats.append(entry)
 
-    return {"tables": stats}
+    return {
+        "tables": stats,
+        "exact": exact,
+        "analyzed": exact or bool(counts),
+    }
 
 
 @router.get(
@@ -116,16 +159,17 @@ async def get_table_stats(db: Session = Depends(get_users_db)):
     summary="État de santé basique de la base SQLite",
     response_model=dict,
 )
-async def get_db_health():
+def get_db_health():
     """
-    Retourne des métriques basiques pour SQLite :
-    - Résultat de PRAGMA integrity_check
+    Retourne des métriques basiques pour SQLite, sans lire les tables :
     - Nombre de pages et taille en bytes (via PRAGMA page_count et page_size)
     - Taille du fichier compilé (os.path.getsize)
     - Nombre de pages libres (freelist)
     - Mode journal
     - Niveau de synchronicité
     - Version SQLite
+    - Derniers résultats horodatés de quick_check / integrity_check, exécutés
+      en arrière-plan par le scheduler (jamais pendant la requête)
     """
     prod_db_path = Path(USERS_DATABASE_PATH)
     if not prod_db_path.exists():
@@ -134,53 +178,36 @@ async def get_db_health():
         )
 
     try:
-        with sqlite3.connect(str(prod_db_path), timeout=10) as conn:
-            cursor = conn.cursor()
-
-            cursor.execute("PRAGMA journal_mode;")
-            journal_mode = cursor.fetchone()[0]
-
-            cursor.execute("PRAGMA integrity_check;")
-            integrity_result = cursor.fetchone()[0]
-
-            cursor.execute("PRAGMA page_count;")
-            page_count = cursor.fetchone()[0]
-
-            cursor.execute("PRAGMA page_size;")
-            page_size = cursor.fetchone()[0]
-
-            cursor.execute("PRAGMA freelist_count;")
-            freelist_count = cursor.fetchone()[0]
-
-            cursor.execute("PRAGMA synchronous;")
-            synchronous_level = cursor.fetchone()[0]
-            synchronous = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}.get(
-                synchronous_level, f"UNKNOWN ({synchronous_level})"
-            )
-
-            cursor.execute("SELECT sqlite_version();")
-            sqlite_version = cursor.fetchone()[0]
-
+        metrics = database_metrics(prod_db_path)
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Erreur lors du PRAGMA SQLite : {e}"
         )
 
-    try:
-        file_size = prod_db_path.stat().st_size
-    except Exception:
-        file_size = None
+    checks = read_health_report()
+    integrity = checks.get("integrity_check") or checks.get("quick_check")
+    return {
+        # Dernier résultat connu ("ok" ou premier message d'erreur)
+        "integrity_check": integrity["messages"][0] if integrity else None,
+        **metrics,
+        "checks": checks,
+    }
 
+
+@router.get(
+    "/monitor/query-plans",
+    summary="Plans d'exécution des requêtes fréquentes",
+    response_model=dict,
+)
+def get_query_plans(db: Session = Depends(get_users_db)):
+    """
+    Exécute EXPLAIN QUERY PLAN sur le catalogue des requêtes fréquentes de l'application
+    et signale celles qui parcourent une table entière (SCAN sans index).
+    """
+    plans = explain_hot_queries(db)
     return {
-        "integrity_check": integrity_result,
-        "page_count": page_count,
-        "page_size": page_size,
-        "calculated_size_bytes": page_count * page_size,
-        "file_size_bytes": file_size,
-        "freelist_count": freelist_count,
-        "journal_mode": journal_mode,
-        "synchronous": synchronous,
-        "sqlite_version": sqlite_version,
+        "full_scan_count": sum(not plan["ok"] for plan in plans),
+        "queries": plans,
     }
 
 
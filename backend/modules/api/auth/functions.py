@@ -6,9 +6,11 @@ import os
 from dotenv import load_dotenv
 from utils.logger_config import configure_logger
 from modules.api.users.functions import get_user_by_email
+from sqlalchemy import delete, or_, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from modules.api.auth.models import RefreshToken
+from modules.database.session import UsersSessionLocal
 
 logger = configure_logger()
 
@@ -17,6 +19,12 @@ load_dotenv()
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = "HS256"
 
+# Purge des jetons expirés ou révoqués, par lots (verrou d'écriture court)
+REFRESH_TOKENS_PRUNE_BATCH_SIZE = int(
+    os.getenv("REFRESH_TOKENS_PRUNE_BATCH_SIZE", "1000")
+)
+REFRESH_TOKENS_PRUNE_HOURS = float(os.getenv("REFRESH_TOKENS_PRUNE_HOURS", "6"))
+
 
 def create_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
@@ -131,3 +139,46 @@ def find_refresh_token(db: Session, hashed_token: str) -> RefreshToken | None:
 
 def verify_token(provided_token: str, stored_hash: str) -> bool:
     return hash_token(provided_token) == stored_hash
+
+
+def prune_refresh_tokens(
+    db: Session, batch_size: int = REFRESH_TOKENS_PRUNE_BATCH_SIZE
+) -> int:
+    """
+    Delete one batch of expired or revoked refresh tokens (neither can be used
+    to refresh anymore). Returns the number of rows deleted.
+    """
+    stale = (
+        select(RefreshToken.id)
+        .where(
+            or_(
+                RefreshToken.expires_at < datetime.now(UTC),
+                RefreshToken.revoked.is_(True),
+            )
+        )
+        .limit(batch_size)
+    )
+    return db.execute(delete(RefreshToken).where(RefreshToken.id.in_(stale))).rowcount
+
+
+def prune_stale_refresh_tokens() -> int:
+    """
+    Scheduled pruning: batch after batch, each in its own transaction, so that
+    logins are never blocked for long.
+    """
+    total = 0
+    while True:
+        with UsersSessionLocal() as db:
+            try:
+                deleted = prune_refresh_tokens(db)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.exception(f"Error pruning refresh tokens: {e}")
+                return total
+        total += deleted
+        if deleted < REFRESH_TOKENS_PRUNE_BATCH_SIZE:
+            break
+    if total:
+        logger.info(f"Refresh tokens pruned: {total}.")
+    return total
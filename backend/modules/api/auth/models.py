@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from modules.database.session import UsersBase
 from datetime import datetime, timezone
@@ -15,3 +15,9 @@ class RefreshToken(UsersBase):
     revoked = Column(Boolean, default=False, nullable=False)
 
     users = relationship("User", back_populates="refresh_tokens")
+
+    __table_args__ = (
+        # Révocation à chaque connexion : seuls les jetons actifs du joueur sont lus
+        Index("ix_refresh_token_user_revoked", "user_id", "revoked"),
+        Index("ix_refresh_token_expires", "expires_at"),
+    )
@@ -2,7 +2,7 @@ from utils.logger_config import configure_logger
 from datetime import timedelta, datetime, UTC
 from dotenv import load_dotenv
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from modules.api.auth.schemas import Token
 from modules.api.users.models import User
 from modules.api.auth.models import RefreshToken
@@ -25,8 +25,10 @@ from modules.api.auth.functions import find_refresh_token
 from modules.api.auth.security import hash_token
 
 from fastapi.responses import JSONResponse
+from sqlalchemy import select
+from utils.pagination import PageParams, page_params, page_response, paginate
 from uuid import uuid4
-from typing import List
+from typing import List, Optional
 from modules.api.users.telegram import notify_telegram, NotifyUserLogin
 
 load_dotenv()
@@ -191,19 +193,43 @@ def refresh_token(
 
 @auth_router.get("/refresh-tokens", response_model=List[dict])
 def list_refresh_tokens(
-    db: Session = Depends(get_users_db), current_user: User = Depends(get_current_user)
+    user_id: Optional[int] = Query(None, description="Tokens of this user only"),
+    revoked: Optional[bool] = Query(None, description="Filter on revocation"),
+    params: PageParams = Depends(page_params(default_limit=100)),
+    db: Session = Depends(get_users_db),
+    current_user: User = Depends(get_current_user),
 ):
     if current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Access denied.")
 
-    tokens = db.query(RefreshToken).all()
-    return [
-        {
-            "user_id": token.user_id,
-            "token": token.token[:10] + "...",
-            "created_at": token.created_at,
-            "expires_at": token.expires_at,
-            "revoked": token.revoked,
-        }
-        for token in tokens
-    ]
+    params.check_fields(
+        ["id", "user_id", "token", "created_at", "expires_at", "revoked"]
+    )
+    stmt = select(
+        RefreshToken.id,
+        RefreshToken.user_id,
+        RefreshToken.token,
+        RefreshToken.created_at,
+        RefreshToken.expires_at,
+        RefreshToken.revoked,
+    )
+    # Filtres servis par l'index (user_id, revoked)
+    if user_id is not None:
+        stmt = stmt.where(RefreshToken.user_id == user_id)
+    if revoked is not None:
+        stmt = stmt.where(RefreshToken.revoked.is_(revoked))
+    page = paginate(db, stmt, RefreshToken.id, params)
+    return page_response(
+        page,
+        [
+            {
+                "id": token.id,
+                "user_id": token.user_id,
+                "token": token.token[:10] + "...",
+                "created_at": token.created_at,
+                "expires_at": token.expires_at,
+                "revoked": token.revoked,
+            }
+            for token in page.items
+        ],
+    )
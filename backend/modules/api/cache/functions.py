@@ -0,0 +1,159 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, List, Optional
+import orjson
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy import select, text, union
+from sqlalchemy.orm import Session
+from modules.api.cache.models import CacheVersion
+from modules.api.tournaments.models import (
+    Participant,
+    ParticipantMember,
+    TournamentRegistration,
+)
+from utils.pagination import Page, select_fields
+from dotenv import load_dotenv
+
+load_dotenv()
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+
+# Cache local au processus : clé de requête -> (etag, corps JSON sérialisé, en-têtes)
+_cache: "OrderedDict[str, tuple[str, bytes, dict]]" = OrderedDict()
+_cache_lock = threading.Lock()
+_adapters: dict = {}
+
+
+def get_versions(db: Session, scopes: Iterable[str]) -> dict:
+    """
+    Return the current version of each scope (0 if it was never bumped), in one query.
+    """
+    scopes = list(scopes)
+    rows = db.query(CacheVersion).filter(CacheVersion.scope.in_(scopes)).all()
+    versions = dict.fromkeys(scopes, 0)
+    versions.update({row.scope: row.version for row in rows})
+    return versions
+
+
+def bump_version(db: Session, *scopes: str):
+    """
+    Increment the version of the given scopes in the current transaction,
+    invalidating every cached response that depends on them.
+    """
+    for scope in scopes:
+        db.execute(
+            text(
+                "INSERT INTO cache_versions (scope, version) VALUES (:scope, 1) "
+                "ON CONFLICT(scope) DO UPDATE SET version = version + 1"
+            ),
+            {"scope": scope},
+        )
+
+
+def bump_tournament(db: Session, tournament_id: int, listing: bool = False):
+    """
+    Invalidate the cached views of a tournament and the season results.
+    `listing` must be set when the tournament row itself changes (name, status...).
+    """
+    scopes = [f"tournament:{tournament_id}", "results"]
+    if listing:
+        scopes.append("tournaments")
+    bump_version(db, *scopes)
+
+
+def bump_user(db: Session, user_id: int):
+    """
+    Invalidate the cached views that show a user's name or nickname: the
+    tournaments they registered for or played in, the listings and the
+    season results.
+    """
+    tournament_ids = db.scalars(
+        union(
+            select(TournamentRegistration.tournament_id).where(
+                TournamentRegistration.user_id == user_id
+            ),
+            select(Participant.tournament_id)
+            .join(ParticipantMember, ParticipantMember.participant_id == Participant.id)
+            .where(ParticipantMember.user_id == user_id),
+        )
+    ).all()
+    bump_version(
+        db,
+        *(f"tournament:{tournament_id}" for tournament_id in tournament_ids),
+        "results",
+        "tournaments",
+    )
+
+
+def _serialize(
+    response_model: Any, content: Any, fields: Optional[List[str]] = None
+) -> bytes:
+    adapter = _adapters.get(response_model)
+    if adapter is None:
+        adapter = _adapters[response_model] = TypeAdapter(response_model)
+    validated = adapter.validate_python(content)
+    if fields:
+        items = adapter.dump_python(validated, mode="json")
+        return orjson.dumps(select_fields(items, fields))
+    return adapter.dump_json(validated)
+
+
+def cached_response(
+    request: Request,
+    db: Session,
+    scopes: Iterable[str],
+    response_model: Any,
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Serve a read endpoint from the response cache.
+
+    The ETag is derived from the request path/parameters and the versions of the
+    scopes the response depends on: a matching If-None-Match gets a 304, a cached
+    body for the same ETag is returned as-is, otherwise `build()` is called and
+    its result serialized with `response_model` and stored. `build()` may return
+    a pagination Page, whose headers are cached along with the body.
+    """
+    versions = get_versions(db, scopes)
+    key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    etag = '"{}"'.format(
+        hashlib.sha1(f"{key}|{sorted(versions.items())}".encode()).hexdigest()[:20]
+    )
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry and entry[0] == etag:
+            _cache.move_to_end(key)
+            return Response(
+                entry[1], media_type="application/json", headers={**headers, **entry[2]}
+            )
+
+    content = build()
+    extra_headers = {}
+    if isinstance(content, Page):
+        extra_headers = content.headers()
+        body = _serialize(response_model, content.items, content.fields)
+    else:
+        body = _serialize(response_model, content)
+
+    with _cache_lock:
+        _cache[key] = (etag, body, extra_headers)
+        _cache.move_to_end(key)
+        while len(_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+    return Response(
+        body, media_type="application/json", headers={**headers, **extra_headers}
+    )
+
+
+def clear_response_cache():
+    with _cache_lock:
+        _cache.clear()
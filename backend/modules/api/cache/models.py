@@ -0,0 +1,10 @@
+from sqlalchemy import Column, Integer, String
+from modules.database.session import UsersBase
+
+
+class CacheVersion(UsersBase):
+    __tablename__ = "cache_versions"
+
+    # 'tournaments', 'results', 'events' ou 'tournament:<id>'
+    scope = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
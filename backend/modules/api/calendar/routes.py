@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from modules.database.dependencies import get_users_db
 from modules.api.calendar.models import Event
@@ -9,6 +9,10 @@ from modules.api.calendar.shemas import (
 )
 from modules.api.users.functions import get_current_user
 from modules.api.users.schemas import TokenData
+from modules.api.cache.functions import cached_response, bump_version
+from utils.fast_json import rows_to_dicts
+from utils.pagination import Page, PageParams, page_params, paginate
+from sqlalchemy import select
 from typing import List
 
 calendar_router = APIRouter(prefix="/events", tags=["Calendar"])
@@ -38,6 +42,7 @@ def create_Event(
         date=event_data.date,
     )
     db.add(new_event)
+    bump_version(db, "events")
     db.commit()
     db.refresh(new_event)
     return EventResponse(
@@ -71,6 +76,7 @@ def delete_event(
         raise HTTPException(status_code=404, detail="Event not found.")
 
     db.delete(event)
+    bump_version(db, "events")
     db.commit()
 
 
@@ -99,6 +105,7 @@ def update_event(
     for field, value in event_data.dict(exclude_unset=True).items():
         setattr(event, field, value)
 
+    bump_version(db, "events")
     db.commit()
     db.refresh(event)
     return EventResponse(
@@ -119,8 +126,15 @@ def update_event(
 )
 def get_event(
     event_id: int,
+    request: Request,
     db: Session = Depends(get_users_db),
 ):
+    return cached_response(
+        request, db, ["events"], EventResponse, lambda: build_event(db, event_id)
+    )
+
+
+def build_event(db: Session, event_id: int) -> EventResponse:
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -138,20 +152,36 @@ def get_event(
     "/",
     response_model=List[EventResponse],
     summary="List all events",
-    description="Retrieves a list of all events in the system.",
+    description="Retrieves a list of all events in the system, ordered by id. Supports keyset pagination (`cursor`, `limit`), field selection (`fields`) and `with_total`.",
 )
 def get_events(
+    request: Request,
+    params: PageParams = Depends(page_params()),
     db: Session = Depends(get_users_db),
 ):
-    events = db.query(Event).all()
-    return [
-        EventResponse(
-            id=event.id,
-            name=event.name,
-            organiser=event.organiser,
-            description=event.description,
-            place=event.place,
-            date=event.date,
-        )
-        for event in events
-    ]
+    params.check_fields(EventResponse.model_fields)
+    return cached_response(
+        request,
+        db,
+        ["events"],
+        List[EventResponse],
+        lambda: build_events(db, params),
+    )
+
+
+def build_events(db: Session, params: PageParams = PageParams()) -> Page:
+    page = paginate(
+        db,
+        select(
+            Event.id,
+            Event.name,
+            Event.organiser,
+            Event.description,
+            Event.place,
+            Event.date,
+        ),
+        Event.id,
+        params,
+    )
+    page.items = rows_to_dicts(page.items)
+    return page
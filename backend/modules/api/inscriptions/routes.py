@@ -10,8 +10,10 @@ from modules.api.inscriptions.schemas import (
     InscriptionResponse,
     InscriptionUpdate,
 )
-import pandas as pd
 from io import BytesIO
+from sqlalchemy import select
+from utils.fast_json import rows_to_dicts
+from utils.pagination import PageParams, page_params, page_response, paginate
 from collections import Counter
 
 inscription_router = APIRouter(prefix="/inscriptions", tags=["Inscriptions"])
@@ -140,11 +142,15 @@ def update_inscription(
 def list_inscriptions(
     db: Session = Depends(get_users_db),
     skip: int = 0,
-    limit: int = 100,
+    params: PageParams = Depends(page_params(default_limit=100)),
     current_user: User = Depends(require_admin),  # Admin only
 ):
-    inscriptions = db.query(Inscription).offset(skip).limit(limit).all()
-    return inscriptions
+    # `skip` est conservé pour les anciens clients, `cursor` est à privilégier
+    params.check_fields(InscriptionResponse.model_fields)
+    page = paginate(
+        db, select(*Inscription.__table__.c), Inscription.id, params, offset=skip
+    )
+    return page_response(page, rows_to_dicts(page.items))
 
 
 @inscription_router.delete(
@@ -179,6 +185,9 @@ def bulk_import_inscriptions_from_excel(
             status_code=400, detail="Invalid file format: Must be Excel or CSV"
         )
 
+    # Import lourd chargé uniquement lors d'un import de fichier
+    import pandas as pd
+
     try:
         content = BytesIO(file.file.read())
         if file.filename.endswith(".csv"):
@@ -6,9 +6,10 @@ from modules.api.users.functions import get_current_user
 from modules.api.licences.models import Licence
 from modules.api.users.models import User
 from modules.api.licences.schemas import LicenceCreate, LicenceResponse, LicenceUpdate
-import pandas as pd
 from io import BytesIO
-from fuzzywuzzy import fuzz, process
+from sqlalchemy import select
+from utils.fast_json import rows_to_dicts
+from utils.pagination import PageParams, page_params, page_response, paginate
 from sqlalchemy.exc import IntegrityError
 
 licence_router = APIRouter(prefix="/licences", tags=["Licences"])
@@ -123,11 +124,13 @@ def update_licence(
 def list_licences(
     db: Session = Depends(get_users_db),
     skip: int = 0,
-    limit: int = 100,
+    params: PageParams = Depends(page_params(default_limit=100)),
     current_user: User = Depends(require_admin),  # Admin only
 ):
-    licences = db.query(Licence).offset(skip).limit(limit).all()
-    return licences
+    # `skip` est conservé pour les anciens clients, `cursor` est à privilégier
+    params.check_fields(LicenceResponse.model_fields)
+    page = paginate(db, select(*Licence.__table__.c), Licence.id, params, offset=skip)
+    return page_response(page, rows_to_dicts(page.items))
 
 
 @licence_router.delete("/{licence_id:int}", status_code=status.HTTP_204_NO_CONTENT)
@@ -158,6 +161,10 @@ def bulk_create_licences_from_excel(
             status_code=400, detail="Invalid file format: Must be Excel or CSV"
         )
 
+    # Imports lourds chargés uniquement lors d'un import de fichier
+    import pandas as pd
+    from fuzzywuzzy import fuzz, process
+
     try:
         content = BytesIO(file.file.read())
         if file.filename.endswith(".csv"):
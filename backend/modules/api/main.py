@@ -3,30 +3,52 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 import os
 
+from modules.api.printful.client import close_client as close_printful_client
 from modules.api.users.create_db import init_users_db
-from modules.api.users.routes import users_router
-from modules.api.auth.routes import auth_router
-from modules.api.notifs.routes import notifs_router
-from modules.api.admin.db_admin import router as admin_router
-from modules.api.tournaments.routes.leaderboards import leaderboards_router
-from modules.api.tournaments.routes.matches import matches_router
-from modules.api.tournaments.routes.pools import pools_router
-from modules.api.tournaments.routes.tournaments import tournaments_router
-from modules.api.stripe.routes import payments_router
-from modules.api.calendar.routes import calendar_router
-from modules.api.official_leaderboards.lsef import leaderboards_lsef_router
-from modules.api.official_leaderboards.cmer import leaderboards_cmer_router
-from modules.api.licences.routes import licence_router
-from modules.api.inscriptions.routes import inscription_router
-from modules.api.printful.routes import printful_router
 from scheduler import start_scheduler
+from utils.logger_config import configure_logger
+from utils.startup_report import timed_import, get_startup_report
 
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
+logger = configure_logger()
+
 PORT_FRONT = os.getenv("PORT_FRONT")
+ENV = os.getenv("ENV")
+
+# (module, nom du router, options d'inclusion) dans l'ordre d'inclusion
+ROUTERS = [
+    (
+        "modules.api.auth.routes",
+        "auth_router",
+        {"prefix": "/auth", "tags": ["Authentification"]},
+    ),
+    (
+        "modules.api.users.routes",
+        "users_router",
+        {"prefix": "/users", "tags": ["Users"]},
+    ),
+    ("modules.api.notifs.routes", "notifs_router", {"tags": ["Notifications"]}),
+    ("modules.api.tournaments.routes.tournaments", "tournaments_router", {}),
+    ("modules.api.tournaments.routes.leaderboards", "leaderboards_router", {}),
+    ("modules.api.tournaments.routes.pools", "pools_router", {}),
+    ("modules.api.stripe.routes", "payments_router", {}),
+    ("modules.api.tournaments.routes.matches", "matches_router", {}),
+    ("modules.api.tournaments.routes.brackets", "brackets_router", {}),
+    ("modules.api.tournaments.routes.exports", "exports_router", {}),
+    ("modules.api.ratings.routes", "ratings_router", {}),
+    ("modules.api.stats.routes", "stats_router", {}),
+    ("modules.api.official_leaderboards.lsef", "leaderboards_lsef_router", {}),
+    ("modules.api.official_leaderboards.cmer", "leaderboards_cmer_router", {}),
+    ("modules.api.calendar.routes", "calendar_router", {}),
+    ("modules.api.licences.routes", "licence_router", {}),
+    ("modules.api.inscriptions.routes", "inscription_router", {}),
+    ("modules.api.printful.routes", "printful_router", {}),
+    ("modules.api.admin.db_admin", "router", {}),
+]
 
 
 def create_app() -> FastAPI:
@@ -48,26 +70,15 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Next-Cursor", "X-Total-Count"],
     )
 
     router = APIRouter()
 
-    # Routes existantes (inchangées)
-    router.include_router(auth_router, prefix="/auth", tags=["Authentification"])
-    router.include_router(users_router, prefix="/users", tags=["Users"])
-    router.include_router(notifs_router, tags=["Notifications"])
-    router.include_router(tournaments_router)
-    router.include_router(leaderboards_router)
-    router.include_router(pools_router)
-    router.include_router(payments_router)
-    router.include_router(matches_router)
-    router.include_router(leaderboards_lsef_router)
-    router.include_router(leaderboards_cmer_router)
-    router.include_router(calendar_router)
-    router.include_router(licence_router)
-    router.include_router(inscription_router)
-    router.include_router(printful_router)
-    router.include_router(admin_router)
+    # Import chronométré de chaque module de routes (rapport disponible en dev)
+    for module_path, router_name, options in ROUTERS:
+        module = timed_import(module_path)
+        router.include_router(getattr(module, router_name), **options)
 
     app.include_router(router)
 
@@ -75,11 +86,31 @@ def create_app() -> FastAPI:
     async def root():
         return RedirectResponse(url="/docs")
 
+    @app.get("/health", include_in_schema=False)
+    async def health():
+        # Sonde de vie (Docker) : aucune requête SQL, ne bloque jamais
+        return {"status": "ok"}
+
+    if ENV == "dev":
+
+        @app.get("/dev/startup-report", include_in_schema=False)
+        def startup_report():
+            return get_startup_report()
+
+        report = get_startup_report()
+        logger.info(
+            f"Routes imported in {report['total_import_ms']} ms, "
+            f"heavy modules loaded: {report['heavy_modules_loaded']}"
+        )
+
     # Initialisation safe de la DB (inchangée)
     init_users_db()
 
     start_scheduler()
 
+    # Client HTTP partagé (Printful) : connexions fermées à l'arrêt du worker
+    app.add_event_handler("shutdown", close_printful_client)
+
     return app
 
 
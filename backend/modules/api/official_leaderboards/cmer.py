@@ -1,7 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-import pdfplumber
-import pandas as pd
-import json
+from fastapi.responses import FileResponse
 import os
 from typing import List
 from pydantic import BaseModel
@@ -40,6 +38,10 @@ class CMERLeaderboardResponse(BaseModel):
 
 
 def parse_pdf(file_path: str) -> dict:
+    # Imports lourds chargés uniquement lors de la mise à jour du classement
+    import pdfplumber
+    import pandas as pd
+
     categories = {}
     current_category = None
 
@@ -143,9 +145,10 @@ async def update_cmer_leaderboard(
         f.write(await file.read())
 
     try:
-        data = parse_pdf(temp_path)
-        with open(JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        # Validé une seule fois à l'écriture, le fichier est ensuite servi tel quel
+        data = CMERLeaderboardResponse(**parse_pdf(temp_path))
+        with open(JSON_PATH, "wb") as f:
+            f.write(data.model_dump_json().encode("utf-8"))
         return {"message": "CMER leaderboard updated successfully"}
     finally:
         # Clean up temp file
@@ -158,7 +161,4 @@ def get_cmer_leaderboard():
     if not os.path.exists(JSON_PATH):
         raise HTTPException(status_code=404, detail="CMER leaderboard not yet updated")
 
-    with open(JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return CMERLeaderboardResponse(**data)
+    return FileResponse(JSON_PATH, media_type="application/json")
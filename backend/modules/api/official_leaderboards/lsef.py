@@ -1,7 +1,5 @@
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
-import pdfplumber
-import pandas as pd
-import json
+from fastapi.responses import FileResponse
 import os
 from typing import List
 from pydantic import BaseModel
@@ -42,6 +40,8 @@ class LSEFLeaderboardResponse(BaseModel):
 
 
 def extract_table(page):
+    import pandas as pd
+
     words = page.extract_words(keep_blank_chars=True, x_tolerance=2, y_tolerance=2)
 
     # Group words by approximate row (using top as key, rounded for tolerance)
@@ -136,6 +136,10 @@ def extract_table(page):
 
 
 def parse_pdf(file_path: str) -> dict:
+    # Imports lourds chargés uniquement lors de la mise à jour du classement
+    import pdfplumber
+    import pandas as pd
+
     categories = {}
     current_category = None
 
@@ -205,9 +209,10 @@ async def update_lsef_leaderboard(
         f.write(await file.read())
 
     try:
-        data = parse_pdf(temp_path)
-        with open(JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        # Validé une seule fois à l'écriture, le fichier est ensuite servi tel quel
+        data = LSEFLeaderboardResponse(**parse_pdf(temp_path))
+        with open(JSON_PATH, "wb") as f:
+            f.write(data.model_dump_json().encode("utf-8"))
         return {"message": "LSEF leaderboard updated successfully"}
     finally:
         # Clean up temp file
@@ -220,7 +225,4 @@ def get_lsef_leaderboard():
     if not os.path.exists(JSON_PATH):
         raise HTTPException(status_code=404, detail="LSEF leaderboard not yet updated")
 
-    with open(JSON_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return LSEFLeaderboardResponse(**data)
+    return FileResponse(JSON_PATH, media_type="application/json")
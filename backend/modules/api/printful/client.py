@@ -0,0 +1,122 @@
+import asyncio
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+import httpx
+from fastapi import HTTPException
+from dotenv import load_dotenv
+from utils.logger_config import configure_logger
+
+load_dotenv()
+
+logger = configure_logger()
+
+PRINTFUL = os.getenv("PRINTFUL")
+STORE_ID = "badarts"
+BASE_URL = os.getenv("PRINTFUL_BASE_URL", "https://api.printful.com")
+
+PRINTFUL_TIMEOUT_SECONDS = float(os.getenv("PRINTFUL_TIMEOUT_SECONDS", "10"))
+PRINTFUL_MAX_CONNECTIONS = int(os.getenv("PRINTFUL_MAX_CONNECTIONS", "10"))
+# Catalogue : frais pendant le TTL, puis servi périmé pendant STALE le temps d'un rafraîchissement
+PRINTFUL_CACHE_TTL_SECONDS = float(os.getenv("PRINTFUL_CACHE_TTL_SECONDS", "300"))
+PRINTFUL_CACHE_STALE_SECONDS = float(os.getenv("PRINTFUL_CACHE_STALE_SECONDS", "3600"))
+
+_client: Optional[httpx.AsyncClient] = None
+# Chemin -> (instant de la réponse, corps JSON)
+_cache: Dict[str, Tuple[float, Any]] = {}
+# Chemin -> récupération en cours (une seule requête Printful par chemin)
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+def get_printful_headers() -> dict:
+    return {
+        "Authorization": f"Bearer {PRINTFUL}",
+        "X-PF-Store-Id": STORE_ID,
+        "Content-Type": "application/json",
+    }
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Shared client of the process: keep-alive connections reused across
+    requests (no new TLS handshake per call), bounded pool and timeouts.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=get_printful_headers(),
+            timeout=httpx.Timeout(PRINTFUL_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=PRINTFUL_MAX_CONNECTIONS,
+                max_keepalive_connections=PRINTFUL_MAX_CONNECTIONS,
+            ),
+        )
+    return _client
+
+
+async def close_client():
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def clear_cache():
+    _cache.clear()
+    _inflight.clear()
+
+
+async def printful_request(
+    method: str, path: str, error: str = "Erreur API Printful", **kwargs
+) -> Any:
+    """
+    Call the Printful API without blocking the event loop. Network and HTTP
+    errors are reported as a 500 prefixed with `error`.
+    """
+    try:
+        response = await get_client().request(method, path, **kwargs)
+        response.raise_for_status()
+        return response.json()
+    except httpx.HTTPError as e:
+        raise HTTPException(status_code=500, detail=f"{error}: {str(e)}")
+
+
+async def _fetch(path: str) -> Any:
+    try:
+        content = await printful_request("GET", path)
+        _cache[path] = (time.monotonic(), content)
+        return content
+    finally:
+        _inflight.pop(path, None)
+
+
+def _start_fetch(path: str) -> asyncio.Task:
+    task = _inflight.get(path)
+    if task is None:
+        task = _inflight[path] = asyncio.create_task(_fetch(path))
+    return task
+
+
+def _log_refresh_error(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Printful cache refresh failed: {task.exception()}")
+
+
+async def cached_get(path: str) -> Any:
+    """
+    GET with a TTL cache and stale-while-revalidate: a fresh entry is served
+    as-is, a stale one is served immediately while a single background request
+    refreshes it, a missing or expired one is fetched (concurrent misses share
+    the same request).
+    """
+    entry = _cache.get(path)
+    if entry is not None:
+        age = time.monotonic() - entry[0]
+        if age < PRINTFUL_CACHE_TTL_SECONDS:
+            return entry[1]
+        if age < PRINTFUL_CACHE_TTL_SECONDS + PRINTFUL_CACHE_STALE_SECONDS:
+            if path not in _inflight:
+                _start_fetch(path).add_done_callback(_log_refresh_error)
+            return entry[1]
+    return await asyncio.shield(_start_fetch(path))
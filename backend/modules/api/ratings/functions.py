@@ -0,0 +1,223 @@
+import os
+from datetime import UTC, datetime
+from statistics import fmean
+from typing import Collection, Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+from modules.api.ratings.models import PlayerRating, RatingHistory
+from modules.api.tournaments.models import Match
+from modules.api.tournaments.results import (
+    MatchResult,
+    load_results,
+    stamp_missing_completions,
+)
+from utils.logger_config import configure_logger
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = configure_logger()
+
+RATING_INITIAL = float(os.getenv("RATING_INITIAL", "1500"))
+RATING_K_FACTOR = float(os.getenv("RATING_K_FACTOR", "32"))
+
+
+def expected_score(rating: float, opponent: float) -> float:
+    return 1 / (1 + 10 ** ((opponent - rating) / 400))
+
+
+def rate_result(
+    ratings: Dict[int, float], result: MatchResult
+) -> List[Tuple[int, float, float]]:
+    """
+    Apply one match to `ratings` (Elo, updated in place) and return the
+    (user_id, before, after) changes. A team plays with the mean rating of its
+    members and every member gets the team's delta.
+    """
+    first, second = result.sides
+    first_rating = fmean(ratings.get(u, RATING_INITIAL) for u in first.user_ids)
+    second_rating = fmean(ratings.get(u, RATING_INITIAL) for u in second.user_ids)
+    delta = RATING_K_FACTOR * (
+        result.outcome - expected_score(first_rating, second_rating)
+    )
+
+    changes = []
+    for side, side_delta in ((first, delta), (second, -delta)):
+        for user_id in side.user_ids:
+            before = ratings.get(user_id, RATING_INITIAL)
+            ratings[user_id] = before + side_delta
+            changes.append((user_id, before, ratings[user_id]))
+    return changes
+
+
+def _history_row(result: MatchResult, user_id: int, before: float, after: float):
+    return {
+        "user_id": user_id,
+        "match_id": result.match_id,
+        "tournament_id": result.tournament_id,
+        "played_on": result.played_on,
+        "rating_before": before,
+        "rating_after": after,
+        "sequence": result.sequence,
+    }
+
+
+def replay_ratings(db: Session) -> int:
+    """
+    Recompute every rating and the whole history from the completed matches,
+    in the current transaction: one read query, an in-memory pass in
+    completion order, then bulk inserts. Returns the number of matches.
+    """
+    stamp_missing_completions(db)
+    results = load_results(db)
+    ratings, played, last_match = {}, {}, {}
+    history = []
+    for result in results:
+        for user_id, before, after in rate_result(ratings, result):
+            history.append(_history_row(result, user_id, before, after))
+            played[user_id] = played.get(user_id, 0) + 1
+            last_match[user_id] = result.match_id
+
+    db.execute(delete(RatingHistory))
+    db.execute(delete(PlayerRating))
+    if history:
+        db.execute(insert(RatingHistory), history)
+    if ratings:
+        now = datetime.now(UTC)
+        db.execute(
+            insert(PlayerRating),
+            [
+                {
+                    "user_id": user_id,
+                    "rating": rating,
+                    "matches_played": played[user_id],
+                    "last_match_id": last_match[user_id],
+                    "updated_at": now,
+                }
+                for user_id, rating in ratings.items()
+            ],
+        )
+    logger.info(f"Ratings replayed: {len(results)} matches, {len(ratings)} players.")
+    return len(results)
+
+
+def _first_rank(db: Session, match_ids: List[int]) -> Optional[int]:
+    """
+    Earliest completion rank of the given matches, as rated before or as
+    completed now (None when none of them is rated or completed).
+    """
+    points = [
+        db.scalar(
+            select(func.min(RatingHistory.sequence)).where(
+                RatingHistory.match_id.in_(match_ids)
+            )
+        ),
+        db.scalar(
+            select(func.min(Match.completion_seq)).where(Match.id.in_(match_ids))
+        ),
+    ]
+    points = [point for point in points if point is not None]
+    return min(points) if points else None
+
+
+def apply_match_rating(db: Session, match_id: int):
+    """
+    Update the ratings after a change to one match, from the point it affects
+    only: its completion rank, or the rank it was rated at before (edited or
+    cancelled result). A newly completed match is the latest one, so only its
+    players are read and written.
+    """
+    sequence = _first_rank(db, [match_id])
+    if sequence is not None:
+        replay_ratings_from(db, sequence)
+
+
+def remove_match_ratings(db: Session, match_ids: List[int]):
+    """
+    Take matches about to be deleted (or to lose a side) out of the ratings,
+    replaying only from the earliest of their completion ranks.
+    """
+    sequence = _first_rank(db, match_ids)
+    if sequence is not None:
+        replay_ratings_from(db, sequence, excluded=match_ids)
+
+
+def replay_ratings_from(
+    db: Session, sequence: int, excluded: Collection[int] = ()
+) -> int:
+    """
+    Roll back the ratings computed from completion rank `sequence` on, then
+    rate the results from that rank again (except the `excluded` matches),
+    in the current transaction. Only the players of those matches are read
+    and written. Returns the number of matches rated.
+    """
+    undone = db.execute(
+        select(RatingHistory.user_id, RatingHistory.rating_before)
+        .where(RatingHistory.sequence >= sequence)
+        .order_by(RatingHistory.sequence, RatingHistory.id)
+    ).all()
+    excluded = set(excluded)
+    results = [
+        result
+        for result in load_results(db, from_sequence=sequence)
+        if result.match_id not in excluded
+    ]
+    user_ids = {row.user_id for row in undone} | {
+        user_id
+        for result in results
+        for side in result.sides
+        for user_id in side.user_ids
+    }
+    current = {
+        rating.user_id: rating
+        for rating in db.scalars(
+            select(PlayerRating).where(PlayerRating.user_id.in_(user_ids))
+        )
+    }
+    ratings = {user_id: rating.rating for user_id, rating in current.items()}
+    played = {user_id: rating.matches_played for user_id, rating in current.items()}
+
+    # Retour au classement d'avant le premier match annulé de chaque joueur
+    rolled_back = set()
+    for row in undone:
+        if row.user_id not in rolled_back:
+            ratings[row.user_id] = row.rating_before
+            rolled_back.add(row.user_id)
+        played[row.user_id] = played.get(row.user_id, 0) - 1
+    db.execute(delete(RatingHistory).where(RatingHistory.sequence >= sequence))
+
+    history, last_match = [], {}
+    for result in results:
+        for user_id, before, after in rate_result(ratings, result):
+            history.append(_history_row(result, user_id, before, after))
+            played[user_id] = played.get(user_id, 0) + 1
+            last_match[user_id] = result.match_id
+    if history:
+        db.execute(insert(RatingHistory), history)
+
+    # Joueurs sans nouveau match : dernier match encore classé
+    stale = [user_id for user_id in rolled_back if user_id not in last_match]
+    for user_id, match_id in db.execute(
+        select(RatingHistory.user_id, RatingHistory.match_id)
+        .where(RatingHistory.user_id.in_(stale))
+        .order_by(RatingHistory.sequence, RatingHistory.id)
+    ):
+        last_match[user_id] = match_id
+
+    now = datetime.now(UTC)
+    for user_id in user_ids:
+        rating = current.get(user_id)
+        if not played.get(user_id):
+            if rating is not None:
+                db.delete(rating)
+            continue
+        if rating is None:
+            rating = PlayerRating(user_id=user_id)
+            db.add(rating)
+        rating.rating = ratings[user_id]
+        rating.matches_played = played[user_id]
+        rating.last_match_id = last_match[user_id]
+        rating.updated_at = now
+    if undone:
+        logger.info(f"Ratings replayed from rank {sequence}: {len(results)} matches.")
+    return len(results)
@@ -0,0 +1,42 @@
+from datetime import UTC, datetime
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer
+from modules.database.session import UsersBase
+
+
+class PlayerRating(UsersBase):
+    __tablename__ = "player_ratings"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    rating = Column(Float, nullable=False)
+    matches_played = Column(Integer, nullable=False, default=0)
+    last_match_id = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+    __table_args__ = (Index("ix_player_rating_rating", "rating"),)
+
+
+class RatingHistory(UsersBase):
+    __tablename__ = "rating_history"
+
+    # Ids croissants dans l'ordre d'achèvement des matchs (rejeu ou ajout)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    match_id = Column(
+        Integer, ForeignKey("matches.id", ondelete="CASCADE"), nullable=False
+    )
+    tournament_id = Column(Integer, nullable=False)
+    played_on = Column(DateTime, nullable=False)  # date du tournoi
+    sequence = Column(Integer, nullable=True)  # completion_seq du match
+    rating_before = Column(Float, nullable=False)
+    rating_after = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_rating_history_user", "user_id", "id"),
+        Index("ix_rating_history_match", "match_id"),
+        Index("ix_rating_history_played", "played_on", "match_id"),
+        Index("ix_rating_history_sequence", "sequence"),
+    )
@@ -0,0 +1,108 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from modules.database.dependencies import get_users_db
+from modules.api.ratings.models import PlayerRating, RatingHistory
+from modules.api.ratings.schemas import (
+    PlayerRatingResponse,
+    RatingHistoryEntry,
+    RatingReplayResponse,
+)
+from modules.api.ratings.functions import replay_ratings
+from modules.api.cache.functions import bump_version, cached_response
+from modules.api.users.functions import get_current_user
+from modules.api.users.models import User
+from modules.api.users.schemas import TokenData
+from utils.fast_json import rows_to_dicts
+from utils.pagination import Page, PageParams, page_params, paginate
+
+ratings_router = APIRouter(prefix="/ratings", tags=["Ratings"])
+
+
+def _ratings_query():
+    return select(
+        PlayerRating.user_id,
+        User.nickname,
+        User.name,
+        PlayerRating.rating,
+        PlayerRating.matches_played,
+    ).join(User, User.id == PlayerRating.user_id)
+
+
+@ratings_router.get("/", response_model=List[PlayerRatingResponse])
+def get_ratings(
+    request: Request,
+    limit: Optional[int] = Query(None, ge=1, description="Top N players only"),
+    db: Session = Depends(get_users_db),
+):
+    return cached_response(
+        request,
+        db,
+        ["results"],
+        List[PlayerRatingResponse],
+        lambda: rows_to_dicts(
+            db.execute(
+                _ratings_query()
+                .order_by(PlayerRating.rating.desc(), PlayerRating.user_id)
+                .limit(limit)
+            )
+        ),
+    )
+
+
+@ratings_router.get("/{user_id}", response_model=PlayerRatingResponse)
+def get_player_rating(user_id: int, db: Session = Depends(get_users_db)):
+    row = db.execute(_ratings_query().where(PlayerRating.user_id == user_id)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="No rating for this user")
+    return PlayerRatingResponse(**row._mapping)
+
+
+@ratings_router.get("/{user_id}/history", response_model=List[RatingHistoryEntry])
+def get_rating_history(
+    user_id: int,
+    request: Request,
+    params: PageParams = Depends(page_params()),
+    db: Session = Depends(get_users_db),
+):
+    params.check_fields(RatingHistoryEntry.model_fields)
+
+    def build() -> Page:
+        page = paginate(
+            db,
+            select(
+                RatingHistory.id,
+                RatingHistory.match_id,
+                RatingHistory.tournament_id,
+                RatingHistory.played_on,
+                RatingHistory.rating_before,
+                RatingHistory.rating_after,
+            ).where(RatingHistory.user_id == user_id),
+            RatingHistory.id,
+            params,
+        )
+        page.items = rows_to_dicts(page.items)
+        return page
+
+    return cached_response(request, db, ["results"], List[RatingHistoryEntry], build)
+
+
+@ratings_router.post("/replay", response_model=RatingReplayResponse)
+def replay_all_ratings(
+    db: Session = Depends(get_users_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    """
+    Recompute all ratings from the match results (after manual data fixes).
+    """
+    if "admin" not in current_user.scopes:
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators only."
+        )
+
+    matches = replay_ratings(db)
+    bump_version(db, "results")
+    db.commit()
+    players = db.scalar(select(func.count()).select_from(PlayerRating))
+    return RatingReplayResponse(matches=matches, players=players)
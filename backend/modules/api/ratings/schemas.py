@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class PlayerRatingResponse(BaseModel):
+    user_id: int
+    nickname: Optional[str] = None
+    name: Optional[str] = None
+    rating: float
+    matches_played: int
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RatingHistoryEntry(BaseModel):
+    id: int
+    match_id: int
+    tournament_id: int
+    played_on: datetime
+    rating_before: float
+    rating_after: float
+    model_config = ConfigDict(from_attributes=True)
+
+
+class RatingReplayResponse(BaseModel):
+    matches: int
+    players: int
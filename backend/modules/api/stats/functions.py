@@ -0,0 +1,383 @@
+from datetime import UTC, datetime
+from typing import Dict, List, Optional, Tuple
+import orjson
+from sqlalchemy import and_, delete, insert, select
+from sqlalchemy.orm import Session, aliased
+from modules.api.stats.models import HeadToHead, PlayerMatch, PlayerStats
+from modules.api.tournaments.models import (
+    Participant,
+    ParticipantMember,
+    TournamentArchive,
+)
+from modules.api.tournaments.results import (
+    MatchResult,
+    Side,
+    load_results,
+    stamp_missing_completions,
+)
+from utils.logger_config import configure_logger
+
+logger = configure_logger()
+
+OUTCOMES = {1.0: "win", 0.0: "loss", 0.5: "draw"}
+
+
+def match_rows(result: MatchResult) -> List[dict]:
+    """
+    History rows of a match, one per player of each side.
+    """
+    rows = []
+    for index, side in enumerate(result.sides):
+        opponent = result.sides[1 - index]
+        outcome = result.outcome if index == 0 else 1 - result.outcome
+        rows += [
+            {
+                "user_id": user_id,
+                "match_id": result.match_id,
+                "tournament_id": result.tournament_id,
+                "played_on": result.played_on,
+                "mode": result.mode,
+                "participant_id": side.participant_id,
+                "opponent_participant_id": opponent.participant_id,
+                "score_for": side.score,
+                "score_against": opponent.score,
+                "result": OUTCOMES[outcome],
+            }
+            for user_id in side.user_ids
+        ]
+    return rows
+
+
+def _increments(row: dict) -> dict:
+    won = int(row["result"] == "win")
+    double = row["mode"] == "double"
+    return {
+        "matches_played": 1,
+        "wins": won,
+        "losses": int(row["result"] == "loss"),
+        "draws": int(row["result"] == "draw"),
+        "manches_for": row["score_for"],
+        "manches_against": row["score_against"],
+        "single_matches": int(not double),
+        "single_wins": won * (not double),
+        "double_matches": int(double),
+        "double_wins": won * double,
+    }
+
+
+def pair_key(user_id: int, other_id: int) -> Tuple[int, int]:
+    """Head-to-head key of two players: (lowest user id, highest user id)."""
+    return (user_id, other_id) if user_id < other_id else (other_id, user_id)
+
+
+def pair_increments(result: MatchResult) -> Dict[Tuple[int, int], dict]:
+    """
+    Head-to-head changes brought by a match, for every pair of opposing
+    players (in doubles, each player meets both opponents).
+    """
+    first, second = result.sides
+    changes = {}
+    for user_id in first.user_ids:
+        for other_id in second.user_ids:
+            if user_id == other_id:
+                continue
+            key = pair_key(user_id, other_id)
+            # Scores et résultat vus du joueur le plus petit id
+            low, high = (first, second) if key[0] == user_id else (second, first)
+            outcome = result.outcome if low is first else 1 - result.outcome
+            changes[key] = {
+                "matches": 1,
+                "low_wins": int(outcome == 1.0),
+                "high_wins": int(outcome == 0.0),
+                "draws": int(outcome == 0.5),
+                "low_manches": low.score,
+                "high_manches": high.score,
+            }
+    return changes
+
+
+def best_finishes(
+    db: Session, user_ids: Optional[List[int]] = None
+) -> Dict[int, Tuple[int, int]]:
+    """
+    Best final rank of each player, as (rank, tournament_id), read from the
+    final standings stored in the archives of finished tournaments.
+    """
+    archives = select(TournamentArchive.tournament_id, TournamentArchive.leaderboard)
+    if user_ids is not None:
+        archives = archives.where(
+            TournamentArchive.tournament_id.in_(
+                select(Participant.tournament_id)
+                .join(
+                    ParticipantMember,
+                    ParticipantMember.participant_id == Participant.id,
+                )
+                .where(ParticipantMember.user_id.in_(user_ids))
+            )
+        )
+    standings = {
+        row.tournament_id: orjson.loads(row.leaderboard)["leaderboard"]
+        for row in db.execute(archives)
+    }
+    participant_ids = {
+        entry["participant_id"] for ranking in standings.values() for entry in ranking
+    }
+    members = {}
+    for participant_id, user_id in db.execute(
+        select(ParticipantMember.participant_id, ParticipantMember.user_id).where(
+            ParticipantMember.participant_id.in_(participant_ids)
+        )
+    ):
+        members.setdefault(participant_id, []).append(user_id)
+
+    best = {}
+    for tournament_id, ranking in sorted(standings.items()):
+        for rank, entry in enumerate(ranking, start=1):
+            for user_id in members.get(entry["participant_id"], []):
+                if user_id not in best or rank < best[user_id][0]:
+                    best[user_id] = (rank, tournament_id)
+    if user_ids is not None:
+        best = {user_id: best[user_id] for user_id in user_ids if user_id in best}
+    return best
+
+
+def rebuild_player_stats(db: Session) -> int:
+    """
+    Recompute every player's aggregates, match history and head-to-head
+    records from the completed matches, in the current transaction: one read
+    query, an in-memory pass, then bulk inserts. Returns the number of players.
+    """
+    stamp_missing_completions(db)
+    history, totals, entered, pairs = [], {}, {}, {}
+    for result in load_results(db):
+        for row in match_rows(result):
+            history.append(row)
+            stats = totals.setdefault(row["user_id"], {})
+            for key, value in _increments(row).items():
+                stats[key] = stats.get(key, 0) + value
+            entered.setdefault(row["user_id"], set()).add(row["tournament_id"])
+        for key, changes in pair_increments(result).items():
+            record = pairs.setdefault(key, {})
+            for column, value in changes.items():
+                record[column] = record.get(column, 0) + value
+            # Matchs parcourus dans l'ordre d'achèvement : le dernier l'emporte
+            record["last_match_id"] = result.match_id
+            record["last_played_on"] = result.played_on
+    finishes = best_finishes(db)
+
+    db.execute(delete(PlayerMatch))
+    db.execute(delete(PlayerStats))
+    db.execute(delete(HeadToHead))
+    if history:
+        db.execute(insert(PlayerMatch), history)
+    if pairs:
+        db.execute(
+            insert(HeadToHead),
+            [
+                {"user_id_low": low, "user_id_high": high, **record}
+                for (low, high), record in pairs.items()
+            ],
+        )
+    if totals:
+        now = datetime.now(UTC)
+        db.execute(
+            insert(PlayerStats),
+            [
+                {
+                    "user_id": user_id,
+                    **stats,
+                    "tournaments_entered": len(entered[user_id]),
+                    "best_finish": finishes.get(user_id, (None, None))[0],
+                    "best_finish_tournament_id": finishes.get(user_id, (None, None))[1],
+                    "updated_at": now,
+                }
+                for user_id, stats in totals.items()
+            ],
+        )
+    logger.info(f"Player stats rebuilt: {len(totals)} players, {len(pairs)} pairs.")
+    return len(totals)
+
+
+def _recorded_result(rows: List[PlayerMatch]) -> MatchResult:
+    """The result of a match as recorded in its history rows."""
+    sides = {}
+    for row in sorted(rows, key=lambda row: (row.participant_id, row.user_id)):
+        side = sides.get(row.participant_id)
+        if side is None:
+            side = sides[row.participant_id] = Side(row.participant_id, row.score_for)
+        side.user_ids.append(row.user_id)
+    first = rows[0]
+    return MatchResult(
+        first.match_id,
+        first.tournament_id,
+        first.played_on,
+        list(sides.values()),
+        mode=first.mode,
+    )
+
+
+def _last_meeting(
+    db: Session, low: int, high: int
+) -> Tuple[Optional[int], Optional[datetime]]:
+    mine, theirs = aliased(PlayerMatch), aliased(PlayerMatch)
+    row = db.execute(
+        select(mine.match_id, mine.played_on)
+        .join(
+            theirs,
+            and_(
+                theirs.match_id == mine.match_id,
+                theirs.participant_id == mine.opponent_participant_id,
+            ),
+        )
+        .where(mine.user_id == low, theirs.user_id == high)
+        .order_by(mine.id.desc())
+        .limit(1)
+    ).first()
+    return (row.match_id, row.played_on) if row else (None, None)
+
+
+def apply_match_stats(db: Session, match_id: int):
+    """
+    Update the aggregates after a change to one match by delta: the result
+    recorded for the match (if any) is subtracted from its players' and pairs'
+    rows, the current one (if completed) is added. History rows of an edited
+    match are updated in place and keep their position.
+    """
+    results = load_results(db, [match_id])
+    _adjust_match_stats(db, match_id, results[0] if results else None)
+
+
+def remove_match_stats(db: Session, match_ids: List[int]):
+    """
+    Subtract matches about to be deleted (or to lose a side) from their
+    players' and pairs' rows, and drop their history rows.
+    """
+    for match_id in match_ids:
+        _adjust_match_stats(db, match_id, None)
+
+
+def _adjust_match_stats(db: Session, match_id: int, new: Optional[MatchResult]):
+    old_rows = list(
+        db.scalars(select(PlayerMatch).where(PlayerMatch.match_id == match_id))
+    )
+    old = _recorded_result(old_rows) if old_rows else None
+    if old is None and new is None:
+        return
+
+    removed = match_rows(old) if old else []
+    added = match_rows(new) if new else []
+    user_ids = {row["user_id"] for row in removed + added}
+    tournament_ids = {row["tournament_id"] for row in removed + added}
+    current = {
+        stats.user_id: stats
+        for stats in db.scalars(
+            select(PlayerStats).where(PlayerStats.user_id.in_(user_ids))
+        )
+    }
+    # Autres matchs des joueurs dans le tournoi : tournoi disputé quoi qu'il arrive
+    elsewhere = set(
+        db.execute(
+            select(PlayerMatch.user_id, PlayerMatch.tournament_id).where(
+                PlayerMatch.user_id.in_(user_ids),
+                PlayerMatch.tournament_id.in_(tournament_ids),
+                PlayerMatch.match_id != match_id,
+            )
+        ).all()
+    )
+    now = datetime.now(UTC)
+    for rows, sign in ((removed, -1), (added, 1)):
+        for row in rows:
+            stats = current.get(row["user_id"])
+            if stats is None:
+                stats = current[row["user_id"]] = PlayerStats(
+                    user_id=row["user_id"],
+                    tournaments_entered=0,
+                    **dict.fromkeys(_increments(row), 0),
+                )
+                db.add(stats)
+            for key, value in _increments(row).items():
+                setattr(stats, key, getattr(stats, key) + sign * value)
+            if (row["user_id"], row["tournament_id"]) not in elsewhere:
+                stats.tournaments_entered += sign
+            stats.updated_at = now
+    for stats in current.values():
+        if stats.matches_played == 0:
+            db.delete(stats)
+
+    recorded = {(row.user_id, row.participant_id): row for row in old_rows}
+    for row in added:
+        record = recorded.pop((row["user_id"], row["participant_id"]), None)
+        if record is None:
+            db.add(PlayerMatch(**row))
+        else:
+            for key, value in row.items():
+                setattr(record, key, value)
+    for record in recorded.values():
+        db.delete(record)
+    db.flush()
+
+    pairs = {}
+    for result, sign in ((old, -1), (new, 1)):
+        if result is None:
+            continue
+        for key, changes in pair_increments(result).items():
+            delta = pairs.setdefault(key, {})
+            for column, value in changes.items():
+                delta[column] = delta.get(column, 0) + sign * value
+    new_pairs = pair_increments(new) if new else {}
+    for (low, high), delta in pairs.items():
+        record = db.get(HeadToHead, (low, high))
+        if record is None:
+            if delta["matches"] <= 0:
+                continue
+            record = HeadToHead(
+                user_id_low=low, user_id_high=high, **dict.fromkeys(delta, 0)
+            )
+            db.add(record)
+        for column, value in delta.items():
+            setattr(record, column, getattr(record, column) + value)
+        if record.matches == 0:
+            db.delete(record)
+        elif (low, high) in new_pairs and (
+            not old_rows or record.last_match_id is None
+        ):
+            # Match tout juste terminé : dernier rang d'achèvement
+            record.last_match_id = new.match_id
+            record.last_played_on = new.played_on
+        elif (low, high) not in new_pairs and record.last_match_id == match_id:
+            record.last_match_id, record.last_played_on = _last_meeting(db, low, high)
+
+
+def refresh_best_finishes(db: Session, tournament_id: int):
+    """
+    Recompute the best finish of the players of a tournament after its archive
+    was written or dropped (final standings changed).
+    """
+    refresh_player_best_finishes(db, tournament_players(db, tournament_id))
+
+
+def tournament_players(db: Session, tournament_id: int) -> List[int]:
+    """Ids of the users who took part in a tournament."""
+    return list(
+        db.scalars(
+            select(ParticipantMember.user_id)
+            .join(Participant, Participant.id == ParticipantMember.participant_id)
+            .where(Participant.tournament_id == tournament_id)
+        )
+    )
+
+
+def refresh_player_best_finishes(db: Session, user_ids: List[int]):
+    """
+    Recompute the best finish of the given players (e.g. the players of a
+    tournament read before it was deleted).
+    """
+    if not user_ids:
+        return
+    finishes = best_finishes(db, user_ids)
+    for stats in db.scalars(
+        select(PlayerStats).where(PlayerStats.user_id.in_(user_ids))
+    ):
+        stats.best_finish, stats.best_finish_tournament_id = finishes.get(
+            stats.user_id, (None, None)
+        )
@@ -0,0 +1,89 @@
+from datetime import UTC, datetime
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
+from modules.database.session import UsersBase
+
+
+class PlayerStats(UsersBase):
+    """
+    Career aggregates of a player, maintained from the completed matches
+    (and from the archived final standings for the best finish).
+    """
+
+    __tablename__ = "player_stats"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    matches_played = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    manches_for = Column(Float, nullable=False, default=0.0)
+    manches_against = Column(Float, nullable=False, default=0.0)
+    single_matches = Column(Integer, nullable=False, default=0)
+    single_wins = Column(Integer, nullable=False, default=0)
+    double_matches = Column(Integer, nullable=False, default=0)
+    double_wins = Column(Integer, nullable=False, default=0)
+    tournaments_entered = Column(Integer, nullable=False, default=0)
+    best_finish = Column(Integer, nullable=True)  # meilleur rang final (1 = vainqueur)
+    best_finish_tournament_id = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, default=lambda: datetime.now(UTC))
+
+
+class PlayerMatch(UsersBase):
+    """
+    One completed match seen from one player, for the paginated match history.
+    """
+
+    __tablename__ = "player_matches"
+
+    # Ids croissants dans l'ordre d'achèvement des matchs (reconstruction ou ajout)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    match_id = Column(
+        Integer, ForeignKey("matches.id", ondelete="CASCADE"), nullable=False
+    )
+    tournament_id = Column(Integer, nullable=False)
+    played_on = Column(DateTime, nullable=False)
+    mode = Column(String, nullable=True)
+    participant_id = Column(Integer, nullable=False)
+    opponent_participant_id = Column(Integer, nullable=False)
+    score_for = Column(Float, nullable=False)
+    score_against = Column(Float, nullable=False)
+    result = Column(String, nullable=False)  # 'win', 'loss' ou 'draw'
+
+    __table_args__ = (
+        Index("ix_player_match_user", "user_id", "id"),
+        Index("ix_player_match_user_tournament", "user_id", "tournament_id"),
+        Index("ix_player_match_match", "match_id"),
+        Index("ix_player_match_played", "played_on", "match_id"),
+    )
+
+
+class HeadToHead(UsersBase):
+    """
+    Record between two players, keyed by the ordered pair (lowest user id
+    first): one primary key lookup per pair.
+    """
+
+    __tablename__ = "head_to_head"
+
+    user_id_low = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id_high = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    matches = Column(Integer, nullable=False, default=0)
+    low_wins = Column(Integer, nullable=False, default=0)
+    high_wins = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    low_manches = Column(Float, nullable=False, default=0.0)
+    high_manches = Column(Float, nullable=False, default=0.0)
+    last_match_id = Column(Integer, nullable=True)
+    last_played_on = Column(DateTime, nullable=True)
+
+    # Rivaux d'un joueur : clé primaire pour user_id_low, index pour user_id_high
+    __table_args__ = (Index("ix_head_to_head_high", "user_id_high"),)
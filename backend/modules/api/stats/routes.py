@@ -0,0 +1,206 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import and_, select, union_all
+from sqlalchemy.orm import Session, aliased
+from modules.database.dependencies import get_users_db
+from modules.api.stats.models import HeadToHead, PlayerMatch, PlayerStats
+from modules.api.stats.schemas import (
+    HeadToHeadResponse,
+    PlayerMatchEntry,
+    PlayerStatsRebuildResponse,
+    PlayerStatsResponse,
+)
+from modules.api.stats.functions import rebuild_player_stats
+from modules.api.cache.functions import bump_version, cached_response
+from modules.api.tournaments.models import Participant, Tournament
+from modules.api.tournaments.routes.leaderboards import participant_display_name
+from modules.api.users.functions import get_current_user
+from modules.api.users.models import User
+from modules.api.users.schemas import TokenData
+from utils.fast_json import rows_to_dicts
+from utils.pagination import Page, PageParams, page_params, paginate
+
+stats_router = APIRouter(prefix="/players", tags=["Players"])
+
+
+def _player_matches_query(user_id: int):
+    return (
+        select(
+            PlayerMatch.id,
+            PlayerMatch.match_id,
+            PlayerMatch.tournament_id,
+            Tournament.name.label("tournament_name"),
+            PlayerMatch.played_on,
+            PlayerMatch.mode,
+            PlayerMatch.opponent_participant_id,
+            participant_display_name().label("opponent_name"),
+            PlayerMatch.score_for,
+            PlayerMatch.score_against,
+            PlayerMatch.result,
+        )
+        .join(Participant, Participant.id == PlayerMatch.opponent_participant_id)
+        .outerjoin(Tournament, Tournament.id == PlayerMatch.tournament_id)
+        .where(PlayerMatch.user_id == user_id)
+    )
+
+
+def _head_to_head_query(user_id: int, opponent_id: Optional[int] = None):
+    """
+    Head-to-head records of a player, seen from the player: the pairs where
+    they hold the lowest id (primary key) and the highest one (index).
+    """
+    halves = []
+    for mine, theirs in (("low", "high"), ("high", "low")):
+        half = select(
+            getattr(HeadToHead, f"user_id_{mine}").label("user_id"),
+            getattr(HeadToHead, f"user_id_{theirs}").label("opponent_id"),
+            HeadToHead.matches,
+            getattr(HeadToHead, f"{mine}_wins").label("wins"),
+            getattr(HeadToHead, f"{theirs}_wins").label("losses"),
+            HeadToHead.draws,
+            getattr(HeadToHead, f"{mine}_manches").label("manches_for"),
+            getattr(HeadToHead, f"{theirs}_manches").label("manches_against"),
+            HeadToHead.last_match_id,
+            HeadToHead.last_played_on,
+        ).where(getattr(HeadToHead, f"user_id_{mine}") == user_id)
+        if opponent_id is not None:
+            half = half.where(getattr(HeadToHead, f"user_id_{theirs}") == opponent_id)
+        halves.append(half)
+    records = union_all(*halves).subquery()
+    return select(
+        records,
+        User.nickname.label("opponent_nickname"),
+        User.name.label("opponent_name"),
+    ).join(User, User.id == records.c.opponent_id)
+
+
+@stats_router.get("/{user_id}/stats", response_model=PlayerStatsResponse)
+def get_player_stats(user_id: int, db: Session = Depends(get_users_db)):
+    row = db.execute(
+        select(PlayerStats, User.nickname, User.name)
+        .join(User, User.id == PlayerStats.user_id)
+        .where(PlayerStats.user_id == user_id)
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="No statistics for this user")
+    stats, nickname, name = row
+    return PlayerStatsResponse.model_validate(stats).model_copy(
+        update={"nickname": nickname, "name": name}
+    )
+
+
+@stats_router.get("/{user_id}/matches", response_model=List[PlayerMatchEntry])
+def get_player_matches(
+    user_id: int,
+    request: Request,
+    params: PageParams = Depends(page_params()),
+    db: Session = Depends(get_users_db),
+):
+    """
+    Match history of a player, oldest first, one keyset page at a time.
+    """
+    params.check_fields(PlayerMatchEntry.model_fields)
+
+    def build() -> Page:
+        page = paginate(db, _player_matches_query(user_id), PlayerMatch.id, params)
+        page.items = rows_to_dicts(page.items)
+        return page
+
+    return cached_response(request, db, ["results"], List[PlayerMatchEntry], build)
+
+
+@stats_router.get("/{user_id}/rivals", response_model=List[HeadToHeadResponse])
+def get_player_rivals(
+    user_id: int,
+    request: Request,
+    limit: int = Query(10, ge=1, le=100, description="Top N opponents"),
+    db: Session = Depends(get_users_db),
+):
+    """
+    Opponents a player met the most, with the record against each of them.
+    """
+
+    def build():
+        query = _head_to_head_query(user_id).subquery()
+        return rows_to_dicts(
+            db.execute(
+                select(query)
+                .order_by(
+                    query.c.matches.desc(),
+                    query.c.last_played_on.desc(),
+                    query.c.opponent_id,
+                )
+                .limit(limit)
+            )
+        )
+
+    return cached_response(request, db, ["results"], List[HeadToHeadResponse], build)
+
+
+@stats_router.get(
+    "/{user_id}/head-to-head/{opponent_id}", response_model=HeadToHeadResponse
+)
+def get_head_to_head(
+    user_id: int, opponent_id: int, db: Session = Depends(get_users_db)
+):
+    row = db.execute(_head_to_head_query(user_id, opponent_id)).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="These players have never met")
+    return HeadToHeadResponse(**row._mapping)
+
+
+@stats_router.get(
+    "/{user_id}/head-to-head/{opponent_id}/matches",
+    response_model=List[PlayerMatchEntry],
+)
+def get_head_to_head_matches(
+    user_id: int,
+    opponent_id: int,
+    request: Request,
+    params: PageParams = Depends(page_params()),
+    db: Session = Depends(get_users_db),
+):
+    """
+    Matches between two players, seen from `user_id`, oldest first.
+    """
+    params.check_fields(PlayerMatchEntry.model_fields)
+    opponent = aliased(PlayerMatch)
+
+    def build() -> Page:
+        page = paginate(
+            db,
+            _player_matches_query(user_id).join(
+                opponent,
+                and_(
+                    opponent.match_id == PlayerMatch.match_id,
+                    opponent.participant_id == PlayerMatch.opponent_participant_id,
+                    opponent.user_id == opponent_id,
+                ),
+            ),
+            PlayerMatch.id,
+            params,
+        )
+        page.items = rows_to_dicts(page.items)
+        return page
+
+    return cached_response(request, db, ["results"], List[PlayerMatchEntry], build)
+
+
+@stats_router.post("/stats/rebuild", response_model=PlayerStatsRebuildResponse)
+def rebuild_all_player_stats(
+    db: Session = Depends(get_users_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    """
+    Recompute every player's statistics and head-to-head records from the
+    match results.
+    """
+    if "admin" not in current_user.scopes:
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators only."
+        )
+
+    players = rebuild_player_stats(db)
+    bump_version(db, "results")
+    db.commit()
+    return PlayerStatsRebuildResponse(players=players)
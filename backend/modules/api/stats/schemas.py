@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+
+class PlayerStatsResponse(BaseModel):
+    user_id: int
+    nickname: Optional[str] = None
+    name: Optional[str] = None
+    matches_played: int
+    wins: int
+    losses: int
+    draws: int
+    manches_for: float
+    manches_against: float
+    single_matches: int
+    single_wins: int
+    double_matches: int
+    double_wins: int
+    tournaments_entered: int
+    best_finish: Optional[int] = None
+    best_finish_tournament_id: Optional[int] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PlayerMatchEntry(BaseModel):
+    id: int
+    match_id: int
+    tournament_id: int
+    tournament_name: Optional[str] = None
+    played_on: datetime
+    mode: Optional[str] = None
+    opponent_participant_id: int
+    opponent_name: str
+    score_for: float
+    score_against: float
+    result: str
+    model_config = ConfigDict(from_attributes=True)
+
+
+class HeadToHeadResponse(BaseModel):
+    """Record between two players, seen from `user_id`."""
+
+    user_id: int
+    opponent_id: int
+    opponent_nickname: Optional[str] = None
+    opponent_name: Optional[str] = None
+    matches: int
+    wins: int
+    losses: int
+    draws: int
+    manches_for: float
+    manches_against: float
+    last_match_id: Optional[int] = None
+    last_played_on: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PlayerStatsRebuildResponse(BaseModel):
+    players: int
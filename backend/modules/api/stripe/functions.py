@@ -0,0 +1,319 @@
+import os
+import time
+from datetime import UTC, datetime
+from typing import List, Optional
+import orjson
+from sqlalchemy import and_, delete, func, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from modules.api.stripe.models import CheckoutSession, StripeEvent
+from modules.api.tournaments.models import (
+    Tournament,
+    TournamentPayment,
+    TournamentRegistration,
+)
+from modules.api.users.models import User
+from modules.api.users.telegram import NotifyPaymentConfirmation, notify_telegram
+from modules.database.session import UsersSessionLocal
+from utils.logger_config import configure_logger
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = configure_logger()
+
+STRIPE_EVENTS_BATCH_SIZE = int(os.getenv("STRIPE_EVENTS_BATCH_SIZE", "100"))
+STRIPE_EVENT_MAX_ATTEMPTS = int(os.getenv("STRIPE_EVENT_MAX_ATTEMPTS", "5"))
+# Balayage des événements restés en attente (worker arrêté, erreur passagère)
+STRIPE_EVENTS_SWEEP_SECONDS = int(os.getenv("STRIPE_EVENTS_SWEEP_SECONDS", "60"))
+
+# Durée de validité des sessions Checkout (Stripe : entre 30 min et 24 h)
+CHECKOUT_SESSION_TTL_MINUTES = int(os.getenv("CHECKOUT_SESSION_TTL_MINUTES", "60"))
+# Session trop proche de son expiration pour être encore proposée
+CHECKOUT_REUSE_MARGIN_SECONDS = int(os.getenv("CHECKOUT_REUSE_MARGIN_SECONDS", "300"))
+
+
+def checkout_expiry() -> int:
+    """Expiry timestamp to give Stripe for a new Checkout Session."""
+    return int(time.time()) + CHECKOUT_SESSION_TTL_MINUTES * 60
+
+
+def reusable_checkout_session(
+    db: Session, user_id: int, tournament_id: int, amount: int
+) -> Optional[CheckoutSession]:
+    """
+    The user's open session for the tournament, if it is for the same amount
+    and not about to expire.
+    """
+    checkout = db.get(CheckoutSession, (user_id, tournament_id))
+    if checkout is None or checkout.amount != amount:
+        return None
+    remaining = checkout.expires_at.replace(tzinfo=UTC) - datetime.now(UTC)
+    if remaining.total_seconds() < CHECKOUT_REUSE_MARGIN_SECONDS:
+        return None
+    return checkout
+
+
+def save_checkout_session(
+    db: Session,
+    user_id: int,
+    tournament_id: int,
+    session_id: str,
+    url: str,
+    amount: int,
+    expires_at: int,
+):
+    """Store (or replace) the user's open session for the tournament."""
+    values = {
+        "session_id": session_id,
+        "url": url,
+        "amount": amount,
+        "expires_at": datetime.fromtimestamp(expires_at, UTC).replace(tzinfo=None),
+        "created_at": datetime.utcnow(),
+    }
+    db.execute(
+        insert(CheckoutSession)
+        .values(user_id=user_id, tournament_id=tournament_id, **values)
+        .on_conflict_do_update(
+            index_elements=[CheckoutSession.user_id, CheckoutSession.tournament_id],
+            set_=values,
+        )
+    )
+
+
+def payment_statuses(db: Session, tournament_id: int) -> list:
+    """
+    Payment status of every registered player of a tournament, from the local
+    tables in one query (no Stripe call).
+    """
+    return db.execute(
+        select(
+            TournamentRegistration.user_id,
+            User.nickname,
+            User.name,
+            func.coalesce(TournamentPayment.paid, False).label("paid"),
+            func.coalesce(CheckoutSession.expires_at > datetime.utcnow(), False).label(
+                "checkout_open"
+            ),
+        )
+        .join(User, User.id == TournamentRegistration.user_id)
+        .outerjoin(
+            TournamentPayment,
+            and_(
+                TournamentPayment.user_id == TournamentRegistration.user_id,
+                TournamentPayment.tournament_id == tournament_id,
+            ),
+        )
+        .outerjoin(
+            CheckoutSession,
+            and_(
+                CheckoutSession.user_id == TournamentRegistration.user_id,
+                CheckoutSession.tournament_id == tournament_id,
+            ),
+        )
+        .where(TournamentRegistration.tournament_id == tournament_id)
+        .order_by(TournamentRegistration.user_id)
+    ).all()
+
+
+def record_stripe_event(db: Session, event) -> bool:
+    """
+    Store a verified webhook event in the inbox, in the current transaction.
+    Returns False when the event id is already there (Stripe retry/replay).
+    """
+    result = db.execute(
+        insert(StripeEvent)
+        .values(
+            id=event["id"],
+            type=event["type"],
+            payload=orjson.dumps(event["data"]["object"]).decode(),
+            received_at=datetime.utcnow(),
+            attempts=0,
+        )
+        .on_conflict_do_nothing(index_elements=[StripeEvent.id])
+    )
+    return result.rowcount == 1
+
+
+def _claim_events(db: Session, batch_size: int) -> list:
+    """
+    Mark a batch of pending events as processed and return them. The UPDATE is
+    the first statement of the transaction: it takes the write lock, so two
+    workers can never claim the same event.
+    """
+    pending = (
+        select(StripeEvent.id)
+        .where(
+            StripeEvent.processed_at.is_(None),
+            StripeEvent.attempts < STRIPE_EVENT_MAX_ATTEMPTS,
+        )
+        .order_by(StripeEvent.received_at)
+        .limit(batch_size)
+    )
+    return db.execute(
+        update(StripeEvent)
+        .where(StripeEvent.id.in_(pending))
+        .values(processed_at=datetime.utcnow(), attempts=StripeEvent.attempts + 1)
+        .returning(StripeEvent.id, StripeEvent.type, StripeEvent.payload)
+    ).all()
+
+
+def process_stripe_events(
+    db: Session, batch_size: int = STRIPE_EVENTS_BATCH_SIZE
+) -> int:
+    """
+    Process one batch of pending inbox events: payments of the completed
+    checkouts are upserted in one statement and the events marked processed
+    in the same transaction, then the Telegram notifications are sent.
+    Returns the number of events claimed. When the batch fails, its events
+    are retried one by one: only a failing event is released with its attempt
+    counted (events give up after STRIPE_EVENT_MAX_ATTEMPTS).
+    """
+    events = _claim_events(db, batch_size)
+    if not events:
+        db.commit()
+        return 0
+
+    try:
+        notifications = _apply_events(db, events)
+        db.commit()
+    except Exception:
+        # Lot relâché : un événement fautif ne doit pas bloquer les autres
+        db.rollback()
+        notifications = []
+        for event in events:
+            notifications += _retry_event(db, event.id)
+
+    # Après validation : une notification par paiement effectivement enregistré
+    if not os.getenv("TEST_MODE") and os.getenv("ENV") != "dev":
+        for notification in notifications:
+            notify_telegram(notification)
+    logger.info(f"Stripe events processed: {len(events)}.")
+    return len(events)
+
+
+def _retry_event(db: Session, event_id: str) -> List[NotifyPaymentConfirmation]:
+    """
+    Claim and apply one event of a failed batch in a transaction of its own.
+    A failure releases this event only (retried on the next pass), with its
+    attempt counted.
+    """
+    events = db.execute(
+        update(StripeEvent)
+        .where(StripeEvent.id == event_id, StripeEvent.processed_at.is_(None))
+        .values(processed_at=datetime.utcnow(), attempts=StripeEvent.attempts + 1)
+        .returning(StripeEvent.id, StripeEvent.type, StripeEvent.payload)
+    ).all()
+    try:
+        notifications = _apply_events(db, events) if events else []
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        db.execute(
+            update(StripeEvent)
+            .where(StripeEvent.id == event_id)
+            .values(attempts=StripeEvent.attempts + 1, last_error=str(e))
+        )
+        db.commit()
+        logger.exception(f"Stripe event {event_id} failed: {e}")
+        return []
+    return notifications
+
+
+def _apply_events(db: Session, events: list) -> List[NotifyPaymentConfirmation]:
+    checkouts = {}
+    for event in events:
+        if event.type != "checkout.session.completed":
+            continue  # Type non géré : acquitté sans traitement
+        session = orjson.loads(event.payload)
+        metadata = session.get("metadata") or {}
+        try:
+            checkouts[event.id] = (
+                int(metadata["user_id"]),
+                int(metadata["tournament_id"]),
+                (session.get("amount_total") or 0) / 100,  # En € (ex: 3.0)
+            )
+        except (KeyError, TypeError, ValueError):
+            _record_error(db, event.id, "Invalid checkout metadata")
+
+    users = {
+        row.id: row.name or row.nickname
+        for row in db.execute(
+            select(User.id, User.name, User.nickname).where(
+                User.id.in_([user_id for user_id, _, _ in checkouts.values()])
+            )
+        )
+    }
+    tournaments = dict(
+        db.execute(
+            select(Tournament.id, Tournament.name).where(
+                Tournament.id.in_([t_id for _, t_id, _ in checkouts.values()])
+            )
+        ).all()
+    )
+
+    payments, notifications = set(), []
+    for event_id, (user_id, tournament_id, amount) in checkouts.items():
+        if user_id not in users or tournament_id not in tournaments:
+            _record_error(db, event_id, "User or tournament not found")
+            continue
+        payments.add((user_id, tournament_id))
+        notifications.append(
+            NotifyPaymentConfirmation(
+                buyer_name=users[user_id],
+                product=tournaments[tournament_id],
+                amount=amount,
+            )
+        )
+
+    if payments:
+        db.execute(
+            insert(TournamentPayment)
+            .values(
+                [
+                    {"user_id": user_id, "tournament_id": tournament_id, "paid": True}
+                    for user_id, tournament_id in payments
+                ]
+            )
+            .on_conflict_do_update(
+                index_elements=[
+                    TournamentPayment.user_id,
+                    TournamentPayment.tournament_id,
+                ],
+                set_={"paid": True},
+            )
+        )
+        # Sessions payées : plus réutilisables
+        db.execute(
+            delete(CheckoutSession).where(
+                tuple_(CheckoutSession.user_id, CheckoutSession.tournament_id).in_(
+                    list(payments)
+                )
+            )
+        )
+    return notifications
+
+
+def _record_error(db: Session, event_id: str, error: str):
+    # Erreur de données : l'événement reste traité, un nouvel essai n'y changerait rien
+    db.execute(
+        update(StripeEvent).where(StripeEvent.id == event_id).values(last_error=error)
+    )
+    logger.warning(f"Stripe event {event_id}: {error}")
+
+
+def process_pending_stripe_events():
+    """
+    Drain the inbox batch after batch with a session of its own (webhook
+    background task and scheduler sweep).
+    """
+    while True:
+        with UsersSessionLocal() as db:
+            try:
+                claimed = process_stripe_events(db)
+            except Exception as e:
+                db.rollback()
+                logger.exception(f"Error processing Stripe events: {e}")
+                return
+        if claimed < STRIPE_EVENTS_BATCH_SIZE:
+            return
@@ -0,0 +1,43 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from modules.database.session import UsersBase
+
+
+class StripeEvent(UsersBase):
+    """
+    Inbox of the Stripe webhook events, keyed by the Stripe event id: an event
+    delivered twice is stored once, and is processed once by the worker.
+    """
+
+    __tablename__ = "stripe_events"
+
+    id = Column(String, primary_key=True)  # id Stripe de l'événement (evt_...)
+    type = Column(String, nullable=False)
+    payload = Column(Text, nullable=False)  # data.object sérialisé en JSON
+    received_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    processed_at = Column(DateTime, nullable=True)  # NULL : en attente
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (Index("ix_stripe_event_pending", "processed_at", "received_at"),)
+
+
+class CheckoutSession(UsersBase):
+    """
+    Open Stripe Checkout Session of a user for a tournament, reused while it
+    is valid instead of creating a new one on every click.
+    """
+
+    __tablename__ = "checkout_sessions"
+
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
+    session_id = Column(String, nullable=False)
+    url = Column(String, nullable=False)
+    amount = Column(Integer, nullable=False)  # montant total facturé, en centimes
+    expires_at = Column(DateTime, nullable=False)  # UTC, expiration côté Stripe
+    created_at = Column(DateTime, default=datetime.utcnow)
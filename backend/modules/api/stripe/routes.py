@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from modules.database.dependencies import get_users_db
@@ -8,17 +8,21 @@ from modules.api.tournaments.models import (
 )
 from modules.api.users.models import User
 from modules.api.users.functions import get_current_user
-from modules.api.users.telegram import notify_telegram, NotifyPaymentConfirmation
-import stripe
+from modules.api.stripe.functions import (
+    checkout_expiry,
+    payment_statuses,
+    process_pending_stripe_events,
+    record_stripe_event,
+    reusable_checkout_session,
+    save_checkout_session,
+)
 import os
 from typing import List
 from modules.api.tournaments.schemas import (
+    PaymentStatusEntry,
     TournamentPaymentResponse,
 )
 
-# Initialise Stripe avec ta clé secrète
-stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
-
 payments_router = APIRouter(prefix="/payments", tags=["Payments"])
 
 
@@ -52,6 +56,17 @@ mois = [
 ]
 
 
+def get_stripe():
+    """
+    Importe le SDK Stripe au premier appel et l'initialise avec la clé secrète.
+    Le SDK n'est ainsi pas chargé au démarrage de l'API.
+    """
+    import stripe
+
+    stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
+    return stripe
+
+
 def require_admin(current_user: User = Depends(get_current_user)):
     if (
         current_user.role != "admin"
@@ -84,6 +99,11 @@ async def pay_for_tournament(
     processing_fees = int(amount * 0.015) + 25  # 0.25€ = 25 centimes
     total_amount = amount + processing_fees
 
+    # Session encore ouverte pour ce tournoi et ce montant : pas de nouvel appel Stripe
+    checkout = reusable_checkout_session(db, user.id, tournament.id, total_amount)
+    if checkout is not None:
+        return {"session_id": checkout.session_id, "url": checkout.url}
+
     # Assumer que tournament.start_date est un objet datetime
     dt = tournament.start_date
 
@@ -96,6 +116,9 @@ async def pay_for_tournament(
 
     formatted_date = f"{jour_semaine} {jour_mois} {nom_mois} {annee} à {heure}"
 
+    stripe = get_stripe()
+    expires_at = checkout_expiry()
+
     try:
         # Crée la Checkout Session
         session = stripe.checkout.Session.create(
@@ -124,78 +147,47 @@ async def pay_for_tournament(
                 "email": user.email,
             },
             customer_email=user.email,  # Prérempli pour user
+            expires_at=expires_at,
         )
-        return {
-            "session_id": session.id,
-            "url": session.url,
-        }  # Renvoie URL pour redirect frontend
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    save_checkout_session(
+        db, user.id, tournament.id, session.id, session.url, total_amount, expires_at
+    )
+    db.commit()
+    return {
+        "session_id": session.id,
+        "url": session.url,
+    }  # Renvoie URL pour redirect frontend
+
 
 @payments_router.post("/tournament_webhook")
-async def tournament_webhook(request: Request, db: Session = Depends(get_users_db)):
+async def tournament_webhook(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_users_db),
+):
     payload = await request.body()  # Corps brut de la requête
     sig_header = request.headers.get("stripe-signature")  # Signature pour vérif
     endpoint_secret = os.getenv("STRIPE_WEBHOOK_SECRET")
+    stripe = get_stripe()
 
     try:
         # Vérifie la signature (sécurité, comme IPN verify)
         event = stripe.Webhook.construct_event(payload, sig_header, endpoint_secret)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid payload")
-    except stripe.error.SignatureVerificationError:
+    except stripe.SignatureVerificationError:
         raise HTTPException(status_code=400, detail="Invalid signature")
 
-    # Gère l'événement
-    if event["type"] == "checkout.session.completed":
-        session = event["data"]["object"]
-        metadata = session["metadata"]
-
-        # Récup infos user/tournoi depuis metadata
-        user_id = int(metadata.get("user_id"))
-        tournament_id = int(metadata.get("tournament_id"))
-        user = db.query(User).filter(User.id == user_id).first()
-        if user:
-            buyer_name = user.name if user.name else user.nickname
-
-        tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-        if not tournament:
-            raise HTTPException(status_code=404, detail="Tournament not found")
-
-        amount = session["amount_total"] / 100  # En € (ex: 3.0)
-        product = tournament.name
-
-        # Mise à jour de la base de données : Créer ou mettre à jour l'entrée TournamentPayment
-        payment = (
-            db.query(TournamentPayment)
-            .filter(
-                TournamentPayment.user_id == user_id,
-                TournamentPayment.tournament_id == tournament_id,
-            )
-            .first()
-        )
-
-        if not payment:
-            payment = TournamentPayment(
-                user_id=user_id, tournament_id=tournament_id, paid=True
-            )
-            db.add(payment)
-        else:
-            payment.paid = True
-
+    # Accusé de réception immédiat : l'événement est traité par le worker
+    # (après la réponse, puis par le balayage du scheduler s'il reste en attente)
+    if record_stripe_event(db, event):
         db.commit()
-
-        # Envoie notification Telegram
-        if not os.getenv("TEST_MODE") and os.getenv("ENV") != "dev":
-            notify_user = NotifyPaymentConfirmation(
-                buyer_name=buyer_name,
-                product=product,
-                amount=amount,
-            )
-            notify_telegram(notify_user)
-
-    return {"status": "success"}
+        background_tasks.add_task(process_pending_stripe_events)
+        return {"status": "success"}
+    return {"status": "duplicate"}
 
 
 @payments_router.get("/check/{tournament_id}", response_model=dict)
@@ -217,6 +209,19 @@ async def check_payment(
     return {"paid": payment.paid}
 
 
+@payments_router.get("/{tournament_id}/status", response_model=List[PaymentStatusEntry])
+async def list_payment_statuses(
+    tournament_id: int,
+    db: Session = Depends(get_users_db),
+    current_user: User = Depends(require_admin),
+):
+    """
+    Payment status of every registered player, read from the local tables in
+    one query instead of one check per player.
+    """
+    return payment_statuses(db, tournament_id)
+
+
 @payments_router.delete("/{tournament_id}/{user_id}")
 async def delete_payment(
     tournament_id: int,
@@ -0,0 +1,112 @@
+from typing import Any, Callable
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+from modules.api.tournaments.models import (
+    Tournament,
+    TournamentArchive,
+    TournamentArchiveResult,
+)
+from modules.api.stats.functions import refresh_best_finishes
+from utils.logger_config import configure_logger
+
+logger = configure_logger()
+
+
+def _dump(content: Any) -> str:
+    return orjson.dumps(TypeAdapter(Any).dump_python(content, mode="json")).decode()
+
+
+def archived_or_build(
+    db: Session,
+    tournament_id: int,
+    document: str,
+    build: Callable[[Session, int], Any],
+) -> Any:
+    """
+    Return a document (`details`, `leaderboard`, `pools_leaderboard`) of a finished
+    tournament from its archive (single-row fetch), or build it from the live tables.
+    """
+    archive = db.get(TournamentArchive, tournament_id)
+    if archive is not None:
+        return orjson.loads(getattr(archive, document))
+    return build(db, tournament_id)
+
+
+def delete_archive(db: Session, tournament_id: int):
+    db.execute(
+        delete(TournamentArchive).where(
+            TournamentArchive.tournament_id == tournament_id
+        )
+    )
+    db.execute(
+        delete(TournamentArchiveResult).where(
+            TournamentArchiveResult.tournament_id == tournament_id
+        )
+    )
+
+
+def snapshot_tournament(db: Session, tournament_id: int):
+    """
+    Write (or rewrite) the archive of a finished tournament in the current
+    transaction: details, final standings, pool standings and per-player
+    season contributions, all computed from the live tables.
+    """
+    # Import local : les builders vivent dans les modules de routes, qui importent ce module
+    from modules.api.tournaments.routes.leaderboards import (
+        build_pools_leaderboard,
+        build_tournament_leaderboard,
+        season_results_query,
+    )
+    from modules.api.tournaments.routes.tournaments import build_tournament_details
+
+    db.flush()
+    tournament = db.get(Tournament, tournament_id)
+    season = tournament.start_date.year
+
+    delete_archive(db, tournament_id)
+    db.add(
+        TournamentArchive(
+            tournament_id=tournament_id,
+            season=season,
+            details=_dump(build_tournament_details(db, tournament_id)),
+            leaderboard=_dump(build_tournament_leaderboard(db, tournament_id)),
+            pools_leaderboard=_dump(build_pools_leaderboard(db, tournament_id)),
+        )
+    )
+    db.add_all(
+        TournamentArchiveResult(
+            tournament_id=tournament_id,
+            user_id=row.user_id,
+            season=season,
+            nickname=row.nickname,
+            name=row.name,
+            total_points=float(row.total_points or 0.0),
+            single_wins=float(row.single_wins or 0.0),
+            double_wins=float(row.double_wins or 0.0),
+            single_manches=float(row.single_manches or 0.0),
+            double_manches=float(row.double_manches or 0.0),
+        )
+        for row in db.execute(season_results_query([tournament_id]))
+    )
+    logger.info(f"Tournament {tournament_id} archived.")
+
+
+def sync_archive(db: Session, tournament_id: int):
+    """
+    Keep the archive in line with the tournament status after a change:
+    snapshot it when it is finished, drop the archive when it is reopened.
+    The players' best finishes follow the archived final standings. A change
+    to a tournament that is not finished and has no archive touches nothing.
+    """
+    tournament = db.get(Tournament, tournament_id)
+    if tournament is not None and tournament.status == "finished":
+        snapshot_tournament(db, tournament_id)
+    elif db.get(TournamentArchive, tournament_id) is not None:
+        delete_archive(db, tournament_id)
+    else:
+        return  # Tournoi en cours : ni archive ni classement final
+    # Classement final modifié : meilleurs résultats des joueurs du tournoi
+    db.flush()
+    refresh_best_finishes(db, tournament_id)
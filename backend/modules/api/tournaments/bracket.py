@@ -0,0 +1,236 @@
+from typing import List, Optional
+from fastapi import HTTPException
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    pool_participant_association,
+    Pool,
+)
+from utils.logger_config import configure_logger
+
+logger = configure_logger()
+
+
+def seed_positions(size: int) -> List[int]:
+    """
+    Standard bracket order of the seeds (1-based) for a power-of-two `size`:
+    seeds 1 and 2 can only meet in the final, 1-4 in the semi-finals, etc.
+    """
+    positions = [1]
+    while len(positions) < size:
+        total = len(positions) * 2 + 1
+        positions = [p for seed in positions for p in (seed, total - seed)]
+    return positions
+
+
+def seeds_from_pools(
+    db: Session, tournament_id: int, qualifiers_per_pool: Optional[int] = None
+) -> List[int]:
+    """
+    Seed the bracket from the pool standings: every pool winner first (best
+    record first), then every runner-up, etc. Pool members without a completed
+    match come last in their pool.
+    """
+    # Import local : le module de routes des classements importe l'archive
+    from modules.api.tournaments.routes.leaderboards import build_pools_leaderboard
+
+    pool_members = {}
+    for row in db.execute(
+        select(
+            pool_participant_association.c.pool_id,
+            pool_participant_association.c.participant_id,
+        )
+        .join(Pool, Pool.id == pool_participant_association.c.pool_id)
+        .where(Pool.tournament_id == tournament_id)
+        .order_by(pool_participant_association.c.participant_id)
+    ):
+        pool_members.setdefault(row.pool_id, []).append(row.participant_id)
+
+    by_rank = {}
+    for pool in build_pools_leaderboard(db, tournament_id):
+        ranked = [
+            (-entry.wins, -(entry.total_manches or 0), entry.participant_id)
+            for entry in pool.leaderboard
+        ]
+        played = {key[2] for key in ranked}
+        ranked += [
+            (0, 0, p_id)
+            for p_id in pool_members.get(pool.pool_id, [])
+            if p_id not in played
+        ]
+        for rank, key in enumerate(ranked[:qualifiers_per_pool]):
+            by_rank.setdefault(rank, []).append(key)
+
+    if not by_rank:
+        # Pas de poules : tous les participants, par ordre d'inscription
+        return list(
+            db.scalars(
+                select(Participant.id)
+                .where(Participant.tournament_id == tournament_id)
+                .order_by(Participant.id)
+            )
+        )
+    return [key[2] for rank in sorted(by_rank) for key in sorted(by_rank[rank])]
+
+
+def generate_bracket(db: Session, tournament_id: int, seeds: List[int]) -> int:
+    """
+    Create the whole knockout tree of a tournament in the current transaction
+    and return its size (power of two).
+
+    Every match stores the match its winner goes to (`next_match_id`, `next_slot`),
+    rounds are numbered from 1 (first round) to the final. Missing seeds are
+    byes: the top seeds are placed directly in the second round.
+    """
+    if len(seeds) < 2:
+        raise HTTPException(
+            status_code=400, detail="At least two participants are required"
+        )
+    if len(set(seeds)) != len(seeds):
+        raise HTTPException(status_code=400, detail="Duplicate participant in seeding")
+    known = set(
+        db.scalars(
+            select(Participant.id).where(
+                Participant.tournament_id == tournament_id, Participant.id.in_(seeds)
+            )
+        )
+    )
+    missing = [p_id for p_id in seeds if p_id not in known]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Participant {missing[0]} not found"
+        )
+    # Un tableau se reconnaît à ses liens : un match créé à la main (sans suivant)
+    # n'empêche pas la génération
+    already = db.scalar(
+        select(Match.id)
+        .where(Match.tournament_id == tournament_id, Match.next_match_id.is_not(None))
+        .limit(1)
+    )
+    if already is not None:
+        raise HTTPException(status_code=400, detail="Bracket already generated")
+
+    size = 2
+    while size < len(seeds):
+        size *= 2
+    rounds = size.bit_length() - 1
+
+    # De la finale vers le 2e tour : chaque match connaît déjà son suivant
+    following = [None]
+    for round_number in range(rounds, 1, -1):
+        matches = [
+            _bracket_match(tournament_id, round_number, following, i)
+            for i in range(2 ** (rounds - round_number))
+        ]
+        db.add_all(matches)
+        db.flush()
+        following = matches
+
+    # Premier tour : un adversaire absent est une exemption, la tête de série
+    # est placée directement dans le match suivant
+    positions = seed_positions(size)
+    first_round, players = [], []
+    for i in range(size // 2):
+        entrants = [
+            seeds[seed - 1]
+            for seed in positions[2 * i : 2 * i + 2]
+            if seed <= len(seeds)
+        ]
+        if len(entrants) == 1:
+            players.append(
+                MatchPlayer(
+                    match_id=following[i // 2].id,
+                    participant_id=entrants[0],
+                    slot=i % 2,
+                )
+            )
+        else:
+            first_round.append(
+                (_bracket_match(tournament_id, 1, following, i), entrants)
+            )
+    db.add_all(match for match, _ in first_round)
+    db.flush()
+    players += [
+        MatchPlayer(match_id=match.id, participant_id=p_id, slot=slot)
+        for match, entrants in first_round
+        for slot, p_id in enumerate(entrants)
+    ]
+    db.add_all(players)
+    logger.info(
+        f"Bracket of {size} generated for tournament {tournament_id} "
+        f"({size - len(seeds)} bye(s))."
+    )
+    return size
+
+
+def _bracket_match(tournament_id: int, round_number: int, following: list, i: int):
+    next_match = following[i // 2]
+    return Match(
+        tournament_id=tournament_id,
+        status="pending",
+        round=round_number,
+        next_match_id=next_match.id if next_match else None,
+        next_slot=i % 2 if next_match else None,
+    )
+
+
+def match_winner(db: Session, match: Match) -> Optional[int]:
+    """
+    Participant who won a completed two-player match, None if it is not
+    completed or the scores do not designate a winner.
+    """
+    if match.status != "completed":
+        return None
+    scores = db.execute(
+        select(MatchPlayer.participant_id, MatchPlayer.score).where(
+            MatchPlayer.match_id == match.id
+        )
+    ).all()
+    if len(scores) != 2 or any(row.score is None for row in scores):
+        return None
+    (first, first_score), (second, second_score) = scores
+    if first_score == second_score:
+        return None
+    return first if first_score > second_score else second
+
+
+def advance_winner(db: Session, match: Match):
+    """
+    Propagate the result of a bracket match to its next match: the side
+    `next_slot` of the next match is replaced by the current winner, whatever
+    the order in which the feeding matches finish. One delete and one insert,
+    whatever the bracket size.
+    """
+    if match.next_match_id is None:
+        return
+    db.flush()  # scores modifiés par l'appelant (session sans autoflush)
+    next_match = db.get(Match, match.next_match_id)
+    if next_match.status == "completed":
+        raise HTTPException(
+            status_code=400,
+            detail="The next match is already completed, cancel it first",
+        )
+
+    winner = match_winner(db, match)
+    entrants = select(MatchPlayer.participant_id).where(
+        MatchPlayer.match_id == match.id
+    )
+    # Place du vainqueur, et ancien qualifié de ce match (places non renseignées)
+    db.execute(
+        delete(MatchPlayer).where(
+            MatchPlayer.match_id == next_match.id,
+            or_(
+                MatchPlayer.slot == match.next_slot,
+                MatchPlayer.participant_id.in_(entrants),
+            ),
+        )
+    )
+    if winner is not None:
+        db.add(
+            MatchPlayer(
+                match_id=next_match.id, participant_id=winner, slot=match.next_slot
+            )
+        )
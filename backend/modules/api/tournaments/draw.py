@@ -0,0 +1,225 @@
+import os
+import unicodedata
+from typing import Dict, List, Optional, Set
+import orjson
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from modules.api.licences.models import Licence
+from modules.api.tournaments.models import (
+    Participant,
+    ParticipantMember,
+    Pool,
+    Tournament,
+    pool_participant_association,
+)
+from modules.api.users.models import User
+from modules.api.official_leaderboards import cmer, lsef
+
+# Classements officiels importés (PDF convertis en JSON par les routes LSEF / CMER)
+OFFICIAL_RANKINGS = {"lsef": lsef.JSON_PATH, "cmer": cmer.JSON_PATH}
+
+
+def normalize_name(name: str) -> str:
+    """
+    Comparable form of a person's name: no accents, no case, words sorted
+    ("DUPONT Jean" and "jean dupont" match).
+    """
+    text = unicodedata.normalize("NFKD", name or "")
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return " ".join(sorted(text.casefold().replace("-", " ").split()))
+
+
+def _parse_points(value: str) -> float:
+    try:
+        return float(str(value).replace(",", ".").strip() or 0)
+    except ValueError:
+        return 0.0
+
+
+def user_ratings(
+    db: Session,
+    tournament: Tournament,
+    user_ids: Set[int],
+    source: str,
+    category: Optional[str] = None,
+) -> Dict[int, float]:
+    """
+    Rating of each user: season points (year of the tournament), or points in
+    the imported LSEF / CMER ranking, matched on the user's name or licence
+    name. Unranked users are absent.
+    """
+    if source == "season":
+        # Import local : le module de routes des classements importe l'archive
+        from modules.api.tournaments.routes.leaderboards import (
+            build_season_leaderboard,
+        )
+
+        season = build_season_leaderboard(db, tournament.start_date.year)
+        return {
+            entry.user_id: entry.total_points
+            for entry in season.leaderboard
+            if entry.user_id in user_ids
+        }
+
+    path = OFFICIAL_RANKINGS[source]
+    if not os.path.exists(path):
+        raise HTTPException(
+            status_code=404, detail=f"{source.upper()} leaderboard not found"
+        )
+    with open(path, "rb") as f:
+        ranking = orjson.loads(f.read())["leaderboard"]
+
+    points = {}
+    for block in ranking:
+        if category and block["category"] != category:
+            continue
+        for entry in block["entries"]:
+            key = normalize_name(entry["joueur"])
+            points[key] = max(points.get(key, 0.0), _parse_points(entry["pts"]))
+
+    names = db.execute(
+        select(User.id, User.name, Licence.name.label("first"), Licence.surname)
+        .outerjoin(Licence, Licence.user_id == User.id)
+        .where(User.id.in_(user_ids))
+    )
+    ratings = {}
+    for row in names:
+        for name in (f"{row.first or ''} {row.surname or ''}", row.name):
+            rating = points.get(normalize_name(name))
+            if rating is not None:
+                ratings[row.id] = max(ratings.get(row.id, 0.0), rating)
+    return ratings
+
+
+def snake_draw(
+    ranked: List[int], pool_count: int, clubs: Dict[int, Set[str]]
+) -> List[List[int]]:
+    """
+    Split participants (best first) into `pool_count` pools by snake seeding:
+    each row of `pool_count` participants goes left to right, then right to
+    left. Within a row, a participant skips a pool already holding someone of
+    the same club when another pool of the row is free of it.
+    """
+    pools = [[] for _ in range(pool_count)]
+    pool_clubs = [set() for _ in range(pool_count)]
+    for start in range(0, len(ranked), pool_count):
+        row = ranked[start : start + pool_count]
+        order = list(range(pool_count))
+        if (start // pool_count) % 2:
+            order.reverse()
+        for participant_id in row:
+            own = clubs.get(participant_id, set())
+            index = next((i for i in order if not own & pool_clubs[i]), order[0])
+            order.remove(index)
+            pools[index].append(participant_id)
+            pool_clubs[index] |= own
+    return pools
+
+
+def draw_pools(
+    db: Session,
+    tournament_id: int,
+    pool_count: int,
+    source: str = "season",
+    category: Optional[str] = None,
+    separate_clubs: bool = True,
+) -> List[List[dict]]:
+    """
+    Compute a balanced pool draw for every participant of a tournament, in memory:
+    participants with their members, clubs and ratings are each loaded in bulk,
+    then placed in a single pass of snake seeding. Nothing is written.
+    """
+    tournament = db.get(Tournament, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    rows = db.execute(
+        select(
+            Participant.id, Participant.name, ParticipantMember.user_id, User.nickname
+        )
+        .outerjoin(
+            ParticipantMember, ParticipantMember.participant_id == Participant.id
+        )
+        .outerjoin(User, User.id == ParticipantMember.user_id)
+        .where(Participant.tournament_id == tournament_id)
+        .order_by(Participant.id)
+    ).all()
+    members, names = {}, {}
+    for row in rows:
+        members.setdefault(row.id, [])
+        if row.user_id is not None:
+            members[row.id].append(row.user_id)
+        names.setdefault(row.id, row.name or row.nickname or "Inconnu")
+    if len(members) < pool_count:
+        raise HTTPException(
+            status_code=400, detail="Not enough participants for this number of pools"
+        )
+
+    user_ids = {user_id for ids in members.values() for user_id in ids}
+    user_clubs = {}
+    if separate_clubs:
+        for user_id, club in db.execute(
+            select(Licence.user_id, Licence.club_name).where(
+                Licence.user_id.in_(user_ids)
+            )
+        ):
+            user_clubs.setdefault(user_id, set()).add(club)
+    ratings = user_ratings(db, tournament, user_ids, source, category)
+
+    # Équipe : somme des points de ses membres ; égalité départagée par l'id
+    participant_ratings = {
+        p_id: sum(ratings.get(user_id, 0.0) for user_id in ids)
+        for p_id, ids in members.items()
+    }
+    clubs = {
+        p_id: set().union(*(user_clubs.get(user_id, set()) for user_id in ids))
+        for p_id, ids in members.items()
+    }
+    ranked = sorted(members, key=lambda p_id: (-participant_ratings[p_id], p_id))
+
+    return [
+        [
+            {
+                "id": p_id,
+                "name": names[p_id],
+                "rating": participant_ratings[p_id],
+                "clubs": sorted(clubs[p_id]),
+            }
+            for p_id in pool
+        ]
+        for pool in snake_draw(ranked, pool_count, clubs)
+    ]
+
+
+def pool_name(index: int) -> str:
+    return f"Poule {chr(ord('A') + index)}" if index < 26 else f"Poule {index + 1}"
+
+
+def save_draw(db: Session, tournament_id: int, draw: List[List[dict]]) -> List[int]:
+    """
+    Create the drawn pools and their memberships in bulk (one insert per table),
+    in the current transaction. Returns the pool ids.
+    """
+    existing = db.scalar(
+        select(Pool.id).where(Pool.tournament_id == tournament_id).limit(1)
+    )
+    if existing is not None:
+        raise HTTPException(
+            status_code=400, detail="Pools already exist, reset the tournament first"
+        )
+
+    pools = [
+        Pool(tournament_id=tournament_id, name=pool_name(i)) for i in range(len(draw))
+    ]
+    db.add_all(pools)
+    db.flush()
+    db.execute(
+        pool_participant_association.insert(),
+        [
+            {"pool_id": pool.id, "participant_id": participant["id"]}
+            for pool, participants in zip(pools, draw)
+            for participant in participants
+        ],
+    )
+    return [pool.id for pool in pools]
@@ -0,0 +1,86 @@
+from sqlalchemy import Float, Integer, String, func, select
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Pool,
+    Tournament,
+    TournamentRegistration,
+)
+from modules.api.tournaments.routes.leaderboards import participant_display_name
+from modules.api.users.models import User
+
+# Colonnes de l'export du classement de saison (calculé en mémoire)
+SEASON_COLUMNS = [
+    ("user_id", Integer()),
+    ("nickname", String()),
+    ("name", String()),
+    ("total_points", Float()),
+    ("single_wins", Float()),
+    ("double_wins", Float()),
+    ("single_manches", Float()),
+    ("double_manches", Float()),
+]
+
+
+def season_tournament_ids(season: int):
+    return select(Tournament.id).where(
+        func.extract("year", Tournament.start_date) == season
+    )
+
+
+def registrations_export_query(tournament_id: int):
+    """
+    Registrations of a tournament with the participant each player plays in.
+    """
+    membership = (
+        select(
+            ParticipantMember.user_id,
+            Participant.id.label("participant_id"),
+            Participant.name.label("participant_name"),
+        )
+        .join(Participant, ParticipantMember.participant_id == Participant.id)
+        .where(Participant.tournament_id == tournament_id)
+        .subquery()
+    )
+    return (
+        select(
+            TournamentRegistration.id.label("registration_id"),
+            TournamentRegistration.user_id,
+            User.nickname,
+            User.name,
+            TournamentRegistration.registration_date,
+            membership.c.participant_id,
+            membership.c.participant_name,
+        )
+        .join(User, User.id == TournamentRegistration.user_id)
+        .outerjoin(membership, membership.c.user_id == TournamentRegistration.user_id)
+        .where(TournamentRegistration.tournament_id == tournament_id)
+        .order_by(TournamentRegistration.id)
+    )
+
+
+def match_log_query(tournament_ids):
+    """
+    One row per match side (score of each participant) for the matches of
+    the given tournaments (ids or a subquery of ids), in match order.
+    """
+    return (
+        select(
+            Match.tournament_id,
+            Match.id.label("match_id"),
+            Match.pool_id,
+            Pool.name.label("pool_name"),
+            Match.round,
+            Match.status,
+            MatchPlayer.participant_id,
+            participant_display_name().label("participant_name"),
+            MatchPlayer.score,
+        )
+        .join(MatchPlayer, MatchPlayer.match_id == Match.id)
+        .join(Participant, Participant.id == MatchPlayer.participant_id)
+        .outerjoin(Pool, Pool.id == Match.pool_id)
+        .where(Match.tournament_id.in_(tournament_ids))
+        .order_by(Match.id, MatchPlayer.participant_id)
+    )
@@ -0,0 +1,194 @@
+from datetime import UTC, datetime
+from typing import List
+from fastapi import HTTPException
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.orm import Session
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Pool,
+    Tournament,
+    TournamentPayment,
+    TournamentRegistration,
+    pool_participant_association,
+)
+from modules.api.tournaments.schemas import SwapPlayersRequest, SwapPlayersResult
+from modules.api.users.models import User
+
+
+def _count(*where):
+    return select(func.count()).where(*where).scalar_subquery()
+
+
+def tournament_row_counts(db: Session, tournament_id: int) -> dict:
+    """
+    Count the rows attached to a tournament (removed by ON DELETE CASCADE when it
+    is deleted), in a single SELECT of scalar subqueries.
+    """
+    participant_ids = select(Participant.id).where(
+        Participant.tournament_id == tournament_id
+    )
+    pool_ids = select(Pool.id).where(Pool.tournament_id == tournament_id)
+    match_ids = select(Match.id).where(Match.tournament_id == tournament_id)
+    row = db.execute(
+        select(
+            _count(TournamentRegistration.tournament_id == tournament_id).label(
+                "registrations"
+            ),
+            _count(Participant.tournament_id == tournament_id).label("participants"),
+            _count(ParticipantMember.participant_id.in_(participant_ids)).label(
+                "participant_members"
+            ),
+            _count(Pool.tournament_id == tournament_id).label("pools"),
+            _count(pool_participant_association.c.pool_id.in_(pool_ids)).label(
+                "pool_participants"
+            ),
+            _count(Match.tournament_id == tournament_id).label("matches"),
+            _count(MatchPlayer.match_id.in_(match_ids)).label("match_players"),
+            _count(TournamentPayment.tournament_id == tournament_id).label("payments"),
+        )
+    ).one()
+    return dict(row._mapping)
+
+
+def participant_row_counts(db: Session, participant_id: int) -> dict:
+    """
+    Same as `tournament_row_counts` for a single participant.
+    """
+    row = db.execute(
+        select(
+            _count(ParticipantMember.participant_id == participant_id).label(
+                "participant_members"
+            ),
+            _count(
+                pool_participant_association.c.participant_id == participant_id
+            ).label("pool_participants"),
+            _count(MatchPlayer.participant_id == participant_id).label("match_players"),
+        )
+    ).one()
+    return {"participants": 1, **row._mapping}
+
+
+def apply_player_swaps(
+    db: Session, tournament_id: int, swaps: List[SwapPlayersRequest]
+) -> List[SwapPlayersResult]:
+    """
+    Give the participants of a finished single-mode tournament to the correct
+    users, in the current transaction.
+
+    The participant rows are kept: only their member and the registrations are
+    re-pointed, so scores (match_players) and pool assignments stay in place.
+    All swaps are validated first and applied with a fixed number of statements.
+    """
+    tournament = db.get(Tournament, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    if tournament.status != "finished":
+        raise HTTPException(
+            status_code=400, detail="Only applicable to finished tournaments"
+        )
+    if tournament.mode != "single":
+        raise HTTPException(
+            status_code=400, detail="Only supported for single-player mode"
+        )
+
+    wrong_ids = [swap.wrong_participant_id for swap in swaps]
+    correct_ids = [swap.correct_user_id for swap in swaps]
+    if len(set(wrong_ids)) != len(wrong_ids) or len(set(correct_ids)) != len(
+        correct_ids
+    ):
+        raise HTTPException(
+            status_code=400, detail="Each participant and user can be swapped once"
+        )
+
+    rows = db.execute(
+        select(Participant.id, ParticipantMember.user_id)
+        .outerjoin(
+            ParticipantMember, ParticipantMember.participant_id == Participant.id
+        )
+        .where(
+            Participant.tournament_id == tournament_id, Participant.id.in_(wrong_ids)
+        )
+    ).all()
+    wrong_users = {row.id: row.user_id for row in rows}
+    missing = [p_id for p_id in wrong_ids if p_id not in wrong_users]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Wrong participant not found: {missing[0]}"
+        )
+    no_member = [p_id for p_id in wrong_ids if wrong_users[p_id] is None]
+    if no_member:
+        raise HTTPException(
+            status_code=400,
+            detail=f"No member found for wrong participant {no_member[0]}",
+        )
+
+    known_users = set(db.scalars(select(User.id).where(User.id.in_(correct_ids))))
+    missing = [u_id for u_id in correct_ids if u_id not in known_users]
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Correct user not found: {missing[0]}"
+        )
+
+    # Un participant qui change de joueur dans ce même lot libère son joueur
+    already_playing = db.scalars(
+        select(ParticipantMember.user_id)
+        .join(Participant, ParticipantMember.participant_id == Participant.id)
+        .where(
+            Participant.tournament_id == tournament_id,
+            ParticipantMember.user_id.in_(correct_ids),
+            Participant.id.not_in(wrong_ids),
+        )
+    ).first()
+    if already_playing is not None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"User {already_playing} already has a participant in this tournament",
+        )
+
+    db.execute(
+        update(ParticipantMember)
+        .where(ParticipantMember.participant_id.in_(wrong_ids))
+        .values(
+            user_id=case(
+                {swap.wrong_participant_id: swap.correct_user_id for swap in swaps},
+                value=ParticipantMember.participant_id,
+            )
+        )
+    )
+
+    released = set(wrong_users.values()) - set(correct_ids)
+    db.execute(
+        delete(TournamentRegistration).where(
+            TournamentRegistration.tournament_id == tournament_id,
+            TournamentRegistration.user_id.in_(released),
+        )
+    )
+    registered = set(
+        db.scalars(
+            select(TournamentRegistration.user_id).where(
+                TournamentRegistration.tournament_id == tournament_id,
+                TournamentRegistration.user_id.in_(correct_ids),
+            )
+        )
+    )
+    db.add_all(
+        TournamentRegistration(
+            user_id=user_id,
+            tournament_id=tournament_id,
+            registration_date=datetime.now(UTC),
+        )
+        for user_id in correct_ids
+        if user_id not in registered
+    )
+
+    return [
+        SwapPlayersResult(
+            wrong_participant_id=swap.wrong_participant_id,
+            wrong_user_id=wrong_users[swap.wrong_participant_id],
+            correct_user_id=swap.correct_user_id,
+        )
+        for swap in swaps
+    ]
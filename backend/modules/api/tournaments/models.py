@@ -8,6 +8,7 @@ from sqlalchemy import (
     Float,
     Table,
     Index,
+    Text,
 )
 from sqlalchemy.orm import relationship
 from modules.database.session import UsersBase
@@ -17,8 +18,16 @@ from datetime import datetime
 pool_participant_association = Table(
     "pool_participant_association",
     UsersBase.metadata,
-    Column("pool_id", Integer, ForeignKey("pools.id"), primary_key=True),
-    Column("participant_id", Integer, ForeignKey("participants.id"), primary_key=True),
+    Column(
+        "pool_id", Integer, ForeignKey("pools.id", ondelete="CASCADE"), primary_key=True
+    ),
+    Column(
+        "participant_id",
+        Integer,
+        ForeignKey("participants.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Index("ix_pool_participant_participant", "participant_id"),
 )
 
 
@@ -26,14 +35,19 @@ class Participant(UsersBase):
     __tablename__ = "participants"
 
     id = Column(Integer, primary_key=True, index=True)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False
+    )
     name = Column(
         String, nullable=True
     )  # Nom du participant (vide pour singles, custom pour doubles)
 
     tournament = relationship("Tournament", back_populates="participants")
     members = relationship(
-        "ParticipantMember", back_populates="participant", cascade="all, delete-orphan"
+        "ParticipantMember",
+        back_populates="participant",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )  # Renommé de team_members
     pools = relationship(
         "Pool", secondary=pool_participant_association, back_populates="participants"
@@ -50,16 +64,22 @@ class Participant(UsersBase):
         overlaps="matches",
     )
 
+    __table_args__ = (Index("ix_participant_tournament", "tournament_id"),)
+
 
 class ParticipantMember(UsersBase):
     __tablename__ = "participant_members"
 
-    participant_id = Column(Integer, ForeignKey("participants.id"), primary_key=True)
+    participant_id = Column(
+        Integer, ForeignKey("participants.id", ondelete="CASCADE"), primary_key=True
+    )
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
 
     participant = relationship("Participant", back_populates="members")
     user = relationship("User", back_populates="participant_memberships")
 
+    __table_args__ = (Index("ix_participant_member_user", "user_id", "participant_id"),)
+
 
 class Tournament(UsersBase):
     __tablename__ = "tournaments"
@@ -75,19 +95,39 @@ class Tournament(UsersBase):
         String, default="open", index=True
     )  # 'open', 'running', 'finished', 'closed'
 
+    # Suppressions en cascade assurées par la base (ON DELETE CASCADE)
     registrations = relationship(
         "TournamentRegistration",
         back_populates="tournament",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     matches = relationship(
-        "Match", back_populates="tournament", cascade="all, delete-orphan"
+        "Match",
+        back_populates="tournament",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     pools = relationship(
-        "Pool", back_populates="tournament", cascade="all, delete-orphan"
+        "Pool",
+        back_populates="tournament",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     participants = relationship(
-        "Participant", back_populates="tournament", cascade="all, delete-orphan"
+        "Participant",
+        back_populates="tournament",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    archive = relationship(
+        "TournamentArchive",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    archive_results = relationship(
+        "TournamentArchiveResult", cascade="all, delete-orphan", passive_deletes=True
     )
 
     __table_args__ = (Index("ix_tournament_mode_status", "mode", "status"),)
@@ -98,17 +138,28 @@ class TournamentRegistration(UsersBase):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False
+    )
     registration_date = Column(DateTime, default=datetime.utcnow)
 
     user = relationship("User", back_populates="tournaments")
     tournament = relationship("Tournament", back_populates="registrations")
 
+    # Un utilisateur ne peut être inscrit qu'une fois à un tournoi
+    __table_args__ = (
+        Index(
+            "ux_registration_tournament_user", "tournament_id", "user_id", unique=True
+        ),
+    )
+
 
 class Pool(UsersBase):
     __tablename__ = "pools"
     id = Column(Integer, primary_key=True, autoincrement=True)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False
+    )
     name = Column(String, nullable=True)
 
     tournament = relationship("Tournament", back_populates="pools")
@@ -117,17 +168,29 @@ class Pool(UsersBase):
     )
     matches = relationship("Match", back_populates="pool")
 
+    __table_args__ = (Index("ix_pool_tournament", "tournament_id"),)
+
 
 class Match(UsersBase):
     __tablename__ = "matches"
 
     id = Column(Integer, primary_key=True, index=True)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id"), nullable=False)
-    pool_id = Column(Integer, ForeignKey("pools.id"), nullable=True)
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), nullable=False
+    )
+    pool_id = Column(Integer, ForeignKey("pools.id", ondelete="CASCADE"), nullable=True)
     status = Column(
         String, default="pending", index=True
     )  # pending, completed, cancelled
     round = Column(Integer, default=1)
+    # Tableau à élimination : match où le vainqueur est qualifié, et sa place (0 ou 1)
+    next_match_id = Column(
+        Integer, ForeignKey("matches.id", ondelete="SET NULL"), nullable=True
+    )
+    next_slot = Column(Integer, nullable=True)
+    # Rang d'achèvement (croissant, toutes compétitions) : ordre des classements Elo
+    # et des historiques ; NULL tant que le match n'est pas terminé
+    completion_seq = Column(Integer, nullable=True)
 
     tournament = relationship("Tournament", back_populates="matches")
     pool = relationship("Pool", back_populates="matches")
@@ -141,18 +204,30 @@ class Match(UsersBase):
         "MatchPlayer",
         back_populates="match",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         overlaps="participants",
     )
 
-    __table_args__ = (Index("ix_match_status", "status"),)
+    __table_args__ = (
+        Index("ix_match_status", "status"),
+        Index("ix_match_tournament_pool", "tournament_id", "pool_id"),
+        Index("ix_match_pool_status", "pool_id", "status"),
+        Index("ix_match_completion_seq", "completion_seq"),
+    )
 
 
 class MatchPlayer(UsersBase):
     __tablename__ = "match_players"
 
-    match_id = Column(Integer, ForeignKey("matches.id"), primary_key=True)
-    participant_id = Column(Integer, ForeignKey("participants.id"), primary_key=True)
+    match_id = Column(
+        Integer, ForeignKey("matches.id", ondelete="CASCADE"), primary_key=True
+    )
+    participant_id = Column(
+        Integer, ForeignKey("participants.id", ondelete="CASCADE"), primary_key=True
+    )
     score = Column(Float, nullable=True)  # Score ou points attribués dans le match
+    # Tableau à élimination : côté occupé dans le match (0 ou 1), NULL en poule
+    slot = Column(Integer, nullable=True)
 
     match = relationship(
         "Match",
@@ -165,10 +240,58 @@ class MatchPlayer(UsersBase):
         overlaps="matches,participants",
     )
 
+    # Couvrant pour l'historique / les classements d'un participant
+    __table_args__ = (
+        Index("ix_match_player_participant", "participant_id", "match_id", "score"),
+    )
+
 
 class TournamentPayment(UsersBase):
     __tablename__ = "tournament_payments"
 
     user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
-    tournament_id = Column(Integer, ForeignKey("tournaments.id"), primary_key=True)
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
     paid = Column(Boolean, default=False)
+
+
+class TournamentArchive(UsersBase):
+    """
+    Immutable snapshot of a finished tournament, served instead of re-joining
+    participants, pools and matches (documents stored as serialized JSON).
+    """
+
+    __tablename__ = "tournament_archives"
+
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
+    season = Column(Integer, nullable=False, index=True)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+    details = Column(Text, nullable=False)
+    leaderboard = Column(Text, nullable=False)
+    pools_leaderboard = Column(Text, nullable=False)
+
+
+class TournamentArchiveResult(UsersBase):
+    """
+    Contribution of a player to the season leaderboard for an archived tournament.
+    """
+
+    __tablename__ = "tournament_archive_results"
+
+    tournament_id = Column(
+        Integer, ForeignKey("tournaments.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    season = Column(Integer, nullable=False)
+    nickname = Column(String, nullable=False)
+    name = Column(String, nullable=True)
+    total_points = Column(Float, default=0.0)
+    single_wins = Column(Float, default=0.0)
+    double_wins = Column(Float, default=0.0)
+    single_manches = Column(Float, default=0.0)
+    double_manches = Column(Float, default=0.0)
+
+    __table_args__ = (Index("ix_archive_result_season_user", "season", "user_id"),)
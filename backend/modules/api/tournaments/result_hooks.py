@@ -0,0 +1,48 @@
+from typing import List
+from sqlalchemy.orm import Session
+from modules.api.ratings.functions import (
+    apply_match_rating,
+    remove_match_ratings,
+    replay_ratings,
+)
+from modules.api.stats.functions import (
+    apply_match_stats,
+    rebuild_player_stats,
+    remove_match_stats,
+)
+from modules.api.tournaments.results import stamp_completion
+
+
+def on_match_result(db: Session, match_id: int):
+    """
+    Hook called in the transaction of every change to a single match result
+    (scores, status): updates the data derived from results incrementally.
+    """
+    db.flush()
+    stamp_completion(db, match_id)
+    apply_match_rating(db, match_id)
+    apply_match_stats(db, match_id)
+
+
+def before_results_removed(db: Session, match_ids: List[int]):
+    """
+    Hook called before completed matches are deleted or lose a side (match,
+    participant or tournament deletion, reset, mode change): takes them out
+    of the data derived from results, from the first affected completion rank
+    only. Nothing is done when no completed match is affected.
+    """
+    if not match_ids:
+        return
+    db.flush()
+    remove_match_ratings(db, match_ids)
+    remove_match_stats(db, match_ids)
+
+
+def on_results_rewritten(db: Session):
+    """
+    Hook called after bulk changes to past results (player swaps):
+    rebuilds the data derived from results from scratch.
+    """
+    db.flush()
+    replay_ratings(db)
+    rebuild_player_stats(db)
@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    ParticipantMember,
+    Tournament,
+)
+
+
+@dataclass
+class Side:
+    participant_id: int
+    score: Optional[float]
+    user_ids: List[int] = field(default_factory=list)
+
+
+@dataclass
+class MatchResult:
+    match_id: int
+    tournament_id: int
+    played_on: datetime  # date du tournoi
+    sides: List[Side] = field(default_factory=list)
+    mode: Optional[str] = None  # 'single' ou 'double'
+    sequence: Optional[int] = None  # rang d'achèvement du match
+
+    @property
+    def outcome(self) -> float:
+        """1.0 if the first side won, 0.0 if it lost, 0.5 for a draw."""
+        first, second = self.sides
+        if first.score == second.score:
+            return 0.5
+        return 1.0 if first.score > second.score else 0.0
+
+
+def stamp_completion(db: Session, match_id: int):
+    """
+    Give a match that has just been completed the next completion rank, and
+    clear it when the match is no longer completed. An edited completed match
+    keeps its rank.
+    """
+    match = db.get(Match, match_id)
+    if match is None:
+        return
+    if match.status != "completed":
+        match.completion_seq = None
+    elif match.completion_seq is None:
+        last = db.scalar(select(func.max(Match.completion_seq)))
+        match.completion_seq = (last or 0) + 1
+    db.flush()
+
+
+def completed_match_ids(db: Session, *criteria) -> List[int]:
+    """
+    Ids of the completed matches that meet `criteria` (e.g. the matches of a
+    tournament, read before they are deleted).
+    """
+    return list(
+        db.scalars(select(Match.id).where(Match.status == "completed", *criteria))
+    )
+
+
+def stamp_missing_completions(db: Session) -> int:
+    """
+    Rank the completed matches that have no completion rank yet (older data,
+    bulk changes) after the ranked ones, by tournament date then match id.
+    Returns the number of matches ranked.
+    """
+    last = db.scalar(select(func.max(Match.completion_seq))) or 0
+    unranked = db.execute(
+        select(Match.id)
+        .join(Tournament, Tournament.id == Match.tournament_id)
+        .where(Match.status == "completed", Match.completion_seq.is_(None))
+        .order_by(Tournament.start_date, Match.id)
+    ).scalars()
+    ranks = [
+        {"id": match_id, "completion_seq": last + rank}
+        for rank, match_id in enumerate(unranked, start=1)
+    ]
+    if ranks:
+        db.execute(update(Match), ranks)  # mise à jour groupée par clé primaire
+    return len(ranks)
+
+
+def load_results(
+    db: Session,
+    match_ids: Optional[List[int]] = None,
+    from_sequence: Optional[int] = None,
+) -> List[MatchResult]:
+    """
+    Completed two-sided matches with their scores and players, in completion
+    order, from a single query (optionally restricted to `match_ids`, or to
+    the matches completed from rank `from_sequence` on).
+    Matches with a missing score or side are left out.
+    """
+    stmt = (
+        select(
+            Match.id,
+            Match.tournament_id,
+            Match.completion_seq,
+            Tournament.start_date,
+            Tournament.mode,
+            MatchPlayer.participant_id,
+            MatchPlayer.score,
+            ParticipantMember.user_id,
+        )
+        .join(Tournament, Tournament.id == Match.tournament_id)
+        .join(MatchPlayer, MatchPlayer.match_id == Match.id)
+        .outerjoin(
+            ParticipantMember,
+            ParticipantMember.participant_id == MatchPlayer.participant_id,
+        )
+        .where(Match.status == "completed")
+        .order_by(
+            Match.completion_seq,
+            Match.id,
+            MatchPlayer.participant_id,
+            ParticipantMember.user_id,
+        )
+    )
+    if match_ids is not None:
+        stmt = stmt.where(Match.id.in_(match_ids))
+    if from_sequence is not None:
+        stmt = stmt.where(Match.completion_seq >= from_sequence)
+
+    results = {}
+    for row in db.execute(stmt):
+        result = results.get(row.id)
+        if result is None:
+            result = results[row.id] = MatchResult(
+                row.id,
+                row.tournament_id,
+                row.start_date,
+                mode=row.mode,
+                sequence=row.completion_seq,
+            )
+        if not result.sides or result.sides[-1].participant_id != row.participant_id:
+            result.sides.append(Side(row.participant_id, row.score))
+        if row.user_id is not None:
+            result.sides[-1].user_ids.append(row.user_id)
+
+    return [
+        result
+        for result in results.values()
+        if len(result.sides) == 2
+        and all(side.score is not None and side.user_ids for side in result.sides)
+    ]
@@ -0,0 +1,122 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import literal_column, select
+from sqlalchemy.orm import Session
+from modules.database.dependencies import get_users_db
+from modules.api.tournaments.models import Match, MatchPlayer, Participant, Tournament
+from modules.api.tournaments.schemas import BracketCreate, BracketResponse
+from modules.api.tournaments.bracket import generate_bracket, seeds_from_pools
+from modules.api.tournaments.routes.leaderboards import participant_display_name
+from modules.api.cache.functions import bump_tournament, cached_response
+from modules.api.tournaments.archive import sync_archive
+from modules.api.users.functions import get_current_user
+from modules.api.users.schemas import TokenData
+
+brackets_router = APIRouter(prefix="/tournaments", tags=["Brackets"])
+
+
+@brackets_router.post(
+    "/{tournament_id}/bracket",
+    response_model=BracketResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Generate the elimination bracket",
+    description="Creates every match of the knockout stage, seeded from the pool standings (or from an explicit list), with byes for fields that are not a power of two. Winners then advance automatically when their match is completed. Requires admin or editor privileges.",
+)
+def create_bracket(
+    tournament_id: int,
+    bracket_data: BracketCreate,
+    db: Session = Depends(get_users_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    if not ("admin" in current_user.scopes or "editor" in current_user.scopes):
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators or editors only."
+        )
+
+    tournament = db.get(Tournament, tournament_id)
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    seeds = bracket_data.participant_ids or seeds_from_pools(
+        db, tournament_id, bracket_data.qualifiers_per_pool
+    )
+    generate_bracket(db, tournament_id, seeds)
+    sync_archive(db, tournament_id)
+    bump_tournament(db, tournament_id)
+    db.commit()
+    return build_bracket(db, tournament_id)
+
+
+@brackets_router.get(
+    "/{tournament_id}/bracket",
+    response_model=BracketResponse,
+    summary="Get the elimination bracket",
+    description="Returns the knockout matches grouped by round, each with the match its winner advances to.",
+)
+def get_bracket(
+    tournament_id: int,
+    request: Request,
+    db: Session = Depends(get_users_db),
+):
+    return cached_response(
+        request,
+        db,
+        [f"tournament:{tournament_id}"],
+        BracketResponse,
+        lambda: build_bracket(db, tournament_id),
+    )
+
+
+def build_bracket(db: Session, tournament_id: int) -> BracketResponse:
+    """
+    Build the bracket from two queries: the knockout matches, then their players.
+    """
+    matches = {
+        row.id: {**row._mapping, "participants": []}
+        for row in db.execute(
+            select(
+                Match.id,
+                Match.status,
+                Match.pool_id,
+                Match.round,
+                Match.next_match_id,
+                Match.next_slot,
+            )
+            .where(Match.tournament_id == tournament_id, Match.pool_id.is_(None))
+            .order_by(Match.round, Match.next_match_id, Match.next_slot, Match.id)
+        )
+    }
+    if not matches:
+        raise HTTPException(status_code=404, detail="Bracket not found")
+
+    rows = db.execute(
+        select(
+            MatchPlayer.match_id,
+            MatchPlayer.participant_id,
+            MatchPlayer.score,
+            participant_display_name().label("name"),
+        )
+        .join(Participant, Participant.id == MatchPlayer.participant_id)
+        .where(MatchPlayer.match_id.in_(list(matches)))
+        .order_by(
+            MatchPlayer.match_id,
+            MatchPlayer.slot,  # Côtés d'un match de tableau, NULL en poule
+            literal_column("match_players.rowid"),
+        )
+    )
+    for row in rows:
+        matches[row.match_id]["participants"].append(
+            {"id": row.participant_id, "name": row.name, "score": row.score}
+        )
+
+    rounds = {}
+    for match in matches.values():
+        rounds.setdefault(match["round"], []).append(match)
+    first_round = min(rounds)
+    return BracketResponse(
+        tournament_id=tournament_id,
+        size=2 ** (max(rounds) - first_round + 1),
+        rounds=[
+            {"round": number, "matches": round_matches}
+            for number, round_matches in sorted(rounds.items())
+        ],
+    )
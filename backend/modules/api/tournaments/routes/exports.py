@@ -0,0 +1,132 @@
+from typing import Tuple
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from modules.database.dependencies import get_analytics_db
+from modules.api.tournaments.exports import (
+    SEASON_COLUMNS,
+    match_log_query,
+    registrations_export_query,
+    season_tournament_ids,
+)
+from modules.api.tournaments.models import Tournament
+from modules.api.tournaments.routes.leaderboards import (
+    season_leaderboard_rows,
+    tournament_leaderboard_query,
+)
+from modules.api.users.functions import get_current_user
+from modules.api.users.schemas import TokenData
+from utils.exports import (
+    chunked,
+    export_params,
+    export_response,
+    query_columns,
+    stream_query,
+)
+
+exports_router = APIRouter(prefix="/tournaments", tags=["Exports"])
+
+
+def _check_access(current_user: TokenData):
+    if not ("admin" in current_user.scopes or "editor" in current_user.scopes):
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators or editors only."
+        )
+
+
+def _check_tournament(db: Session, tournament_id: int):
+    if db.get(Tournament, tournament_id) is None:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+
+def _export_query(db: Session, stmt, filename: str, params: Tuple[str, bool]):
+    return export_response(
+        filename, query_columns(stmt), stream_query(db, stmt), params
+    )
+
+
+@exports_router.get("/{tournament_id}/export/results")
+def export_tournament_results(
+    tournament_id: int,
+    params: Tuple[str, bool] = Depends(export_params),
+    db: Session = Depends(get_analytics_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    _check_access(current_user)
+    _check_tournament(db, tournament_id)
+    return _export_query(
+        db,
+        tournament_leaderboard_query(tournament_id),
+        f"tournament_{tournament_id}_results",
+        params,
+    )
+
+
+@exports_router.get("/{tournament_id}/export/registrations")
+def export_tournament_registrations(
+    tournament_id: int,
+    params: Tuple[str, bool] = Depends(export_params),
+    db: Session = Depends(get_analytics_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    _check_access(current_user)
+    _check_tournament(db, tournament_id)
+    return _export_query(
+        db,
+        registrations_export_query(tournament_id),
+        f"tournament_{tournament_id}_registrations",
+        params,
+    )
+
+
+@exports_router.get("/{tournament_id}/export/matches")
+def export_tournament_matches(
+    tournament_id: int,
+    params: Tuple[str, bool] = Depends(export_params),
+    db: Session = Depends(get_analytics_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    _check_access(current_user)
+    _check_tournament(db, tournament_id)
+    return _export_query(
+        db,
+        match_log_query([tournament_id]),
+        f"tournament_{tournament_id}_matches",
+        params,
+    )
+
+
+@exports_router.get("/season/{season}/export/leaderboard")
+def export_season_leaderboard(
+    season: int,
+    params: Tuple[str, bool] = Depends(export_params),
+    db: Session = Depends(get_analytics_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    """
+    Season standings: one row per player, aggregated in memory as plain dicts.
+    """
+    _check_access(current_user)
+    names = [name for name, _ in SEASON_COLUMNS]
+    rows = [
+        tuple(entry[name] for name in names)
+        for entry in season_leaderboard_rows(db, season)
+    ]
+    return export_response(
+        f"season_{season}_leaderboard", SEASON_COLUMNS, chunked(rows), params
+    )
+
+
+@exports_router.get("/season/{season}/export/matches")
+def export_season_matches(
+    season: int,
+    params: Tuple[str, bool] = Depends(export_params),
+    db: Session = Depends(get_analytics_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    _check_access(current_user)
+    return _export_query(
+        db,
+        match_log_query(season_tournament_ids(season)),
+        f"season_{season}_matches",
+        params,
+    )
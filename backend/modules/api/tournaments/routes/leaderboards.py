@@ -1,7 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func, case, desc, and_, literal, union_all
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy import (
+    select,
+    func,
+    case,
+    desc,
+    and_,
+    literal,
+    literal_column,
+    union_all,
+)
 from sqlalchemy.orm import Session
-from modules.database.dependencies import get_users_db
+from modules.database.dependencies import get_analytics_db, get_users_db
 from modules.api.tournaments.models import (
     Tournament,
     Match,
@@ -9,31 +18,85 @@ from modules.api.tournaments.models import (
     Pool,
     Participant,
     ParticipantMember,
+    TournamentArchive,
+    TournamentArchiveResult,
 )
 from modules.api.tournaments.schemas import (
     TournamentLeaderboardResponse,
     TournamentLeaderboardEntry,
     SeasonLeaderboardResponse,
-    LeaderboardEntry,
     PoolLeaderboardResponse,
 )
 from modules.api.users.models import User
+from modules.api.cache.functions import cached_response
+from modules.api.tournaments.archive import archived_or_build
 from typing import List
 
 leaderboards_router = APIRouter(prefix="/tournaments", tags=["Leaderboards"])
 
 
+def participant_display_name():
+    """
+    Participant name, or the nickname of its first member for single mode.
+    """
+    first_member_nickname = (
+        select(User.nickname)
+        .join(ParticipantMember, ParticipantMember.user_id == User.id)
+        .where(ParticipantMember.participant_id == Participant.id)
+        .order_by(literal_column("participant_members.rowid"))
+        .limit(1)
+        .scalar_subquery()
+    )
+    return func.coalesce(Participant.name, first_member_nickname, "Inconnu")
+
+
 @leaderboards_router.get(
     "/{tournament_id}/leaderboard", response_model=TournamentLeaderboardResponse
 )
 def get_tournament_leaderboard(
     tournament_id: int,
+    request: Request,
     db: Session = Depends(get_users_db),
 ):
+    return cached_response(
+        request,
+        db,
+        [f"tournament:{tournament_id}"],
+        TournamentLeaderboardResponse,
+        lambda: archived_or_build(
+            db, tournament_id, "leaderboard", build_tournament_leaderboard
+        ),
+    )
+
+
+def build_tournament_leaderboard(
+    db: Session, tournament_id: int
+) -> TournamentLeaderboardResponse:
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
+    results = db.execute(tournament_leaderboard_query(tournament_id)).fetchall()
+    leaderboard = [
+        TournamentLeaderboardEntry(
+            participant_id=row.participant_id,
+            nickname=row.name,
+            wins=row.wins,
+            total_manches=row.total_manches,
+        )
+        for row in results
+    ]
+
+    return TournamentLeaderboardResponse(
+        tournament_id=tournament_id, leaderboard=leaderboard
+    )
+
+
+def tournament_leaderboard_query(tournament_id: int):
+    """
+    Wins and manches of each participant over the completed matches of a
+    tournament, best first.
+    """
     # Subquery pour trouver le score de l'adversaire dans chaque match
     other_score_subquery = select(
         MatchPlayer.match_id,
@@ -59,7 +122,7 @@ def get_tournament_leaderboard(
                     )
                 )
             ).label("wins"),
-            Participant.name.label("name"),
+            participant_display_name().label("name"),
         )
         .join(Match, MatchPlayer.match_id == Match.id)
         .join(Participant, MatchPlayer.participant_id == Participant.id)
@@ -73,24 +136,10 @@ def get_tournament_leaderboard(
             ),
         )
         .filter(Match.tournament_id == tournament_id, Match.status == "completed")
-        .group_by(MatchPlayer.participant_id, Participant.name)
+        .group_by(MatchPlayer.participant_id)
         .order_by(desc("wins"), desc("total_manches"))
     )
-
-    results = db.execute(leaderboard_query).fetchall()
-    leaderboard = [
-        TournamentLeaderboardEntry(
-            participant_id=row.participant_id,
-            nickname=row.name,
-            wins=row.wins,
-            total_manches=row.total_manches,
-        )
-        for row in results
-    ]
-
-    return TournamentLeaderboardResponse(
-        tournament_id=tournament_id, leaderboard=leaderboard
-    )
+    return leaderboard_query
 
 
 @leaderboards_router.get(
@@ -98,17 +147,116 @@ def get_tournament_leaderboard(
 )
 def get_season_leaderboard(
     season: int,
-    db: Session = Depends(get_users_db),
+    request: Request,
+    db: Session = Depends(get_analytics_db),
 ):
+    return cached_response(
+        request,
+        db,
+        ["tournaments", "results"],
+        SeasonLeaderboardResponse,
+        lambda: build_season_leaderboard(db, season),
+    )
+
+
+def build_season_leaderboard(db: Session, season: int) -> SeasonLeaderboardResponse:
+    return SeasonLeaderboardResponse(
+        season=str(season), leaderboard=season_leaderboard_rows(db, season)
+    )
+
+
+def season_leaderboard_rows(db: Session, season: int) -> List[dict]:
+    """
+    Season standings as plain dicts (fields of LeaderboardEntry), best first.
+    """
     tournament_ids = [
         t.id
-        for t in db.query(Tournament)
+        for t in db.query(Tournament.id)
         .filter(func.extract("year", Tournament.start_date) == season)
         .all()
     ]
     if not tournament_ids:
-        return SeasonLeaderboardResponse(season=str(season), leaderboard=[])
+        return []
+
+    # Tournois archivés : contributions pré-calculées, sinon calcul sur les matchs
+    archived_ids = set(
+        db.execute(
+            select(TournamentArchive.tournament_id).where(
+                TournamentArchive.tournament_id.in_(tournament_ids)
+            )
+        ).scalars()
+    )
+    live_ids = [t_id for t_id in tournament_ids if t_id not in archived_ids]
+
+    totals = {}
+    if live_ids:
+        for row in db.execute(season_results_query(live_ids)):
+            _add_season_result(totals, row)
+    if archived_ids:
+        archived_query = (
+            select(
+                TournamentArchiveResult.user_id,
+                func.sum(TournamentArchiveResult.total_points).label("total_points"),
+                func.sum(TournamentArchiveResult.single_wins).label("single_wins"),
+                func.sum(TournamentArchiveResult.double_wins).label("double_wins"),
+                func.sum(TournamentArchiveResult.single_manches).label(
+                    "single_manches"
+                ),
+                func.sum(TournamentArchiveResult.double_manches).label(
+                    "double_manches"
+                ),
+                func.coalesce(
+                    User.nickname, func.max(TournamentArchiveResult.nickname)
+                ).label("nickname"),
+                func.coalesce(User.name, func.max(TournamentArchiveResult.name)).label(
+                    "name"
+                ),
+            )
+            .outerjoin(User, User.id == TournamentArchiveResult.user_id)
+            .where(TournamentArchiveResult.tournament_id.in_(archived_ids))
+            .group_by(TournamentArchiveResult.user_id)
+        )
+        for row in db.execute(archived_query):
+            _add_season_result(totals, row)
 
+    return sorted(
+        totals.values(),
+        key=lambda e: (
+            e["total_points"],
+            e["single_wins"] + e["double_wins"],
+            e["single_manches"] + e["double_manches"],
+        ),
+        reverse=True,
+    )
+
+
+SEASON_TOTALS = (
+    "total_points",
+    "single_wins",
+    "double_wins",
+    "single_manches",
+    "double_manches",
+)
+
+
+def _add_season_result(totals: dict, row):
+    entry = totals.get(row.user_id)
+    if entry is None:
+        entry = totals[row.user_id] = {
+            "user_id": row.user_id,
+            "name": row.name or "Inconnu",
+            "nickname": row.nickname,
+            **dict.fromkeys(SEASON_TOTALS, 0.0),
+        }
+    for key in SEASON_TOTALS:
+        entry[key] += float(getattr(row, key) or 0.0)
+
+
+def season_results_query(tournament_ids: List[int]):
+    """
+    Season points of each player over the given tournaments, computed from the
+    matches (one row per user). Points are additive across tournaments.
+    """
     other_score_subquery = select(
         MatchPlayer.match_id,
         MatchPlayer.participant_id.label("other_participant_id"),
@@ -261,7 +409,7 @@ def get_season_leaderboard(
 
     union_query = union_all(single_query, double_query).alias("union_sub")
 
-    final_query = (
+    return (
         select(
             union_query.c.user_id,
             func.sum(union_query.c.total_points).label("total_points"),
@@ -282,31 +430,29 @@ def get_season_leaderboard(
         .order_by(desc("total_points"), desc("wins"), desc("total_manches"))
     )
 
-    results = db.execute(final_query).fetchall()
-    leaderboard = [
-        LeaderboardEntry(
-            user_id=row.user_id,
-            name=row.name or "Inconnu",
-            nickname=row.nickname,
-            total_points=float(row.total_points) or 0.0,
-            single_wins=float(row.single_wins) or 0.0,
-            double_wins=float(row.double_wins) or 0.0,
-            single_manches=float(row.single_manches) or 0.0,
-            double_manches=float(row.double_manches) or 0.0,
-        )
-        for row in results
-    ]
-
-    return SeasonLeaderboardResponse(season=str(season), leaderboard=leaderboard)
-
 
 @leaderboards_router.get(
     "/{tournament_id}/pools-leaderboard", response_model=List[PoolLeaderboardResponse]
 )
 def get_pools_leaderboard(
     tournament_id: int,
+    request: Request,
     db: Session = Depends(get_users_db),
 ):
+    return cached_response(
+        request,
+        db,
+        [f"tournament:{tournament_id}"],
+        List[PoolLeaderboardResponse],
+        lambda: archived_or_build(
+            db, tournament_id, "pools_leaderboard", build_pools_leaderboard
+        ),
+    )
+
+
+def build_pools_leaderboard(
+    db: Session, tournament_id: int
+) -> List[PoolLeaderboardResponse]:
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
@@ -337,7 +483,7 @@ def get_pools_leaderboard(
                         )
                     )
                 ).label("wins"),
-                Participant.name.label("name"),
+                participant_display_name().label("name"),
             )
             .join(Match, MatchPlayer.match_id == Match.id)
             .join(Participant, MatchPlayer.participant_id == Participant.id)
@@ -351,7 +497,7 @@ def get_pools_leaderboard(
                 ),
             )
             .filter(Match.pool_id == pool.id, Match.status == "completed")
-            .group_by(MatchPlayer.participant_id, Participant.name)
+            .group_by(MatchPlayer.participant_id)
             .order_by(desc("wins"), desc("total_manches"))
         )
 
@@ -1,8 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, literal_column, select
 from sqlalchemy.orm import Session
 from modules.database.dependencies import get_users_db
-from modules.api.tournaments.models import Match, MatchPlayer, Participant, Tournament
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Tournament,
+)
+from modules.api.users.models import User
+from utils.pagination import Page, PageParams, page_params, page_response, paginate
 from modules.api.tournaments.schemas import MatchCreate, MatchUpdate, MatchResponse
+from modules.api.cache.functions import bump_tournament
+from modules.api.tournaments.archive import sync_archive
+from modules.api.tournaments.bracket import advance_winner
+from modules.api.tournaments.result_hooks import before_results_removed, on_match_result
 from typing import List
 
 matches_router = APIRouter(prefix="/tournaments", tags=["Matches"])
@@ -50,6 +63,8 @@ def create_match(
             {"participant_id": participant_id, "name": name, "score": None}
         )
 
+    sync_archive(db, new_match.tournament_id)
+    bump_tournament(db, new_match.tournament_id)
     db.commit()
 
     return MatchResponse(
@@ -59,6 +74,8 @@ def create_match(
         participants=participants_list,
         pool_id=new_match.pool_id,
         round=new_match.round,
+        next_match_id=new_match.next_match_id,
+        next_slot=new_match.next_slot,
     )
 
 
@@ -67,29 +84,67 @@ def create_match(
 )
 def get_tournament_matches(
     tournament_id: int,
+    params: PageParams = Depends(page_params()),
     db: Session = Depends(get_users_db),
 ):
-    matches = db.query(Match).filter(Match.tournament_id == tournament_id).all()
-    response = []
-    for match in matches:
-        participants_list = []
-        for mp in match.match_participations:
-            p = mp.participant
-            name = p.name or (p.members[0].user.name if p.members else "Inconnu")
-            participants_list.append(
-                {"participant_id": p.id, "name": name, "score": mp.score}
-            )
-        response.append(
-            MatchResponse(
-                id=match.id,
-                tournament_id=match.tournament_id,
-                status=match.status,
-                participants=participants_list,
-                pool_id=match.pool_id,
-                round=match.round,
-            )
+    params.check_fields(MatchResponse.model_fields)
+    page = build_tournament_matches(db, tournament_id, params)
+    return page_response(page)
+
+
+def build_tournament_matches(
+    db: Session, tournament_id: int, params: PageParams = PageParams()
+) -> Page:
+    """
+    Build a page of the match list of a tournament: one query for the matches,
+    one for their participations (participant name or first member's name).
+    """
+    page = paginate(
+        db,
+        select(
+            Match.id,
+            Match.tournament_id,
+            Match.status,
+            Match.pool_id,
+            Match.round,
+            Match.next_match_id,
+            Match.next_slot,
+        ).where(Match.tournament_id == tournament_id),
+        Match.id,
+        params,
+    )
+    matches = {row.id: {**row._mapping, "participants": []} for row in page.items}
+
+    first_member_name = (
+        select(User.name)
+        .join(ParticipantMember, ParticipantMember.user_id == User.id)
+        .where(ParticipantMember.participant_id == Participant.id)
+        .order_by(literal_column("participant_members.rowid"))
+        .limit(1)
+        .scalar_subquery()
+    )
+    rows = db.execute(
+        select(
+            MatchPlayer.match_id,
+            MatchPlayer.participant_id,
+            MatchPlayer.score,
+            func.coalesce(Participant.name, first_member_name, "Inconnu").label("name"),
         )
-    return response
+        .join(Participant, Participant.id == MatchPlayer.participant_id)
+        .where(MatchPlayer.match_id.in_(list(matches)))
+        .order_by(
+            MatchPlayer.match_id,
+            MatchPlayer.slot,  # Côtés d'un match de tableau, NULL en poule
+            literal_column("match_players.rowid"),
+        )
+    )
+    for row in rows:
+        matches[row.match_id]["participants"].append(
+            {"participant_id": row.participant_id, "name": row.name, "score": row.score}
+        )
+
+    page.items = list(matches.values())
+    return page
 
 
 @matches_router.patch("/matches/{match_id}", response_model=MatchResponse)
@@ -130,6 +185,11 @@ def update_match(
                 {"participant_id": participant_id, "name": name, "score": score}
             )
 
+    # Tableau : le vainqueur est qualifié (ou retiré) dans le match suivant
+    advance_winner(db, match)
+    on_match_result(db, match.id)
+    sync_archive(db, match.tournament_id)
+    bump_tournament(db, match.tournament_id)
     db.commit()
     db.refresh(match)
 
@@ -148,6 +208,8 @@ def update_match(
         participants=participants_list,
         pool_id=match.pool_id,
         round=match.round,
+        next_match_id=match.next_match_id,
+        next_slot=match.next_slot,
     )
 
 
@@ -171,6 +233,10 @@ def cancel_match_scores(
         name = p.name or (p.members[0].user.name if p.members else "Inconnu")
         participants_list.append({"participant_id": p.id, "name": name, "score": None})
 
+    advance_winner(db, match)
+    on_match_result(db, match.id)
+    sync_archive(db, match.tournament_id)
+    bump_tournament(db, match.tournament_id)
     db.commit()
     db.refresh(match)
 
@@ -181,6 +247,8 @@ def cancel_match_scores(
         participants=participants_list,
         pool_id=match.pool_id,
         round=match.round,
+        next_match_id=match.next_match_id,
+        next_slot=match.next_slot,
     )
 
 
@@ -193,8 +261,13 @@ def delete_match(
     if not match:
         raise HTTPException(status_code=404, detail="Match not found")
 
+    # Résultat retiré avant la cascade (historiques Elo et statistiques du match)
+    if match.status == "completed":
+        before_results_removed(db, [match_id])
     # Supprimer les entrées liées dans MatchPlayer
     db.query(MatchPlayer).filter(MatchPlayer.match_id == match_id).delete()
     db.delete(match)
+    sync_archive(db, match.tournament_id)
+    bump_tournament(db, match.tournament_id)
     db.commit()
     return None
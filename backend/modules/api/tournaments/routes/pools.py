@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from modules.database.dependencies import get_users_db
@@ -9,12 +9,62 @@ from modules.api.tournaments.schemas import (
     MatchResponse,
     PlayerResponse,
     ParticipantResponse,
+    DrawCreate,
+    DrawResponse,
 )
+from modules.api.cache.functions import bump_tournament
+from modules.api.tournaments.archive import sync_archive
+from modules.api.tournaments.draw import draw_pools, pool_name, save_draw
+from modules.api.users.functions import get_current_user
+from modules.api.users.schemas import TokenData
 from typing import List
 
 pools_router = APIRouter(prefix="/tournaments", tags=["Pools"])
 
 
+@pools_router.post(
+    "/{tournament_id}/draw",
+    response_model=DrawResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Draw the pools of a tournament",
+    description="Splits every participant into balanced pools by snake seeding on the season leaderboard or an imported LSEF / CMER ranking, keeping players of the same club apart when possible. With dry_run the draw is only returned. Requires admin or editor privileges.",
+)
+def draw_tournament_pools(
+    tournament_id: int,
+    draw_data: DrawCreate,
+    db: Session = Depends(get_users_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    if not ("admin" in current_user.scopes or "editor" in current_user.scopes):
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators or editors only."
+        )
+
+    draw = draw_pools(
+        db,
+        tournament_id,
+        draw_data.pool_count,
+        draw_data.source,
+        draw_data.category,
+        draw_data.separate_clubs,
+    )
+    pool_ids = [None] * len(draw)
+    if not draw_data.dry_run:
+        pool_ids = save_draw(db, tournament_id, draw)
+        sync_archive(db, tournament_id)
+        bump_tournament(db, tournament_id)
+        db.commit()
+
+    return DrawResponse(
+        tournament_id=tournament_id,
+        source=draw_data.source,
+        pools=[
+            {"pool_id": pool_id, "name": pool_name(i), "participants": participants}
+            for i, (pool_id, participants) in enumerate(zip(pool_ids, draw))
+        ],
+    )
+
+
 @pools_router.post("/{tournament_id}/pools", response_model=PoolResponse)
 def create_pool(
     tournament_id: int,
@@ -41,6 +91,8 @@ def create_pool(
             )
         new_pool.participants.append(participant)
 
+    sync_archive(db, tournament_id)
+    bump_tournament(db, tournament_id)
     try:
         db.commit()
     except IntegrityError:
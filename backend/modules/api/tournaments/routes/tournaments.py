@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import select, delete
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import and_, select, delete, text
 from modules.database.dependencies import get_users_db
 from modules.api.tournaments.models import (
     Tournament,
@@ -10,6 +10,7 @@ from modules.api.tournaments.models import (
     Match,
     MatchPlayer,
     Pool,
+    TournamentArchive,
     pool_participant_association,
 )
 from modules.api.tournaments.schemas import (
@@ -18,13 +19,35 @@ from modules.api.tournaments.schemas import (
     TournamentResponse,
     TournamentRegistrationCreate,
     TournamentRegistrationResponse,
+    BulkRegistrationCreate,
+    BulkRegistrationResponse,
     ParticipantCreate,
     ParticipantResponse,
     PlayerResponse,
     TournamentFullDetailSchema,
     SwapPlayersRequest,
+    SwapPlayersBatchRequest,
+    SwapPlayersBatchResponse,
 )
 from modules.api.users.functions import get_current_user
+from modules.api.cache.functions import cached_response, bump_tournament
+from modules.api.tournaments.archive import archived_or_build, sync_archive
+from modules.api.tournaments.result_hooks import (
+    before_results_removed,
+    on_results_rewritten,
+)
+from modules.api.tournaments.results import completed_match_ids
+from modules.api.stats.functions import (
+    refresh_player_best_finishes,
+    tournament_players,
+)
+from modules.api.tournaments.functions import (
+    apply_player_swaps,
+    participant_row_counts,
+    tournament_row_counts,
+)
+from utils.fast_json import rows_to_dicts
+from utils.pagination import Page, PageParams, page_params, page_response, paginate
 from modules.api.users.models import User
 from modules.api.users.schemas import TokenData
 from typing import List
@@ -61,6 +84,8 @@ def create_tournament(
         status=tournament_data.status,
     )
     db.add(new_tournament)
+    db.flush()
+    bump_tournament(db, new_tournament.id, listing=True)
     db.commit()
     db.refresh(new_tournament)
     return TournamentResponse(
@@ -77,9 +102,8 @@ def create_tournament(
 
 @tournaments_router.delete(
     "/{tournament_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a tournament",
-    description="Deletes a tournament and all associated data (pools, matches, participants). Requires admin or editor privileges.",
+    description="Deletes a tournament and all associated data (pools, matches, participants) through ON DELETE CASCADE, and returns the number of removed rows per table. Requires admin or editor privileges.",
 )
 def delete_tournament(
     tournament_id: int,
@@ -91,12 +115,24 @@ def delete_tournament(
             status_code=403, detail="Access denied: administrators or editors only."
         )
 
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
+    # Comptage avant suppression : la cascade ne remonte pas de rowcount
+    counts = tournament_row_counts(db, tournament_id)
+    # Résultats retirés à partir du premier match concerné, avant la cascade
+    before_results_removed(
+        db, completed_match_ids(db, Match.tournament_id == tournament_id)
+    )
+    # Classement final supprimé avec l'archive : meilleurs résultats à revoir
+    players = []
+    if db.get(TournamentArchive, tournament_id) is not None:
+        players = tournament_players(db, tournament_id)
+    result = db.execute(delete(Tournament).where(Tournament.id == tournament_id))
+    if result.rowcount == 0:
         raise HTTPException(status_code=404, detail="Tournament not found.")
 
-    db.delete(tournament)
+    refresh_player_best_finishes(db, players)
+    bump_tournament(db, tournament_id, listing=True)
     db.commit()
+    return {"deleted": {"tournaments": 1, **counts}}
 
 
 @tournaments_router.patch(
@@ -125,31 +161,9 @@ def update_tournament(
 
     # Check if mode is changing
     if tournament_data.mode and tournament_data.mode != tournament.mode:
-        # Reset participants
-        db.execute(
-            delete(ParticipantMember).where(
-                ParticipantMember.participant_id.in_(
-                    select(Participant.id).where(
-                        Participant.tournament_id == tournament_id
-                    )
-                )
-            )
-        )
-        db.execute(
-            delete(MatchPlayer).where(
-                MatchPlayer.match_id.in_(
-                    select(Match.id).where(Match.tournament_id == tournament_id)
-                )
-            )
-        )
-        db.execute(
-            delete(pool_participant_association).where(
-                pool_participant_association.c.participant_id.in_(
-                    select(Participant.id).where(
-                        Participant.tournament_id == tournament_id
-                    )
-                )
-            )
+        # Reset participants (membres, scores et poules suivent par cascade)
+        before_results_removed(
+            db, completed_match_ids(db, Match.tournament_id == tournament_id)
         )
         db.execute(
             delete(Participant).where(Participant.tournament_id == tournament_id)
@@ -159,6 +173,9 @@ def update_tournament(
     for field, value in tournament_data.dict(exclude_unset=True).items():
         setattr(tournament, field, value)
 
+    # Passage à "finished" : snapshot dans l'archive (supprimée si le tournoi est rouvert)
+    sync_archive(db, tournament_id)
+    bump_tournament(db, tournament_id, listing=True)
     db.commit()
     db.refresh(tournament)
     return TournamentResponse(
@@ -181,8 +198,19 @@ def update_tournament(
 )
 def get_tournament(
     tournament_id: int,
+    request: Request,
     db: Session = Depends(get_users_db),
 ):
+    return cached_response(
+        request,
+        db,
+        [f"tournament:{tournament_id}", "tournaments"],
+        TournamentResponse,
+        lambda: build_tournament(db, tournament_id),
+    )
+
+
+def build_tournament(db: Session, tournament_id: int) -> TournamentResponse:
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
@@ -202,25 +230,41 @@ def get_tournament(
     "/",
     response_model=List[TournamentResponse],
     summary="List all tournaments",
-    description="Retrieves a list of all tournaments in the system.",
+    description="Retrieves a list of all tournaments in the system, ordered by id. Supports keyset pagination (`cursor`, `limit`), field selection (`fields`) and `with_total`.",
 )
 def get_tournaments(
+    request: Request,
+    params: PageParams = Depends(page_params()),
     db: Session = Depends(get_users_db),
 ):
-    tournaments = db.query(Tournament).all()
-    return [
-        TournamentResponse(
-            id=t.id,
-            name=t.name,
-            description=t.description,
-            start_date=t.start_date,
-            is_active=t.is_active,
-            type=t.type,
-            mode=t.mode,
-            status=t.status,
-        )
-        for t in tournaments
-    ]
+    params.check_fields(TournamentResponse.model_fields)
+    return cached_response(
+        request,
+        db,
+        ["tournaments"],
+        List[TournamentResponse],
+        lambda: build_tournaments(db, params),
+    )
+
+
+def build_tournaments(db: Session, params: PageParams = PageParams()) -> Page:
+    page = paginate(
+        db,
+        select(
+            Tournament.id,
+            Tournament.name,
+            Tournament.description,
+            Tournament.start_date,
+            Tournament.is_active,
+            Tournament.type,
+            Tournament.mode,
+            Tournament.status,
+        ),
+        Tournament.id,
+        params,
+    )
+    page.items = rows_to_dicts(page.items)
+    return page
 
 
 @tournaments_router.post(
@@ -321,6 +365,7 @@ def register_to_tournament(
             member = ParticipantMember(participant_id=participant.id, user_id=user_id)
             db.add(member)
 
+    bump_tournament(db, registration_data.tournament_id)
     db.commit()
 
     first_registration = (
@@ -450,6 +495,7 @@ def register_new_player(
             member = ParticipantMember(participant_id=participant.id, user_id=user_id)
             db.add(member)
 
+    bump_tournament(db, player_data.tournament_id)
     db.commit()
 
     first_registration = (
@@ -469,6 +515,127 @@ def register_new_player(
     )
 
 
+@tournaments_router.post(
+    "/register-players",
+    response_model=BulkRegistrationResponse,
+    summary="Register several players or teams (admin only)",
+    description="Registers a list of players and/or teams to a tournament in one transaction (on-site sign-up). Invalid items (unknown user, already registered, wrong team size...) are reported per item and do not block the others. Requires admin or editor privileges.",
+)
+def register_players_bulk(
+    bulk_data: BulkRegistrationCreate,
+    db: Session = Depends(get_users_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    if not ("admin" in current_user.scopes or "editor" in current_user.scopes):
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators or editors only."
+        )
+
+    tournament_id = bulk_data.tournament_id
+    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    if tournament.status != "open":
+        raise HTTPException(
+            status_code=400, detail="Registrations are closed for this tournament"
+        )
+
+    # Validation ensembliste : une requête pour les utilisateurs, une pour les inscrits
+    requested_ids = {
+        user_id
+        for item in bulk_data.items
+        for user_id in ([item.user_id] if item.user_id else item.user_ids or [])
+    }
+    existing_users = set(
+        db.execute(select(User.id).where(User.id.in_(requested_ids))).scalars()
+    )
+    registered = set(
+        db.execute(
+            select(TournamentRegistration.user_id).where(
+                TournamentRegistration.tournament_id == tournament_id,
+                TournamentRegistration.user_id.in_(requested_ids),
+            )
+        ).scalars()
+    )
+
+    results = []
+    accepted = []  # (résultat, participant ou None)
+    for index, item in enumerate(bulk_data.items):
+        if item.user_id:
+            user_ids = [item.user_id]
+            error = None
+        elif item.user_ids:
+            user_ids = item.user_ids
+            if tournament.mode != "double":
+                error = "Team creation is only allowed in double mode"
+            elif len(set(user_ids)) != 2:
+                error = "Exactly 2 user IDs required for team creation"
+            elif not item.name:
+                error = "Team name required for team creation"
+            else:
+                error = None
+        else:
+            user_ids = []
+            error = "Must provide user_id or user_ids"
+
+        if error is None:
+            missing = [u for u in user_ids if u not in existing_users]
+            duplicates = [u for u in user_ids if u in registered]
+            if missing:
+                error = f"User {missing[0]} not found"
+            elif duplicates:
+                error = f"User {duplicates[0]} already registered"
+
+        result = {"index": index, "user_ids": user_ids, "status": "error"}
+        results.append(result)
+        if error:
+            result["detail"] = error
+            continue
+
+        # Réservés dès maintenant : un doublon dans la même requête est refusé
+        registered.update(user_ids)
+        result["status"] = "registered"
+        participant = None
+        if item.user_ids:
+            participant = Participant(tournament_id=tournament_id, name=item.name)
+        elif tournament.mode == "single":
+            # Comme l'inscription unitaire : pas de nom en single (pseudo affiché)
+            participant = Participant(tournament_id=tournament_id, name=None)
+        accepted.append((result, user_ids, participant))
+
+    if accepted:
+        # Un seul flush pour obtenir les ids des participants, un seul commit
+        db.add_all(participant for _, _, participant in accepted if participant)
+        db.flush()
+        now = datetime.now(UTC)
+        for result, user_ids, participant in accepted:
+            for user_id in user_ids:
+                db.add(
+                    TournamentRegistration(
+                        user_id=user_id,
+                        tournament_id=tournament_id,
+                        registration_date=now,
+                    )
+                )
+                if participant:
+                    db.add(
+                        ParticipantMember(
+                            participant_id=participant.id, user_id=user_id
+                        )
+                    )
+            result["participant_id"] = participant.id if participant else None
+
+        bump_tournament(db, tournament_id)
+        db.commit()
+
+    return BulkRegistrationResponse(
+        tournament_id=tournament_id,
+        registered=len(accepted),
+        failed=len(results) - len(accepted),
+        results=results,
+    )
+
+
 @tournaments_router.delete(
     "/registrations/{tournament_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -529,6 +696,7 @@ def unregister_from_tournament(
             db.delete(participant)
 
     db.delete(registration)
+    bump_tournament(db, tournament_id)
     db.commit()
 
 
@@ -558,7 +726,7 @@ def check_my_registration(
     "/{tournament_id}/registered-users",
     response_model=List[dict],
     summary="List registered users",
-    description="Retrieves all users registered for a tournament with their participant details, if any. Requires admin or editor privileges.",
+    description="Retrieves all users registered for a tournament with their participant details and team-mate, if any. Requires admin or editor privileges.",
 )
 def get_registered_users(
     tournament_id: int,
@@ -570,45 +738,64 @@ def get_registered_users(
             status_code=403, detail="Access denied: administrators or editors only."
         )
 
-    registrations = (
-        db.query(TournamentRegistration)
-        .filter(TournamentRegistration.tournament_id == tournament_id)
-        .all()
-    )
-    user_ids = [reg.user_id for reg in registrations]
-    users = db.query(User).filter(User.id.in_(user_ids)).all()
-
-    response = []
-    for user in users:
-        participant_member = (
-            db.query(ParticipantMember)
-            .join(Participant, ParticipantMember.participant_id == Participant.id)
-            .filter(
-                ParticipantMember.user_id == user.id,
-                Participant.tournament_id == tournament_id,
-            )
-            .first()
+    # Une seule requête : inscription ⟕ participation au tournoi ⟕ coéquipier
+    membership = (
+        select(
+            ParticipantMember.user_id,
+            Participant.id.label("participant_id"),
+            Participant.name.label("participant_name"),
         )
-        participant = (
-            db.query(Participant)
-            .filter(
-                Participant.id == participant_member.participant_id,
-                Participant.tournament_id == tournament_id,
-            )
-            .first()
-            if participant_member
-            else None
+        .join(Participant, ParticipantMember.participant_id == Participant.id)
+        .where(Participant.tournament_id == tournament_id)
+        .subquery()
+    )
+    mate_member = aliased(ParticipantMember)
+    mate = aliased(User)
+    rows = db.execute(
+        select(
+            User.id,
+            User.name,
+            User.nickname,
+            membership.c.participant_id,
+            membership.c.participant_name,
+            mate.id.label("teammate_id"),
+            mate.name.label("teammate_name"),
+            mate.nickname.label("teammate_nickname"),
+        )
+        .select_from(TournamentRegistration)
+        .join(User, User.id == TournamentRegistration.user_id)
+        .outerjoin(membership, membership.c.user_id == User.id)
+        .outerjoin(
+            mate_member,
+            and_(
+                mate_member.participant_id == membership.c.participant_id,
+                mate_member.user_id != User.id,
+            ),
         )
-        response.append(
-            {
-                "id": user.id,
-                "name": user.name,
-                "nickname": user.nickname,
-                "participant_id": participant.id if participant else None,
-                "participant_name": participant.name if participant else None,
+        .outerjoin(mate, mate.id == mate_member.user_id)
+        .where(TournamentRegistration.tournament_id == tournament_id)
+        .order_by(User.id)
+    )
+
+    response = {}
+    for row in rows:
+        if row.id in response:
+            continue
+        response[row.id] = {
+            "id": row.id,
+            "name": row.name,
+            "nickname": row.nickname,
+            "participant_id": row.participant_id,
+            "participant_name": row.participant_name,
+            "teammate": {
+                "id": row.teammate_id,
+                "name": row.teammate_name,
+                "nickname": row.teammate_nickname,
             }
-        )
-    return response
+            if row.teammate_id is not None
+            else None,
+        }
+    return list(response.values())
 
 
 @tournaments_router.delete(
@@ -677,6 +864,7 @@ def unregister_user(
             db.delete(participant)
 
     db.delete(registration)
+    bump_tournament(db, tournament_id)
     db.commit()
 
 
@@ -763,6 +951,7 @@ def create_participant(
         member = ParticipantMember(participant_id=participant.id, user_id=user_id)
         db.add(member)
 
+    bump_tournament(db, tournament_id)
     db.commit()
 
     # Prepare response
@@ -777,9 +966,8 @@ def create_participant(
 
 @tournaments_router.delete(
     "/{tournament_id}/participants/{participant_id}",
-    status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete a participant",
-    description="Deletes a participant (team in double mode or player in single mode) from a tournament, keeping the users' registrations intact if applicable. Requires admin or editor privileges.",
+    description="Deletes a participant (team in double mode or player in single mode) from a tournament, keeping the users' registrations intact if applicable, and returns the number of removed rows per table. Requires admin or editor privileges.",
 )
 def delete_participant(
     tournament_id: int,
@@ -833,70 +1021,82 @@ def delete_participant(
             detail="Single mode participant cannot have more than one user",
         )
 
-    # Delete associated MatchPlayer entries
-    db.execute(
-        delete(MatchPlayer).where(
-            MatchPlayer.match_id.in_(
-                select(Match.id).where(Match.tournament_id == tournament_id)
-            ),
-            MatchPlayer.participant_id == participant_id,
-        )
-    )
-
-    # Delete associated pool_participant_association entries
-    db.execute(
-        delete(pool_participant_association).where(
-            pool_participant_association.c.participant_id == participant_id
-        )
-    )
+    counts = participant_row_counts(db, participant_id)
+    counts["registrations"] = 0
 
     # For single mode with 1 member, also delete the associated registration
     if tournament.mode == "single" and member_count == 1:
         user_id = members[0].user_id
-        db.execute(
+        result = db.execute(
             delete(TournamentRegistration).where(
                 TournamentRegistration.user_id == user_id,
                 TournamentRegistration.tournament_id == tournament_id,
             )
         )
+        counts["registrations"] = result.rowcount
 
-    # Delete ParticipantMember entries
-    db.execute(
-        delete(ParticipantMember).where(
-            ParticipantMember.participant_id == participant_id
-        )
+    # Matchs du participant privés d'un côté : retirés des résultats
+    before_results_removed(
+        db,
+        completed_match_ids(
+            db,
+            Match.id.in_(
+                select(MatchPlayer.match_id).where(
+                    MatchPlayer.participant_id == participant_id
+                )
+            ),
+        ),
     )
-
-    # Delete the Participant
-    db.delete(participant)
+    # Membres, scores et affectations aux poules suivent par cascade
+    db.execute(delete(Participant).where(Participant.id == participant_id))
+    bump_tournament(db, tournament_id)
     db.commit()
+    return {"deleted": counts}
 
 
 @tournaments_router.get(
     "/{tournament_id}/participants",
     response_model=List[ParticipantResponse],
     summary="List participants of a tournament",
-    description="Retrieves all participants (players or teams) for a specific tournament. For single mode, participant names may be null.",
+    description="Retrieves all participants (players or teams) for a specific tournament, ordered by id. For single mode, participant names may be null. Supports keyset pagination (`cursor`, `limit`), field selection (`fields`) and `with_total`.",
 )
 def get_participants(
     tournament_id: int,
+    params: PageParams = Depends(page_params()),
     db: Session = Depends(get_users_db),
     current_user: TokenData = Depends(get_current_user),
 ):
-    participants = (
-        db.query(Participant).filter(Participant.tournament_id == tournament_id).all()
+    params.check_fields(ParticipantResponse.model_fields)
+    page = paginate(
+        db,
+        select(Participant.id, Participant.name).where(
+            Participant.tournament_id == tournament_id
+        ),
+        Participant.id,
+        params,
+    )
+
+    # Membres de la page chargés en une seule requête
+    members = {}
+    member_rows = db.execute(
+        select(ParticipantMember.participant_id, User.id, User.name, User.nickname)
+        .join(User, User.id == ParticipantMember.user_id)
+        .where(ParticipantMember.participant_id.in_([p.id for p in page.items]))
+        .order_by(ParticipantMember.participant_id, text("participant_members.rowid"))
     )
+    for row in member_rows:
+        members.setdefault(row.participant_id, []).append(
+            {"id": row.id, "name": row.name, "nickname": row.nickname}
+        )
+
     response = []
-    for p in participants:
-        users = [
-            PlayerResponse(id=m.user.id, name=m.user.name, nickname=m.user.nickname)
-            for m in p.members
-        ]
+    for p in page.items:
+        users = members.get(p.id, [])
         name = (
-            p.name if p.name else (users[0].nickname if users else "")
+            p.name if p.name else (users[0]["nickname"] if users else "")
         )  # Fallback to nickname for single mode
-        response.append(ParticipantResponse(id=p.id, name=name, users=users))
-    return response
+        response.append({"id": p.id, "name": name, "users": users})
+    return page_response(page, response)
 
 
 @tournaments_router.post(
@@ -909,34 +1109,22 @@ def reset_tournament(tournament_id: int, db: Session = Depends(get_users_db)):
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found")
 
-    db.execute(
-        delete(MatchPlayer).where(
-            MatchPlayer.match_id.in_(
-                select(Match.id).where(Match.tournament_id == tournament_id)
-            )
-        )
+    counts = tournament_row_counts(db, tournament_id)
+    before_results_removed(
+        db, completed_match_ids(db, Match.tournament_id == tournament_id)
     )
-
+    # Scores et affectations aux poules suivent par cascade
     db.execute(delete(Match).where(Match.tournament_id == tournament_id))
-
-    pool_ids = [
-        pool.id
-        for pool in db.query(Pool).filter(Pool.tournament_id == tournament_id).all()
-    ]
-    if pool_ids:
-        db.execute(
-            delete(pool_participant_association).where(
-                pool_participant_association.c.pool_id.in_(pool_ids)
-            )
-        )
-
     db.execute(delete(Pool).where(Pool.tournament_id == tournament_id))
 
     tournament.status = "open"
     tournament.type = None
+    sync_archive(db, tournament_id)
+    bump_tournament(db, tournament_id, listing=True)
     db.commit()
 
-    return {"reset": True}
+    deleted = ("matches", "match_players", "pools", "pool_participants")
+    return {"reset": True, "deleted": {key: counts[key] for key in deleted}}
 
 
 @tournaments_router.get(
@@ -946,8 +1134,20 @@ def reset_tournament(tournament_id: int, db: Session = Depends(get_users_db)):
     description="Retrieves detailed information about a tournament, including pools, participants, and matches.",
 )
 def get_full_tournament_details(
-    tournament_id: int, db: Session = Depends(get_users_db)
+    tournament_id: int, request: Request, db: Session = Depends(get_users_db)
 ):
+    return cached_response(
+        request,
+        db,
+        [f"tournament:{tournament_id}"],
+        TournamentFullDetailSchema,
+        lambda: archived_or_build(
+            db, tournament_id, "details", build_tournament_details
+        ),
+    )
+
+
+def build_tournament_details(db: Session, tournament_id: int) -> dict:
     tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
     if not tournament:
         raise HTTPException(status_code=404, detail="Tournament not found.")
@@ -1022,6 +1222,8 @@ def get_full_tournament_details(
                 "participants": match_participants,
                 "status": m.status,
                 "round": m.round,
+                "next_match_id": m.next_match_id,
+                "next_slot": m.next_slot,
             }
         )
 
@@ -1062,6 +1264,7 @@ def close_tournament_registrations(
         )
 
     tournament.status = "closed"  # Ferme les inscriptions
+    bump_tournament(db, tournament_id, listing=True)
     db.commit()
     db.refresh(tournament)
 
@@ -1103,6 +1306,7 @@ def open_tournament_registrations(
         )
 
     tournament.status = "open"  # Ouvre les inscriptions
+    bump_tournament(db, tournament_id, listing=True)
     db.commit()
     db.refresh(tournament)
 
@@ -1135,129 +1339,40 @@ def swap_players(
             status_code=403, detail="Access denied: administrators or editors only."
         )
 
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
-    if tournament.status != "finished":
-        raise HTTPException(
-            status_code=400, detail="Only applicable to finished tournaments"
-        )
-    if tournament.mode != "single":
-        raise HTTPException(
-            status_code=400, detail="Only supported for single-player mode"
-        )
-
-    wrong_participant = (
-        db.query(Participant)
-        .filter(
-            Participant.id == swap_data.wrong_participant_id,
-            Participant.tournament_id == tournament_id,
-        )
-        .first()
-    )
-    if not wrong_participant:
-        raise HTTPException(status_code=404, detail="Wrong participant not found")
-
-    correct_user = db.query(User).filter(User.id == swap_data.correct_user_id).first()
-    if not correct_user:
-        raise HTTPException(status_code=404, detail="Correct user not found")
-
-    # Ensure correct_user has no existing participant in this tournament
-    existing_member = (
-        db.query(ParticipantMember)
-        .join(Participant, ParticipantMember.participant_id == Participant.id)
-        .filter(
-            ParticipantMember.user_id == swap_data.correct_user_id,
-            Participant.tournament_id == tournament_id,
-        )
-        .first()
-    )
-    if existing_member:
-        raise HTTPException(
-            status_code=400,
-            detail="Correct user already has a participant in this tournament",
-        )
-
-    # Add registration for correct_user if missing
-    existing_reg = (
-        db.query(TournamentRegistration)
-        .filter(
-            TournamentRegistration.user_id == swap_data.correct_user_id,
-            TournamentRegistration.tournament_id == tournament_id,
-        )
-        .first()
-    )
-    if not existing_reg:
-        reg = TournamentRegistration(
-            user_id=swap_data.correct_user_id,
-            tournament_id=tournament_id,
-            registration_date=datetime.now(UTC),
-        )
-        db.add(reg)
-
-    # Get wrong_user from wrong_participant (assuming single mode: one member)
-    wrong_member = (
-        db.query(ParticipantMember)
-        .filter(ParticipantMember.participant_id == swap_data.wrong_participant_id)
-        .first()
-    )
-    if not wrong_member:
-        raise HTTPException(
-            status_code=400, detail="No member found for wrong participant"
-        )
-    wrong_user_id = wrong_member.user_id
-
-    # Create new participant for correct_user
-    new_participant = Participant(
-        tournament_id=tournament_id,
-        name=None,  # Single mode: no team name
-    )
-    db.add(new_participant)
+    apply_player_swaps(db, tournament_id, [swap_data])
+    on_results_rewritten(db)
+    sync_archive(db, tournament_id)
+    bump_tournament(db, tournament_id)
     db.commit()
-    db.refresh(new_participant)
-
-    # Link correct_user to new_participant
-    new_member = ParticipantMember(
-        participant_id=new_participant.id, user_id=swap_data.correct_user_id
-    )
-    db.add(new_member)
 
-    # Transfer MatchPlayer entries (preserve scores)
-    old_match_players = (
-        db.query(MatchPlayer)
-        .filter(MatchPlayer.participant_id == swap_data.wrong_participant_id)
-        .all()
-    )
-    for mp in old_match_players:
-        new_mp = MatchPlayer(
-            match_id=mp.match_id, participant_id=new_participant.id, score=mp.score
-        )
-        db.add(new_mp)
-        db.delete(mp)
-
-    # Transfer pool associations
-    db.execute(
-        pool_participant_association.update()
-        .where(
-            pool_participant_association.c.participant_id
-            == swap_data.wrong_participant_id
-        )
-        .values(participant_id=new_participant.id)
-    )
+    return {
+        "message": "Players swapped successfully. Leaderboards will update on refresh."
+    }
 
-    # Clean up old links
-    db.delete(wrong_member)
-    db.delete(wrong_participant)
 
-    db.execute(
-        delete(TournamentRegistration).where(
-            TournamentRegistration.user_id == wrong_user_id,
-            TournamentRegistration.tournament_id == tournament_id,
+@tournaments_router.post(
+    "/{tournament_id}/swap-players/batch",
+    response_model=SwapPlayersBatchResponse,
+    summary="Apply several player corrections to a finished tournament",
+    description="Applies a list of wrong participant / correct user swaps (single mode) in one transaction: either all corrections are applied or none. Requires admin or editor privileges.",
+)
+def swap_players_batch(
+    tournament_id: int,
+    batch: SwapPlayersBatchRequest,
+    db: Session = Depends(get_users_db),
+    current_user: TokenData = Depends(get_current_user),
+):
+    if not ("admin" in current_user.scopes or "editor" in current_user.scopes):
+        raise HTTPException(
+            status_code=403, detail="Access denied: administrators or editors only."
         )
-    )
+    if not batch.swaps:
+        raise HTTPException(status_code=400, detail="No swaps provided")
 
+    swapped = apply_player_swaps(db, tournament_id, batch.swaps)
+    on_results_rewritten(db)
+    sync_archive(db, tournament_id)
+    bump_tournament(db, tournament_id)
     db.commit()
 
-    return {
-        "message": "Players swapped successfully. Leaderboards will update on refresh."
-    }
+    return SwapPlayersBatchResponse(tournament_id=tournament_id, swapped=swapped)
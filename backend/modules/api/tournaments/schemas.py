@@ -1,6 +1,6 @@
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 
 class TournamentCreate(BaseModel):
@@ -50,6 +50,32 @@ class TournamentRegistrationResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class BulkRegistrationItem(BaseModel):
+    user_id: Optional[int] = None  # Joueur seul
+    user_ids: Optional[List[int]] = None  # Équipe (double uniquement)
+    name: Optional[str] = None  # Nom d'équipe
+
+
+class BulkRegistrationCreate(BaseModel):
+    tournament_id: int
+    items: List[BulkRegistrationItem]
+
+
+class BulkRegistrationResult(BaseModel):
+    index: int
+    user_ids: List[int]
+    status: str  # 'registered' ou 'error'
+    detail: Optional[str] = None
+    participant_id: Optional[int] = None
+
+
+class BulkRegistrationResponse(BaseModel):
+    tournament_id: int
+    registered: int
+    failed: int
+    results: List[BulkRegistrationResult]
+
+
 class ParticipantCreate(BaseModel):
     name: Optional[str] = None  # Optionnel pour single, requis pour double
     user_ids: List[int]  # 1 pour single, 2 pour double
@@ -96,6 +122,8 @@ class MatchResponse(BaseModel):
     participants: List[dict]  # Liste de {participant_id: int, name: str, score: float}
     pool_id: Optional[int] = None
     round: Optional[int] = None
+    next_match_id: Optional[int] = None
+    next_slot: Optional[int] = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -170,6 +198,8 @@ class MatchDetailSchema(BaseModel):
     status: str
     pool_id: Optional[int] = None
     round: Optional[int] = None
+    next_match_id: Optional[int] = None
+    next_slot: Optional[int] = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -192,11 +222,70 @@ class TournamentFullDetailSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DrawCreate(BaseModel):
+    pool_count: int = Field(ge=1)
+    source: Literal["season", "lsef", "cmer"] = "season"
+    category: Optional[str] = None  # catégorie du classement LSEF / CMER
+    separate_clubs: bool = True
+    dry_run: bool = False  # aperçu du tirage, sans création des poules
+
+
+class DrawParticipant(BaseModel):
+    id: int
+    name: str
+    rating: float
+    clubs: List[str]
+
+
+class DrawPool(BaseModel):
+    pool_id: Optional[int] = None
+    name: str
+    participants: List[DrawParticipant]
+
+
+class DrawResponse(BaseModel):
+    tournament_id: int
+    source: str
+    pools: List[DrawPool]
+
+
+class BracketCreate(BaseModel):
+    # Seeding explicite ; sinon classement des poules (meilleurs premiers d'abord)
+    participant_ids: Optional[List[int]] = None
+    qualifiers_per_pool: Optional[int] = None
+
+
+class BracketRound(BaseModel):
+    round: int
+    matches: List[MatchDetailSchema]
+
+
+class BracketResponse(BaseModel):
+    tournament_id: int
+    size: int
+    rounds: List[BracketRound]
+
+
 class SwapPlayersRequest(BaseModel):
     wrong_participant_id: int
     correct_user_id: int
 
 
+class SwapPlayersBatchRequest(BaseModel):
+    swaps: List[SwapPlayersRequest]
+
+
+class SwapPlayersResult(BaseModel):
+    wrong_participant_id: int
+    wrong_user_id: int
+    correct_user_id: int
+
+
+class SwapPlayersBatchResponse(BaseModel):
+    tournament_id: int
+    swapped: List[SwapPlayersResult]
+
+
 class TournamentPaymentCreate(BaseModel):
     user_id: int
     tournament_id: int
@@ -208,3 +297,12 @@ class TournamentPaymentResponse(BaseModel):
     tournament_id: int
     paid: bool
     model_config = ConfigDict(from_attributes=True)
+
+
+class PaymentStatusEntry(BaseModel):
+    user_id: int
+    nickname: Optional[str] = None
+    name: Optional[str] = None
+    paid: bool
+    checkout_open: bool  # Session Checkout en cours, non payée
+    model_config = ConfigDict(from_attributes=True)
@@ -1,3 +1,4 @@
+import importlib
 from sqlalchemy.orm import Session
 from dotenv import load_dotenv
 from pydantic import ValidationError
@@ -8,27 +9,54 @@ from modules.api.users.models import User, Role
 from modules.api.users.schemas import UserCreate
 from modules.database.config import USERS_DATABASE_PATH, INITIAL_USERS_CONFIG_PATH
 from modules.database.session import users_engine, UsersSessionLocal, UsersBase
+from modules.database.migrations.runner import migration_lock, run_migrations
 import yaml
 
 logger = configure_logger()
 
 load_dotenv()
 
+# Modules des modèles : toutes les tables sont connues de create_all, quel que soit
+# le point d'entrée (API ou CLI des migrations)
+MODEL_MODULES = [
+    "modules.api.auth.models",
+    "modules.api.users.models",
+    "modules.api.cache.models",
+    "modules.api.calendar.models",
+    "modules.api.inscriptions.models",
+    "modules.api.licences.models",
+    "modules.api.tournaments.models",
+    "modules.api.ratings.models",
+    "modules.api.stats.models",
+    "modules.api.stripe.models",
+]
 
-def init_users_db():
+
+def import_models():
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+
+def init_users_db() -> list:
     """
-    Check if the users database exists and create it with initial admin if not.
+    Check if the users database exists and create it with initial admin if not,
+    then apply the pending schema migrations. Returns the revisions applied.
     """
-    db_exists = USERS_DATABASE_PATH.exists()
+    import_models()
+    with migration_lock():
+        db_exists = USERS_DATABASE_PATH.exists()
 
-    if not db_exists:
-        logger.info("The 'users' database does not exist. Creating it...")
-        UsersBase.metadata.create_all(bind=users_engine)
-        logger.info("The 'users' database was successfully created.")
+        if not db_exists:
+            logger.info("The 'users' database does not exist. Creating it...")
+            UsersBase.metadata.create_all(bind=users_engine)
+            logger.info("The 'users' database was successfully created.")
 
-    UsersBase.metadata.create_all(bind=users_engine)
+        UsersBase.metadata.create_all(bind=users_engine)
+        # Une base neuve est déjà au schéma courant : les révisions sont seulement marquées
+        revisions = run_migrations(users_engine, stamp_only=not db_exists)
 
     # sync_users_from_yaml()
+    return revisions
 
 
 def load_initial_users_config():
@@ -14,6 +14,17 @@ from modules.api.users.models import User, Role
 from modules.api.auth.security import hash_password
 from typing import Optional
 from modules.api.users.telegram import notify_telegram, NotifyUserCreate
+from modules.api.cache.functions import bump_user
+from modules.api.licences.models import Licence
+from modules.api.tournaments.models import (
+    ParticipantMember,
+    TournamentPayment,
+    TournamentRegistration,
+)
+from utils.fast_json import rows_to_dicts
+from utils.pagination import PageParams, page_params, page_response, paginate
+from sqlalchemy import delete, exists, select
+from sqlalchemy.exc import IntegrityError
 import os
 
 logger = configure_logger()
@@ -79,30 +90,34 @@ def get_user(
 
 @users_router.get("/users", response_model=list[UserResponse])
 def get_all_users(
-    current_user: dict = Depends(get_current_user), db: Session = Depends(get_users_db)
+    params: PageParams = Depends(page_params()),
+    current_user: dict = Depends(get_current_user),
+    db: Session = Depends(get_users_db),
 ):
     if "admin" not in current_user.scopes:
         raise HTTPException(
             status_code=403, detail="Access denied: administrators only."
         )
 
-    users = db.query(User).all()
-
-    response = []
-    for user in users:
-        response.append(
-            UserResponse(
-                id=user.id,
-                name=user.name,
-                nickname=user.nickname,
-                discord=user.discord,
-                email=user.email,
-                is_active=user.is_active,
-                role=user.role.role,
-            )
-        )
-
-    return response
+    params.check_fields(UserResponse.model_fields)
+    # Sérialisation directe des lignes (données internes, pas de validation Pydantic)
+    page = paginate(
+        db,
+        select(
+            User.id,
+            User.email,
+            User.name,
+            User.nickname,
+            User.discord,
+            User.is_active,
+            Role.role,
+        ).join(Role, User.role_id == Role.id),
+        User.id,
+        params,
+    )
+    return page_response(
+        page, [{**user, "scopes": []} for user in rows_to_dicts(page.items)]
+    )
 
 
 @users_router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -121,8 +136,32 @@ def delete_user(
     if not user_to_delete:
         raise HTTPException(status_code=404, detail="User not found.")
 
+    # Clés étrangères actives : un joueur ayant un historique de tournois est conservé
+    played = db.scalar(
+        select(
+            exists().where(TournamentRegistration.user_id == user_id)
+            | exists().where(ParticipantMember.user_id == user_id)
+        )
+    )
+    if played:
+        raise HTTPException(
+            status_code=409,
+            detail="User has tournament registrations or results.",
+        )
+
+    # Vues en cache affichant le joueur
+    bump_user(db, user_id)
+    # Licences et paiements n'appartiennent qu'au joueur : supprimés avec lui
+    db.execute(delete(Licence).where(Licence.user_id == user_id))
+    db.execute(delete(TournamentPayment).where(TournamentPayment.user_id == user_id))
     db.delete(user_to_delete)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(
+            status_code=409, detail="User is still referenced by other records."
+        )
 
     logger.info(f"User {user_to_delete.name} successfully deleted")
 
@@ -270,6 +309,11 @@ def update_current_user(
                 status_code=400, detail="A user with this email already exists."
             )
 
+    # Nom ou pseudo affichés dans les vues en cache des tournois
+    renamed = (update_data.name and update_data.name != user.name) or (
+        update_data.nickname and update_data.nickname != user.nickname
+    )
+
     # Update fields
     if update_data.name and update_data.name != user.name:
         logger.info(f"User {user.id} updated name: {user.name} -> {update_data.name}")
@@ -291,6 +335,8 @@ def update_current_user(
         logger.info(f"User {user.id} updated password")
         user.hashed_password = hash_password(update_data.password)
 
+    if renamed:
+        bump_user(db, user.id)
     db.commit()
     db.refresh(user)
 
@@ -321,6 +367,11 @@ def admin_update_user(
     if not user:
         raise HTTPException(status_code=404, detail="User not found.")
 
+    # Nom ou pseudo affichés dans les vues en cache des tournois
+    renamed = (update_data.name and update_data.name != user.name) or (
+        update_data.nickname and update_data.nickname != user.nickname
+    )
+
     if update_data.name and update_data.name != user.name:
         logger.info(f"User {user.id} updated name: {user.name} -> {update_data.name}")
         user.name = update_data.name
@@ -354,6 +405,8 @@ def admin_update_user(
         logger.info(f"User {user.id} updated role: {user.role} -> {role_obj}")
         user.role = role_obj
 
+    if renamed:
+        bump_user(db, user.id)
     db.commit()
     db.refresh(user)
 
@@ -0,0 +1,96 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from modules.database import config
+from utils.logger_config import configure_logger
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = configure_logger()
+
+# Période de rafraîchissement du réplica ; 0 le désactive (rapports sur la base principale)
+ANALYTICS_REFRESH_SECONDS = int(os.getenv("ANALYTICS_REFRESH_SECONDS", "300"))
+
+_lock = threading.Lock()
+_engine = None
+_session_factory = None
+_replica_version = None
+
+
+def refresh_analytics_replica(
+    source_path: Optional[Path] = None, replica_path: Optional[Path] = None
+) -> bool:
+    """
+    Snapshot the main database into the analytics replica with the SQLite
+    online backup API, then swap the file in atomically. The copy runs in a
+    single read transaction, which does not block writers in WAL mode.
+    """
+    source_path = Path(source_path or config.USERS_DATABASE_PATH)
+    replica_path = Path(replica_path or config.ANALYTICS_DATABASE_PATH)
+    if not source_path.exists():
+        logger.info(f"No database found at {source_path}, skipping analytics replica.")
+        return False
+
+    tmp_path = replica_path.with_name(f"{replica_path.name}.tmp")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        with sqlite3.connect(str(source_path), timeout=10) as source:
+            target = sqlite3.connect(str(tmp_path))
+            try:
+                source.backup(target)
+                # Réplica ouvert en lecture seule : pas de fichiers -wal/-shm
+                target.execute("PRAGMA journal_mode=DELETE")
+            finally:
+                target.close()
+        source.close()
+        os.replace(tmp_path, replica_path)
+    except Exception as e:
+        logger.exception(f"Error refreshing the analytics replica: {e}")
+        return False
+    logger.info(f"Analytics replica refreshed: {replica_path.name}")
+    return True
+
+
+def _set_replica_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA query_only=ON")
+    cursor.close()
+
+
+def analytics_session_factory() -> Optional[sessionmaker]:
+    """
+    Session factory bound to the read-only replica, or None when there is no
+    replica (disabled or not built yet). The engine is recreated when a new
+    snapshot replaced the file, so that new sessions read the latest copy.
+    """
+    global _engine, _session_factory, _replica_version
+
+    if ANALYTICS_REFRESH_SECONDS <= 0:
+        return None
+    replica_path = Path(config.ANALYTICS_DATABASE_PATH)
+    try:
+        stat = replica_path.stat()
+    except FileNotFoundError:
+        return None
+
+    # Nouveau fichier à chaque rafraîchissement (os.replace) : nouvel inode
+    version = (stat.st_ino, stat.st_mtime_ns)
+    with _lock:
+        if version != _replica_version:
+            if _engine is not None:
+                _engine.dispose()
+            _engine = create_engine(
+                f"sqlite:///file:{replica_path}?mode=ro&uri=true",
+                connect_args={"check_same_thread": False},
+            )
+            event.listen(_engine, "connect", _set_replica_pragmas)
+            _session_factory = sessionmaker(
+                autocommit=False, autoflush=False, bind=_engine
+            )
+            _replica_version = version
+        return _session_factory
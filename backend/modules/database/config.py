@@ -9,6 +9,9 @@ USERS_DATABASE_PATH = DATABASE_DIR / "badarts.db"
 
 USERS_DATABASE_URL = f"sqlite:///{USERS_DATABASE_PATH}"
 
+# Copie en lecture seule de badarts.db pour les rapports (voir analytics.py)
+ANALYTICS_DATABASE_PATH = DATABASE_DIR / "badarts_analytics.db"
+
 INITIAL_USERS_CONFIG_PATH = (
     BASE_DIR / "modules" / "api" / "users" / "initial_users.yaml"
 )
@@ -1,3 +1,4 @@
+from modules.database.analytics import analytics_session_factory
 from modules.database.session import UsersSessionLocal
 
 def get_users_db():
@@ -5,4 +6,15 @@ def get_users_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_analytics_db():
+    """
+    Session for report endpoints (season standings, exports, table counts):
+    the read-only analytics replica when it exists, the main database otherwise.
+    """
+    db = (analytics_session_factory() or UsersSessionLocal)()
+    try:
+        yield db
+    finally:
+        db.close()
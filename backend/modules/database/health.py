@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Optional
+import orjson
+from modules.database import config
+from utils.logger_config import configure_logger
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = configure_logger()
+
+# Vérifications profondes planifiées (heures entre deux passages)
+HEALTH_QUICK_CHECK_HOURS = float(os.getenv("HEALTH_QUICK_CHECK_HOURS", "1"))
+HEALTH_INTEGRITY_CHECK_HOURS = float(os.getenv("HEALTH_INTEGRITY_CHECK_HOURS", "24"))
+
+# Résultats partagés par les workers : seul le leader du scheduler les écrit
+HEALTH_REPORT_PATH = config.DATABASE_DIR / "health.json"
+
+CHECKS = ("quick_check", "integrity_check")
+
+
+def database_metrics(db_path: Optional[Path] = None) -> dict:
+    """
+    Cheap SQLite metrics: header pragmas only, no page of the tables is read.
+    """
+    db_path = Path(db_path or config.USERS_DATABASE_PATH)
+    with sqlite3.connect(str(db_path), timeout=10) as conn:
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        synchronous_level = conn.execute("PRAGMA synchronous").fetchone()[0]
+        sqlite_version = conn.execute("SELECT sqlite_version()").fetchone()[0]
+    conn.close()
+
+    try:
+        file_size = db_path.stat().st_size
+    except OSError:
+        file_size = None
+
+    return {
+        "page_count": page_count,
+        "page_size": page_size,
+        "calculated_size_bytes": page_count * page_size,
+        "file_size_bytes": file_size,
+        "freelist_count": freelist_count,
+        "journal_mode": journal_mode,
+        "synchronous": {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}.get(
+            synchronous_level, f"UNKNOWN ({synchronous_level})"
+        ),
+        "sqlite_version": sqlite_version,
+    }
+
+
+def read_health_report(report_path: Optional[Path] = None) -> dict:
+    """Last result of each deep check ({} before the first run)."""
+    try:
+        return orjson.loads(Path(report_path or HEALTH_REPORT_PATH).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def run_deep_check(
+    check: str = "quick_check",
+    db_path: Optional[Path] = None,
+    report_path: Optional[Path] = None,
+) -> dict:
+    """
+    Run PRAGMA quick_check or integrity_check (reads the whole file) and store
+    the timestamped result in the shared report. Meant for the scheduler, never
+    for a request.
+    """
+    if check not in CHECKS:
+        raise ValueError(f"Unknown check: {check}")
+    db_path = Path(db_path or config.USERS_DATABASE_PATH)
+    report_path = Path(report_path or HEALTH_REPORT_PATH)
+
+    started = time.monotonic()
+    try:
+        with sqlite3.connect(str(db_path), timeout=10) as conn:
+            messages = [row[0] for row in conn.execute(f"PRAGMA {check}(100)")]
+        conn.close()
+    except Exception as e:
+        logger.exception(f"Error during {check}: {e}")
+        messages = [f"error: {e}"]
+
+    result = {
+        "ok": messages == ["ok"],
+        "messages": messages,
+        "checked_at": datetime.now(UTC).isoformat(),
+        "duration_ms": round((time.monotonic() - started) * 1000, 1),
+    }
+    if not result["ok"]:
+        logger.error(f"SQLite {check} failed: {messages[:5]}")
+
+    report = read_health_report(report_path)
+    report[check] = result
+    tmp_path = report_path.with_name(f"{report_path.name}.tmp")
+    tmp_path.write_bytes(orjson.dumps(report))
+    os.replace(tmp_path, report_path)
+    return result
@@ -0,0 +1,63 @@
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Requêtes chaudes des routes, analysées par EXPLAIN QUERY PLAN (paramètres liés à 1)
+HOT_QUERIES = {
+    "tournament_matches": "SELECT id, status, pool_id, round FROM matches "
+    "WHERE tournament_id = :id ORDER BY id",
+    "pool_matches": "SELECT id FROM matches WHERE pool_id = :id AND status = 'completed'",
+    "match_participations": "SELECT participant_id, score FROM match_players "
+    "WHERE match_id = :id",
+    "participant_history": "SELECT match_id, score FROM match_players "
+    "WHERE participant_id = :id",
+    "tournament_participants": "SELECT id, name FROM participants "
+    "WHERE tournament_id = :id ORDER BY id",
+    "user_memberships": "SELECT participant_id FROM participant_members "
+    "WHERE user_id = :id",
+    "participant_pools": "SELECT pool_id FROM pool_participant_association "
+    "WHERE participant_id = :id",
+    "tournament_pools": "SELECT id, name FROM pools WHERE tournament_id = :id",
+    "tournament_registrations": "SELECT user_id FROM tournament_registrations "
+    "WHERE tournament_id = :id",
+    "registration_check": "SELECT id FROM tournament_registrations "
+    "WHERE tournament_id = :id AND user_id = :id",
+    "tournament_leaderboard": "SELECT mp.participant_id, SUM(mp.score) "
+    "FROM match_players mp "
+    "JOIN matches m ON mp.match_id = m.id "
+    "JOIN participants p ON mp.participant_id = p.id "
+    "WHERE m.tournament_id = :id AND m.status = 'completed' "
+    "GROUP BY mp.participant_id",
+    "season_leaderboard": "SELECT pm.user_id, SUM(mp.score) "
+    "FROM match_players mp "
+    "JOIN matches m ON mp.match_id = m.id "
+    "JOIN tournaments t ON m.tournament_id = t.id "
+    "JOIN participant_members pm ON pm.participant_id = mp.participant_id "
+    "WHERE m.status = 'completed' AND t.status = 'finished' "
+    "GROUP BY pm.user_id",
+    "refresh_token_lookup": "SELECT id, expires_at FROM refresh_tokens "
+    "WHERE token = :id",
+    "refresh_token_revoke": "UPDATE refresh_tokens SET revoked = 1 "
+    "WHERE user_id = :id AND revoked = 0",
+}
+
+
+def explain_hot_queries(db: Session) -> list:
+    """
+    Run EXPLAIN QUERY PLAN on each hot query and flag the full table scans.
+    """
+    report = []
+    for name, sql in HOT_QUERIES.items():
+        plan = [
+            row.detail
+            for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}"), {"id": 1})
+        ]
+        # "SCAN t" sans index = lecture complète de la table
+        scans = [
+            detail
+            for detail in plan
+            if detail.startswith("SCAN") and "INDEX" not in detail
+        ]
+        report.append(
+            {"query": name, "plan": plan, "full_scans": scans, "ok": not scans}
+        )
+    return report
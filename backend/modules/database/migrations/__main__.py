@@ -0,0 +1,31 @@
+import argparse
+from modules.database.session import users_engine
+from modules.database.migrations.runner import applied_revisions, load_revisions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m modules.database.migrations",
+        description="Apply or list the schema migrations of the users database.",
+    )
+    parser.add_argument(
+        "command", nargs="?", default="upgrade", choices=["upgrade", "status"]
+    )
+    args = parser.parse_args()
+
+    if args.command == "status":
+        applied = applied_revisions(users_engine)
+        for module in load_revisions():
+            state = "applied" if module.revision in applied else "pending"
+            print(f"{module.revision}  {state:8} {module.description}")
+        return
+
+    # Même initialisation que l'API : tables sans révision (create_all), puis révisions
+    from modules.api.users.create_db import init_users_db
+
+    revisions = init_users_db()
+    print(f"Applied: {', '.join(revisions)}" if revisions else "Already up to date.")
+
+
+if __name__ == "__main__":
+    main()
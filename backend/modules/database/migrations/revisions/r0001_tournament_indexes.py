@@ -0,0 +1,43 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from utils.logger_config import configure_logger
+
+logger = configure_logger()
+
+revision = "0001"
+description = "Composite indexes on tournament tables, unique registrations"
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_pool_participant_participant "
+    "ON pool_participant_association (participant_id)",
+    "CREATE INDEX IF NOT EXISTS ix_participant_tournament ON participants (tournament_id)",
+    "CREATE INDEX IF NOT EXISTS ix_participant_member_user "
+    "ON participant_members (user_id, participant_id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_registration_tournament_user "
+    "ON tournament_registrations (tournament_id, user_id)",
+    "CREATE INDEX IF NOT EXISTS ix_pool_tournament ON pools (tournament_id)",
+    "CREATE INDEX IF NOT EXISTS ix_match_tournament_pool "
+    "ON matches (tournament_id, pool_id)",
+    "CREATE INDEX IF NOT EXISTS ix_match_pool_status ON matches (pool_id, status)",
+    "CREATE INDEX IF NOT EXISTS ix_match_player_participant "
+    "ON match_players (participant_id, match_id, score)",
+]
+
+
+def upgrade(engine: Engine):
+    # Doublons d'inscription supprimés (on garde la plus ancienne) avant l'index unique
+    with engine.begin() as conn:
+        removed = conn.execute(
+            text(
+                "DELETE FROM tournament_registrations WHERE id NOT IN ("
+                "SELECT MIN(id) FROM tournament_registrations "
+                "GROUP BY tournament_id, user_id)"
+            )
+        ).rowcount
+        if removed:
+            logger.warning(f"{removed} duplicate tournament registration(s) removed.")
+
+    # Un index par transaction : les écritures ne sont bloquées que le temps d'un index
+    for statement in INDEXES:
+        with engine.begin() as conn:
+            conn.execute(text(statement))
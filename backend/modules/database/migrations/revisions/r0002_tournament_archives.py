@@ -0,0 +1,18 @@
+from sqlalchemy.engine import Engine
+
+revision = "0002"
+description = "Archive tables for finished tournaments"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.users.models import User  # noqa: F401
+    from modules.api.tournaments.models import (
+        TournamentArchive,
+        TournamentArchiveResult,
+    )
+
+    # Archives des tournois existants : révision 0011, une fois le schéma à jour
+    with engine.begin() as conn:
+        TournamentArchive.__table__.create(conn, checkfirst=True)
+        TournamentArchiveResult.__table__.create(conn, checkfirst=True)
@@ -0,0 +1,39 @@
+from sqlalchemy.engine import Engine
+from modules.database.migrations.runner import rebuild_tables
+
+revision = "0003"
+description = "ON DELETE CASCADE on tournament foreign keys"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.users.models import User  # noqa: F401
+    from modules.api.tournaments.models import (
+        Match,
+        MatchPlayer,
+        Participant,
+        ParticipantMember,
+        Pool,
+        TournamentArchive,
+        TournamentArchiveResult,
+        TournamentPayment,
+        TournamentRegistration,
+        pool_participant_association,
+    )
+
+    # SQLite ne sait pas modifier une contrainte : les tables enfants sont recréées
+    rebuild_tables(
+        engine,
+        [
+            TournamentRegistration.__table__,
+            Participant.__table__,
+            ParticipantMember.__table__,
+            Pool.__table__,
+            pool_participant_association,
+            Match.__table__,
+            MatchPlayer.__table__,
+            TournamentPayment.__table__,
+            TournamentArchive.__table__,
+            TournamentArchiveResult.__table__,
+        ],
+    )
@@ -0,0 +1,20 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+revision = "0004"
+description = "Next-match links for elimination brackets"
+
+
+def upgrade(engine: Engine):
+    # create_all a pu créer la table avec les colonnes : ajout seulement si absentes
+    columns = {column["name"] for column in inspect(engine).get_columns("matches")}
+    with engine.begin() as conn:
+        if "next_match_id" not in columns:
+            conn.execute(
+                text(
+                    "ALTER TABLE matches ADD COLUMN next_match_id INTEGER "
+                    "REFERENCES matches(id) ON DELETE SET NULL"
+                )
+            )
+        if "next_slot" not in columns:
+            conn.execute(text("ALTER TABLE matches ADD COLUMN next_slot INTEGER"))
@@ -0,0 +1,22 @@
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+revision = "0005"
+description = "Player ratings, computed from the existing results"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.users.models import User  # noqa: F401
+    import modules.api.tournaments.models  # noqa: F401
+    from modules.api.ratings.models import PlayerRating, RatingHistory
+    from modules.api.ratings.functions import replay_ratings
+
+    with engine.begin() as conn:
+        PlayerRating.__table__.create(conn, checkfirst=True)
+        RatingHistory.__table__.create(conn, checkfirst=True)
+
+    # Rejeu en mémoire : une lecture, puis deux insertions groupées
+    with Session(bind=engine) as db:
+        replay_ratings(db)
+        db.commit()
@@ -0,0 +1,16 @@
+from sqlalchemy.engine import Engine
+
+revision = "0006"
+description = "Per-player statistics and match history tables"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.users.models import User  # noqa: F401
+    import modules.api.tournaments.models  # noqa: F401
+    from modules.api.stats.models import PlayerMatch, PlayerStats
+
+    # Tables remplies par la révision 0007, qui reconstruit aussi les confrontations
+    with engine.begin() as conn:
+        PlayerStats.__table__.create(conn, checkfirst=True)
+        PlayerMatch.__table__.create(conn, checkfirst=True)
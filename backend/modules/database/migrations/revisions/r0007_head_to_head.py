@@ -0,0 +1,21 @@
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+revision = "0007"
+description = "Head-to-head records between players, built from the results"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.users.models import User  # noqa: F401
+    import modules.api.tournaments.models  # noqa: F401
+    from modules.api.stats.models import HeadToHead
+    from modules.api.stats.functions import rebuild_player_stats
+
+    with engine.begin() as conn:
+        HeadToHead.__table__.create(conn, checkfirst=True)
+
+    # Reconstruction groupée : statistiques et confrontations en une passe
+    with Session(bind=engine) as db:
+        rebuild_player_stats(db)
+        db.commit()
@@ -0,0 +1,12 @@
+from sqlalchemy.engine import Engine
+
+revision = "0008"
+description = "Inbox of the Stripe webhook events"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.stripe.models import StripeEvent
+
+    with engine.begin() as conn:
+        StripeEvent.__table__.create(conn, checkfirst=True)
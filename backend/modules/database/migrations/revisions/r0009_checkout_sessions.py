@@ -0,0 +1,12 @@
+from sqlalchemy.engine import Engine
+
+revision = "0009"
+description = "Open Stripe Checkout Sessions reused per user and tournament"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.stripe.models import CheckoutSession
+
+    with engine.begin() as conn:
+        CheckoutSession.__table__.create(conn, checkfirst=True)
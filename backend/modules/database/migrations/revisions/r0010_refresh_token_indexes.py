@@ -0,0 +1,18 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+revision = "0010"
+description = "Indexes on refresh tokens for revocation and pruning"
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_refresh_token_user_revoked "
+    "ON refresh_tokens (user_id, revoked)",
+    "CREATE INDEX IF NOT EXISTS ix_refresh_token_expires ON refresh_tokens (expires_at)",
+]
+
+
+def upgrade(engine: Engine):
+    # Un index par transaction : les écritures ne sont bloquées que le temps d'un index
+    for statement in INDEXES:
+        with engine.begin() as conn:
+            conn.execute(text(statement))
@@ -0,0 +1,35 @@
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from modules.database.migrations.runner import backfill
+
+revision = "0011"
+description = "Snapshot the finished tournaments that have no archive yet"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer.
+    # Les builders lisent les modèles courants : l'archivage vient après les
+    # révisions qui modifient le schéma des matchs (0003, 0004)
+    from modules.api.users.models import User  # noqa: F401
+    import modules.api.tournaments.models  # noqa: F401
+    from modules.api.tournaments.archive import snapshot_tournament
+    from modules.api.stats.functions import refresh_best_finishes
+
+    def apply_batch(conn, rows):
+        with Session(bind=conn) as db:
+            for row in rows:
+                snapshot_tournament(db, row.id)
+                db.flush()
+                # Statistiques construites en 0007, avant l'existence des archives
+                refresh_best_finishes(db, row.id)
+            db.flush()
+
+    backfill(
+        engine,
+        "tournament archives",
+        "SELECT id FROM tournaments WHERE status = 'finished' AND id > :last_key "
+        "AND id NOT IN (SELECT tournament_id FROM tournament_archives) "
+        "ORDER BY id LIMIT :batch_size",
+        apply_batch,
+        batch_size=20,
+    )
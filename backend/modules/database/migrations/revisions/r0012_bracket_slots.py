@@ -0,0 +1,37 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+
+revision = "0012"
+description = "Side of each player in the elimination bracket matches"
+
+
+def upgrade(engine: Engine):
+    # create_all (ou la reconstruction 0003) a pu créer la colonne : ajout si absente
+    columns = {
+        column["name"] for column in inspect(engine).get_columns("match_players")
+    }
+    with engine.begin() as conn:
+        if "slot" not in columns:
+            conn.execute(text("ALTER TABLE match_players ADD COLUMN slot INTEGER"))
+        # Qualifié : place donnée par le match d'où il vient
+        conn.execute(
+            text(
+                "UPDATE match_players SET slot = ("
+                "SELECT feeder.next_slot FROM matches feeder "
+                "JOIN match_players entrant ON entrant.match_id = feeder.id "
+                "WHERE feeder.next_match_id = match_players.match_id "
+                "AND entrant.participant_id = match_players.participant_id) "
+                "WHERE slot IS NULL"
+            )
+        )
+        # Exempté : la place que son unique match d'origine ne remplit pas
+        conn.execute(
+            text(
+                "UPDATE match_players SET slot = 1 - ("
+                "SELECT MIN(feeder.next_slot) FROM matches feeder "
+                "WHERE feeder.next_match_id = match_players.match_id) "
+                "WHERE slot IS NULL AND ("
+                "SELECT COUNT(*) FROM matches feeder "
+                "WHERE feeder.next_match_id = match_players.match_id) = 1"
+            )
+        )
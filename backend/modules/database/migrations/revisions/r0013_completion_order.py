@@ -0,0 +1,44 @@
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+revision = "0013"
+description = "Completion rank of the matches, used to order ratings and stats"
+
+
+def upgrade(engine: Engine):
+    # Imports locaux : la révision n'est chargée que lorsqu'elle doit s'appliquer
+    from modules.api.users.models import User  # noqa: F401
+    import modules.api.tournaments.models  # noqa: F401
+    from modules.api.ratings.functions import replay_ratings
+    from modules.api.stats.functions import rebuild_player_stats
+
+    # create_all (ou les révisions 0003 et 0005) a pu créer les colonnes : ajout si absentes
+    inspector = inspect(engine)
+    match_columns = {column["name"] for column in inspector.get_columns("matches")}
+    history_columns = {
+        column["name"] for column in inspector.get_columns("rating_history")
+    }
+    with engine.begin() as conn:
+        if "completion_seq" not in match_columns:
+            conn.execute(text("ALTER TABLE matches ADD COLUMN completion_seq INTEGER"))
+        if "sequence" not in history_columns:
+            conn.execute(text("ALTER TABLE rating_history ADD COLUMN sequence INTEGER"))
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_match_completion_seq "
+                "ON matches (completion_seq)"
+            )
+        )
+        conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS ix_rating_history_sequence "
+                "ON rating_history (sequence)"
+            )
+        )
+
+    # Matchs existants rangés par date puis id, et historiques recalculés dans cet ordre
+    with Session(bind=engine) as db:
+        replay_ratings(db)
+        rebuild_player_stats(db)
+        db.commit()
@@ -0,0 +1,223 @@
+import importlib
+import os
+import pkgutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+from sqlalchemy import Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.schema import CreateTable
+from modules.database.config import USERS_DATABASE_PATH
+from utils.logger_config import configure_logger
+from dotenv import load_dotenv
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou fichier POSIX
+    fcntl = None
+
+load_dotenv()
+
+logger = configure_logger()
+
+REVISIONS_DIR = Path(__file__).parent / "revisions"
+REVISIONS_PACKAGE = "modules.database.migrations.revisions"
+
+# Verrou partagé par les workers : un seul applique les migrations, les autres attendent
+MIGRATIONS_LOCK_PATH = Path(USERS_DATABASE_PATH).parent / "migrations.lock"
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "500"))
+BACKFILL_PAUSE_SECONDS = float(os.getenv("BACKFILL_PAUSE_SECONDS", "0.05"))
+
+
+@contextmanager
+def migration_lock():
+    """
+    Hold the exclusive migrations lock (blocking) for the duration of the block.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(MIGRATIONS_LOCK_PATH, "a+") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def load_revisions() -> list:
+    """
+    Import the revision scripts (`rNNNN_name.py`), sorted by revision id.
+    Each script defines `revision`, `description` and `upgrade(engine)`.
+    """
+    revisions = []
+    for module_info in pkgutil.iter_modules([str(REVISIONS_DIR)]):
+        if not module_info.name.startswith("r"):
+            continue
+        module = importlib.import_module(f"{REVISIONS_PACKAGE}.{module_info.name}")
+        revisions.append(module)
+    return sorted(revisions, key=lambda module: module.revision)
+
+
+def _ensure_migrations_table(engine: Engine):
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "revision VARCHAR PRIMARY KEY, "
+                "description VARCHAR, "
+                "applied_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+            )
+        )
+
+
+def applied_revisions(engine: Engine) -> set:
+    _ensure_migrations_table(engine)
+    with engine.connect() as conn:
+        return set(
+            conn.execute(text("SELECT revision FROM schema_migrations")).scalars()
+        )
+
+
+def _record(engine: Engine, module):
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO schema_migrations (revision, description) "
+                "VALUES (:revision, :description)"
+            ),
+            {"revision": module.revision, "description": module.description},
+        )
+
+
+def run_migrations(engine: Engine, stamp_only: bool = False) -> list:
+    """
+    Apply the pending revisions in order and return their ids.
+
+    With `stamp_only` (database just created by create_all, already up to date)
+    the revisions are recorded as applied without running them.
+    """
+    applied = applied_revisions(engine)
+    pending = [m for m in load_revisions() if m.revision not in applied]
+
+    for module in pending:
+        if stamp_only:
+            _record(engine, module)
+            continue
+
+        logger.info(f"Applying migration {module.revision}: {module.description}")
+        start = time.perf_counter()
+        module.upgrade(engine)
+        _record(engine, module)
+        logger.info(
+            f"Migration {module.revision} applied in "
+            f"{round(time.perf_counter() - start, 2)} s."
+        )
+
+    return [module.revision for module in pending]
+
+
+def backfill(
+    engine: Engine,
+    description: str,
+    select_batch: str,
+    apply_batch: Callable[[Connection, list], None],
+    batch_size: int = BACKFILL_BATCH_SIZE,
+    total: Optional[int] = None,
+) -> int:
+    """
+    Copy/compute data in small transactions so the API is never blocked for long.
+
+    `select_batch` is a SELECT whose first column is a unique increasing key, using
+    the `:last_key` and `:batch_size` parameters, e.g.
+    `SELECT id, ... FROM t WHERE id > :last_key ORDER BY id LIMIT :batch_size`.
+    Each batch is passed to `apply_batch(conn, rows)` and committed on its own,
+    so the backfill can be resumed after an interruption. Returns the row count.
+    """
+    last_key = -1
+    done = 0
+    while True:
+        with engine.begin() as conn:
+            rows = conn.execute(
+                text(select_batch), {"last_key": last_key, "batch_size": batch_size}
+            ).all()
+            if not rows:
+                break
+            apply_batch(conn, rows)
+
+        done += len(rows)
+        last_key = rows[-1][0]
+        progress = f"{done}/{total}" if total is not None else str(done)
+        logger.info(f"Backfill '{description}': {progress} rows")
+        # Laisse passer les écritures des autres workers entre deux lots
+        time.sleep(BACKFILL_PAUSE_SECONDS)
+
+    return done
+
+
+def rebuild_tables(engine: Engine, tables: list):
+    """
+    Recreate tables from their current model definition, keeping their rows
+    (SQLite cannot ALTER constraints such as foreign keys).
+
+    Follows the SQLite procedure: foreign keys off, then in one transaction
+    create `<table>__new`, copy the common columns, drop the old table, rename,
+    recreate the indexes. Rows whose ON DELETE CASCADE parent no longer exists
+    are removed.
+    """
+    with engine.connect() as conn:
+        # Le PRAGMA est sans effet dans une transaction : il est validé à part
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.commit()
+        try:
+            # BEGIN explicite : pysqlite n'ouvre pas de transaction pour le DDL
+            conn.exec_driver_sql("BEGIN")
+            for table in tables:
+                _rebuild_table(conn, table)
+            _delete_orphans(conn, tables)
+            conn.commit()
+        finally:
+            conn.rollback()
+            conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+            conn.commit()
+
+
+def _rebuild_table(conn: Connection, table: Table):
+    old_columns = {column["name"] for column in inspect(conn).get_columns(table.name)}
+    columns = ", ".join(f'"{c.name}"' for c in table.columns if c.name in old_columns)
+    tmp_name = f"{table.name}__new"
+
+    create_sql = str(CreateTable(table).compile(dialect=conn.dialect))
+    create_sql = create_sql.replace(
+        f"CREATE TABLE {table.name} ", f'CREATE TABLE "{tmp_name}" ', 1
+    )
+    conn.execute(text(create_sql))
+    conn.execute(
+        text(
+            f'INSERT INTO "{tmp_name}" ({columns}) SELECT {columns} FROM "{table.name}"'
+        )
+    )
+    conn.execute(text(f'DROP TABLE "{table.name}"'))
+    conn.execute(text(f'ALTER TABLE "{tmp_name}" RENAME TO "{table.name}"'))
+    for index in table.indexes:
+        index.create(conn)
+
+
+def _delete_orphans(conn: Connection, tables: list):
+    for table in tables:
+        orphans = conn.exec_driver_sql(f'PRAGMA foreign_key_check("{table.name}")')
+        # Seules les lignes dont le parent est supprimé en cascade sont retirées
+        cascading = {
+            fk.column.table.name
+            for fk in table.foreign_keys
+            if (fk.ondelete or "").upper() == "CASCADE"
+        }
+        rowids = sorted({row[1] for row in orphans if row[2] in cascading})
+        if rowids:
+            conn.execute(
+                text(f'DELETE FROM "{table.name}" WHERE rowid = :rowid'),
+                [{"rowid": rowid} for rowid in rowids],
+            )
+            logger.warning(f"{len(rowids)} orphan row(s) removed from {table.name}.")
@@ -1,12 +1,22 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from modules.database.config import USERS_DATABASE_URL
 
 # Separate Base declarations for each database
 UsersBase = declarative_base()
 
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL + busy_timeout : plusieurs workers peuvent lire pendant qu'un autre écrit
+    # foreign_keys : active les ON DELETE CASCADE (désactivé par défaut dans SQLite)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
 def create_session(database_url: str):
     engine = create_engine(database_url, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", set_sqlite_pragmas)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
     return engine, SessionLocal
 
@@ -0,0 +1,66 @@
+import os
+from typing import Dict, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from utils.logger_config import configure_logger
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = configure_logger()
+
+# Lignes examinées par index lors d'un ANALYZE (0 : analyse complète)
+ANALYZE_LIMIT = int(os.getenv("ANALYZE_LIMIT", "1000"))
+
+
+def analyze_database(engine: Optional[Engine] = None):
+    """
+    Refresh sqlite_stat1, used by the query planner and by the admin table
+    counts. With analysis_limit the cost is bounded per index and the row
+    counts of large tables become estimates.
+    """
+    if engine is None:
+        from modules.database.session import users_engine as engine
+
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"PRAGMA analysis_limit={ANALYZE_LIMIT}")
+            conn.exec_driver_sql("ANALYZE")
+    except Exception as e:
+        logger.exception(f"Error during ANALYZE: {e}")
+        return
+    logger.info("SQLite statistics refreshed (ANALYZE).")
+
+
+def table_row_counts(db: Session) -> Dict[str, int]:
+    """
+    Row count of each table as recorded by the last ANALYZE (first number of
+    the sqlite_stat1 entries), without reading the tables. Empty if the
+    database was never analyzed.
+    """
+    try:
+        rows = db.execute(
+            text(
+                "SELECT tbl, MAX(CAST(stat AS INTEGER)) AS row_count "
+                "FROM sqlite_stat1 GROUP BY tbl"
+            )
+        )
+    except OperationalError:  # pas encore de sqlite_stat1
+        return {}
+    return {row.tbl: row.row_count for row in rows}
+
+
+def table_page_counts(db: Session) -> Optional[Dict[str, int]]:
+    """
+    Size in pages of each table and index, from the dbstat virtual table;
+    None when SQLite was built without it.
+    """
+    try:
+        rows = db.execute(
+            text("SELECT name, pageno AS pages FROM dbstat WHERE aggregate = TRUE")
+        )
+    except OperationalError:
+        return None
+    return {row.name: row.pages for row in rows}
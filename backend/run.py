@@ -6,6 +6,14 @@ from dotenv import load_dotenv
 load_dotenv()
 
 PORT_BACK = int(os.getenv("PORT_BACK"))
+# Nombre de processus uvicorn ; un seul d'entre eux exécute le scheduler
+WORKERS = int(os.getenv("WORKERS", "1"))
 
 if __name__ == "__main__":
-    uvicorn.run("modules.api.main:app", host="0.0.0.0", port=PORT_BACK, reload=False)
+    uvicorn.run(
+        "modules.api.main:app",
+        host="0.0.0.0",
+        port=PORT_BACK,
+        reload=False,
+        workers=WORKERS,
+    )
@@ -4,11 +4,22 @@ import shutil
 from pathlib import Path
 import sqlite3
 from modules.database.config import USERS_DATABASE_PATH
+from modules.database.analytics import ANALYTICS_REFRESH_SECONDS, refresh_analytics_replica
+from modules.database.table_stats import analyze_database
+from modules.database.health import HEALTH_INTEGRITY_CHECK_HOURS, HEALTH_QUICK_CHECK_HOURS, run_deep_check
+from modules.api.stripe.functions import STRIPE_EVENTS_SWEEP_SECONDS, process_pending_stripe_events
+from modules.api.auth.functions import REFRESH_TOKENS_PRUNE_HOURS, prune_stale_refresh_tokens
 from utils.logger_config import configure_logger
 import atexit
 import os
+import threading
 from dotenv import load_dotenv
 
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou fichier POSIX
+    fcntl = None
+
 load_dotenv()
 
 APP_NAME = os.getenv("APP_NAME")
@@ -20,6 +31,13 @@ BACKUP_DIR = BASE_DIR / "backups"
 BACKUP_DIR.mkdir(exist_ok=True)
 MAX_BACKUPS = 10
 
+# Verrou partagé par les workers : seul le détenteur exécute les tâches planifiées
+SCHEDULER_LOCK_PATH = Path(USERS_DATABASE_PATH).parent / "scheduler.lock"
+SCHEDULER_LEASE_RETRY_SECONDS = int(os.getenv("SCHEDULER_LEASE_RETRY_SECONDS", "30"))
+
+_lease_file = None
+_lease_wait = None  # (événement d'arrêt, thread) du worker suiveur
+
 def backup_sqlite():
     now = datetime.now().strftime("%Y%m%d_%H%M%S")
     db_path = Path(USERS_DATABASE_PATH)
@@ -53,9 +71,89 @@ def cleanup_old_backups():
     except Exception as e:
         logger.error(f"Error cleaning up old backups: {e}")
 
-def start_scheduler():
+def acquire_scheduler_lease() -> bool:
+    """
+    Tente de prendre le verrou exclusif du scheduler (non bloquant).
+    Le verrou est libéré par le système à la mort du processus qui le détient.
+    """
+    global _lease_file
+
+    if _lease_file is not None:
+        return True
+    if fcntl is None:
+        return True
+
+    lease_file = open(SCHEDULER_LOCK_PATH, "a+")
+    try:
+        fcntl.flock(lease_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lease_file.close()
+        return False
+
+    lease_file.seek(0)
+    lease_file.truncate()
+    lease_file.write(str(os.getpid()))
+    lease_file.flush()
+    _lease_file = lease_file
+    return True
+
+
+def is_scheduler_leader() -> bool:
+    return _lease_file is not None or fcntl is None
+
+
+def _run_scheduler():
     scheduler = BackgroundScheduler()
     scheduler.add_job(backup_sqlite, 'interval', days=1, next_run_time=datetime.now())
+    # Statistiques sqlite_stat1 avant la première copie du réplica analytique
+    analyze_database()
+    scheduler.add_job(analyze_database, 'interval', hours=6)
+    # Vérifications d'intégrité en arrière-plan ; /admin/monitor/health lit leurs résultats
+    scheduler.add_job(run_deep_check, 'interval', hours=HEALTH_QUICK_CHECK_HOURS, args=["quick_check"], next_run_time=datetime.now())
+    scheduler.add_job(run_deep_check, 'interval', hours=HEALTH_INTEGRITY_CHECK_HOURS, args=["integrity_check"])
+    # Événements Stripe restés en attente (worker interrompu, erreur passagère)
+    scheduler.add_job(process_pending_stripe_events, 'interval', seconds=STRIPE_EVENTS_SWEEP_SECONDS, max_instances=1)
+    # Jetons de rafraîchissement expirés ou révoqués
+    scheduler.add_job(prune_stale_refresh_tokens, 'interval', hours=REFRESH_TOKENS_PRUNE_HOURS, max_instances=1, next_run_time=datetime.now())
+    if ANALYTICS_REFRESH_SECONDS > 0:
+        scheduler.add_job(refresh_analytics_replica, 'interval', seconds=ANALYTICS_REFRESH_SECONDS, next_run_time=datetime.now())
     scheduler.start()
-    logger.info("Automatic backup scheduler started.")
+    logger.info(f"Automatic backup scheduler started (leader pid {os.getpid()}).")
     atexit.register(lambda: scheduler.shutdown())
+
+
+def _wait_for_lease(stop_event: threading.Event):
+    # Un worker suiveur reprend le scheduler si le leader disparaît
+    while not stop_event.wait(SCHEDULER_LEASE_RETRY_SECONDS):
+        if acquire_scheduler_lease():
+            _run_scheduler()
+            return
+
+
+def start_scheduler():
+    if acquire_scheduler_lease():
+        _run_scheduler()
+        return
+
+    logger.info(
+        f"Scheduler lease held by another worker, pid {os.getpid()} serves requests only."
+    )
+    global _lease_wait
+    stop_event = threading.Event()
+    thread = threading.Thread(
+        target=_wait_for_lease, args=(stop_event,), daemon=True, name="scheduler-lease"
+    )
+    thread.start()
+    _lease_wait = (stop_event, thread)
+    atexit.register(stop_lease_wait)
+
+
+def stop_lease_wait():
+    """Stop the follower's lease retry thread, if any."""
+    global _lease_wait
+    if _lease_wait is None:
+        return
+    stop_event, thread = _lease_wait
+    stop_event.set()
+    thread.join()
+    _lease_wait = None
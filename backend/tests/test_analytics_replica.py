@@ -0,0 +1,49 @@
+import sqlite3
+import pytest
+from sqlalchemy import text
+
+from modules.database import analytics, config
+from modules.database.analytics import (
+    analytics_session_factory,
+    refresh_analytics_replica,
+)
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    source = tmp_path / "badarts.db"
+    replica = tmp_path / "badarts_analytics.db"
+    monkeypatch.setattr(config, "USERS_DATABASE_PATH", source)
+    monkeypatch.setattr(config, "ANALYTICS_DATABASE_PATH", replica)
+    monkeypatch.setattr(analytics, "ANALYTICS_REFRESH_SECONDS", 300)
+    with sqlite3.connect(source) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE scores (id INTEGER PRIMARY KEY, value INTEGER)")
+        conn.execute("INSERT INTO scores (value) VALUES (1)")
+    return source, replica
+
+
+def count_scores():
+    with analytics_session_factory()() as db:
+        return db.execute(text("SELECT COUNT(*) FROM scores")).scalar()
+
+
+def test_no_replica_falls_back_to_main_database(paths):
+    assert analytics_session_factory() is None
+
+
+def test_replica_is_a_read_only_snapshot(paths):
+    source, replica = paths
+    assert refresh_analytics_replica()
+    assert count_scores() == 1
+
+    # Écritures sur la base principale : visibles au rafraîchissement suivant
+    with sqlite3.connect(source) as conn:
+        conn.execute("INSERT INTO scores (value) VALUES (2)")
+    assert count_scores() == 1
+    assert refresh_analytics_replica()
+    assert count_scores() == 2
+
+    with analytics_session_factory()() as db:
+        with pytest.raises(Exception, match="readonly|read-only|query_only"):
+            db.execute(text("INSERT INTO scores (value) VALUES (3)"))
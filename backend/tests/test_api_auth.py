@@ -1,3 +1,7 @@
+import json
+import os
+import subprocess
+import sys
 import pytest
 from unittest.mock import patch
 
@@ -28,3 +32,28 @@ def test_routes_exist(client):
     paths = response.json().get("paths", {}).keys()
     assert any(p.startswith("/auth") for p in paths)
     assert any(p.startswith("/users") for p in paths)
+
+
+STARTUP_CHECK = """
+import json
+from unittest.mock import patch
+with patch("modules.api.users.create_db.init_users_db"):
+    from modules.api.main import create_app
+    create_app()
+from utils.startup_report import get_startup_report
+print(json.dumps(get_startup_report()["heavy_modules_loaded"]))
+"""
+
+
+def test_heavy_modules_not_loaded_at_startup():
+    # Interpréteur neuf : les imports des autres tests ne faussent pas le constat
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_CHECK],
+        cwd=backend,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    assert loaded and not any(loaded.values())
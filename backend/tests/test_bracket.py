@@ -0,0 +1,182 @@
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User  # noqa: F401
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    Pool,
+    Tournament,
+    pool_participant_association,
+)
+from modules.api.tournaments.schemas import MatchUpdate
+from modules.api.tournaments.bracket import (
+    generate_bracket,
+    seed_positions,
+    seeds_from_pools,
+)
+from modules.api.tournaments.routes.brackets import build_bracket
+from modules.api.tournaments.routes.matches import update_match
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(
+        Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1), mode="double")
+    )
+    session.add_all(
+        Participant(id=i, tournament_id=1, name=f"Team {i}") for i in range(1, 7)
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def players(db, match_id):
+    return set(
+        db.scalars(
+            select(MatchPlayer.participant_id).where(MatchPlayer.match_id == match_id)
+        )
+    )
+
+
+def test_seed_positions():
+    assert seed_positions(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+
+
+def test_bracket_with_byes(db):
+    assert generate_bracket(db, 1, [1, 2, 3, 4, 5, 6]) == 8
+    db.commit()
+
+    bracket = build_bracket(db, 1)
+    assert [len(r.matches) for r in bracket.rounds] == [2, 2, 1]
+    semis = bracket.rounds[1].matches
+    # Têtes de série 1 et 2 exemptées du premier tour
+    assert [[p.id for p in m.participants] for m in semis] == [[1], [2]]
+    first_round = bracket.rounds[0].matches
+    assert [{p.id for p in m.participants} for m in first_round] == [{4, 5}, {3, 6}]
+    assert {m.next_match_id for m in first_round} == {m.id for m in semis}
+    assert all(m.next_match_id == bracket.rounds[2].matches[0].id for m in semis)
+
+
+def test_winner_advances_and_is_replaced_on_correction(db):
+    generate_bracket(db, 1, [1, 2, 3, 4])
+    db.commit()
+    semi = db.scalars(
+        select(Match).where(Match.round == 1).order_by(Match.id).limit(1)
+    ).one()
+    a, b = sorted(players(db, semi.id))
+
+    update_match(
+        semi.id,
+        MatchUpdate(
+            status="completed",
+            scores=[
+                {"participant_id": a, "score": 3},
+                {"participant_id": b, "score": 1},
+            ],
+        ),
+        db,
+    )
+    assert players(db, semi.next_match_id) == {a}
+
+    update_match(
+        semi.id,
+        MatchUpdate(
+            scores=[
+                {"participant_id": a, "score": 0},
+                {"participant_id": b, "score": 3},
+            ]
+        ),
+        db,
+    )
+    assert players(db, semi.next_match_id) == {b}
+
+
+def test_seeds_from_pools_interleaves_ranks(db):
+    db.add_all(
+        [Pool(id=1, tournament_id=1, name="A"), Pool(id=2, tournament_id=1, name="B")]
+    )
+    db.flush()
+    db.execute(
+        pool_participant_association.insert(),
+        [
+            {"pool_id": 1, "participant_id": 1},
+            {"pool_id": 1, "participant_id": 2},
+            {"pool_id": 2, "participant_id": 3},
+            {"pool_id": 2, "participant_id": 4},
+        ],
+    )
+    db.add_all(
+        [
+            Match(id=1, tournament_id=1, pool_id=1, status="completed"),
+            Match(id=2, tournament_id=1, pool_id=2, status="completed"),
+        ]
+    )
+    db.add_all(
+        [
+            MatchPlayer(match_id=1, participant_id=1, score=1),
+            MatchPlayer(match_id=1, participant_id=2, score=3),
+            MatchPlayer(match_id=2, participant_id=3, score=3),
+            MatchPlayer(match_id=2, participant_id=4, score=2),
+        ]
+    )
+    db.commit()
+
+    # Premiers de poule d'abord (3 manches chacun, ordre stable), puis les seconds
+    assert seeds_from_pools(db, 1) == [2, 3, 4, 1]
+    assert seeds_from_pools(db, 1, qualifiers_per_pool=1) == [2, 3]
+
+
+def complete(db, match, winner, loser):
+    update_match(
+        match.id,
+        MatchUpdate(
+            status="completed",
+            scores=[
+                {"participant_id": winner, "score": 3},
+                {"participant_id": loser, "score": 0},
+            ],
+        ),
+        db,
+    )
+
+
+def test_final_sides_follow_the_slots_not_the_finish_order(db):
+    generate_bracket(db, 1, [1, 2, 3, 4])
+    db.commit()
+    top, bottom = db.scalars(
+        select(Match).where(Match.round == 1).order_by(Match.next_slot)
+    ).all()
+
+    # Demi-finale du bas terminée la première
+    complete(db, bottom, 2, 3)
+    complete(db, top, 1, 4)
+
+    final = build_bracket(db, 1).rounds[-1].matches[0]
+    assert [p.id for p in final.participants] == [1, 2]
+
+
+def test_manual_match_does_not_block_generation(db):
+    db.add(Match(tournament_id=1, status="pending"))
+    db.commit()
+
+    assert generate_bracket(db, 1, [1, 2, 3, 4]) == 4
+    with pytest.raises(HTTPException, match="400"):
+        generate_bracket(db, 1, [1, 2, 3, 4])
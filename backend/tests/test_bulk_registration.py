@@ -0,0 +1,94 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.users.schemas import TokenData
+from modules.api.tournaments.models import (
+    Participant,
+    ParticipantMember,
+    Tournament,
+    TournamentRegistration,
+)
+from modules.api.tournaments.schemas import BulkRegistrationCreate
+from modules.api.tournaments.routes.tournaments import register_players_bulk
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+ADMIN = TokenData(sub="admin@test.fr", exp=0, role="admin", scopes=["admin"])
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(
+        Tournament(id=1, name="Doubles", start_date=datetime(2025, 5, 1), mode="double")
+    )
+    session.add_all(
+        User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1) for i in range(1, 7)
+    )
+    session.add(TournamentRegistration(user_id=6, tournament_id=1))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_bulk_registration_reports_each_item(db):
+    response = register_players_bulk(
+        BulkRegistrationCreate(
+            tournament_id=1,
+            items=[
+                {"user_ids": [1, 2], "name": "Team A"},
+                {"user_ids": [3, 99], "name": "Ghost"},
+                {"user_ids": [4, 6], "name": "Late"},
+                {"user_ids": [2, 5], "name": "Twice"},
+                {"user_ids": [4, 5]},
+                {"user_id": 3},
+            ],
+        ),
+        db,
+        ADMIN,
+    )
+
+    assert (response.registered, response.failed) == (2, 4)
+    assert [(r.status, r.detail) for r in response.results] == [
+        ("registered", None),
+        ("error", "User 99 not found"),
+        ("error", "User 6 already registered"),
+        ("error", "User 2 already registered"),
+        ("error", "Team name required for team creation"),
+        ("registered", None),
+    ]
+    team = db.get(Participant, response.results[0].participant_id)
+    assert team.name == "Team A"
+    assert {m.user_id for m in team.members} == {1, 2}
+    # Joueur seul en double : inscrit sans participant
+    assert response.results[5].participant_id is None
+    assert db.query(TournamentRegistration).count() == 4
+    assert db.query(ParticipantMember).count() == 2
+
+
+def test_single_mode_ignores_item_name(db):
+    db.get(Tournament, 1).mode = "single"
+    db.commit()
+
+    response = register_players_bulk(
+        BulkRegistrationCreate(
+            tournament_id=1, items=[{"user_id": 1, "name": "Nickname override"}]
+        ),
+        db,
+        ADMIN,
+    )
+
+    # Même participant que l'inscription unitaire : sans nom, le pseudo est affiché
+    assert db.get(Participant, response.results[0].participant_id).name is None
@@ -0,0 +1,226 @@
+import pytest
+from unittest.mock import patch
+from fastapi import HTTPException
+from datetime import datetime
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase, set_sqlite_pragmas
+from modules.api.users.models import Role, User
+from modules.api.users.schemas import TokenData
+from modules.api.users.routes import delete_user
+from modules.api.licences.models import Licence
+from modules.api.ratings.functions import replay_ratings
+from modules.api.ratings.models import PlayerRating, RatingHistory
+from modules.api.stats.functions import rebuild_player_stats
+from modules.api.stats.models import HeadToHead, PlayerStats
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Pool,
+    Tournament,
+    TournamentPayment,
+    TournamentRegistration,
+    pool_participant_association,
+)
+from modules.api.tournaments.routes.tournaments import (
+    delete_participant,
+    delete_tournament,
+    reset_tournament,
+    update_tournament,
+)
+from modules.api.tournaments.schemas import TournamentUpdate
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+event.listen(engine, "connect", set_sqlite_pragmas)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+ADMIN = TokenData(sub="admin@test.fr", exp=0, role="admin", scopes=["admin"])
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(Role(id=1, role="user"))
+    session.flush()
+    session.add_all(
+        User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1) for i in (1, 2)
+    )
+    session.add(
+        Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1), mode="single")
+    )
+    session.add(Pool(id=1, tournament_id=1, name="A"))
+    for user_id in (1, 2):
+        session.add(TournamentRegistration(user_id=user_id, tournament_id=1))
+        session.add(Participant(id=user_id, tournament_id=1))
+        session.add(ParticipantMember(participant_id=user_id, user_id=user_id))
+    session.flush()
+    session.execute(
+        pool_participant_association.insert(),
+        [{"pool_id": 1, "participant_id": p_id} for p_id in (1, 2)],
+    )
+    session.add(Match(id=1, tournament_id=1, pool_id=1, status="completed"))
+    session.add(MatchPlayer(match_id=1, participant_id=1, score=3))
+    session.add(MatchPlayer(match_id=1, participant_id=2, score=1))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def count(db, table):
+    return len(db.execute(select(table)).all())
+
+
+def test_delete_tournament_cascades(db):
+    response = delete_tournament(1, db, ADMIN)
+
+    assert response["deleted"] == {
+        "tournaments": 1,
+        "registrations": 2,
+        "participants": 2,
+        "participant_members": 2,
+        "pools": 1,
+        "pool_participants": 2,
+        "matches": 1,
+        "match_players": 2,
+        "payments": 0,
+    }
+    for table in (
+        TournamentRegistration,
+        ParticipantMember,
+        pool_participant_association,
+        MatchPlayer,
+    ):
+        assert count(db, table) == 0
+    assert count(db, User) == 2
+
+
+def test_reset_tournament_keeps_participants(db):
+    response = reset_tournament(1, db)
+
+    assert response["deleted"] == {
+        "matches": 1,
+        "match_players": 2,
+        "pools": 1,
+        "pool_participants": 2,
+    }
+    assert count(db, MatchPlayer) == 0
+    assert count(db, pool_participant_association) == 0
+    assert count(db, Participant) == 2
+
+
+def test_delete_participant_cascades(db):
+    response = delete_participant(1, 1, db, ADMIN)
+
+    assert response["deleted"] == {
+        "participants": 1,
+        "participant_members": 1,
+        "pool_participants": 1,
+        "match_players": 1,
+        "registrations": 1,
+    }
+    assert count(db, MatchPlayer) == 1
+    assert count(db, TournamentRegistration) == 1
+
+
+def test_delete_user_with_licence_and_payment(db):
+    db.add(User(id=3, nickname="p3", name="P 3", role_id=1))
+    db.flush()
+    db.add(
+        Licence(
+            ligue="L",
+            comite="C",
+            club_number=1,
+            club_name="Club",
+            name="P",
+            surname="3",
+            category="S",
+            licence_number=3,
+            user_id=3,
+        )
+    )
+    db.add(TournamentPayment(user_id=3, tournament_id=1, paid=True))
+    db.commit()
+
+    assert delete_user(3, ADMIN, db).status_code == 200
+    assert db.get(User, 3) is None
+    assert count(db, Licence) == 0
+    assert count(db, TournamentPayment) == 0
+
+
+def test_delete_user_with_tournament_history_is_refused(db):
+    with pytest.raises(HTTPException) as exc:
+        delete_user(1, ADMIN, db)
+    assert exc.value.status_code == 409
+    assert db.get(User, 1) is not None
+
+
+def derived(db):
+    return (
+        sorted(
+            (r.user_id, round(r.rating, 6), r.matches_played, r.last_match_id)
+            for r in db.scalars(select(PlayerRating))
+        ),
+        sorted(
+            (h.user_id, h.match_id, round(h.rating_after, 6))
+            for h in db.scalars(select(RatingHistory))
+        ),
+        sorted(
+            (s.user_id, s.matches_played, s.wins, s.tournaments_entered)
+            for s in db.scalars(select(PlayerStats))
+        ),
+        sorted(
+            (h.user_id_low, h.user_id_high, h.matches, h.last_match_id)
+            for h in db.scalars(select(HeadToHead))
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "remove",
+    [
+        lambda db: delete_tournament(1, db, ADMIN),
+        lambda db: delete_participant(1, 1, db, ADMIN),
+        lambda db: reset_tournament(1, db),
+        lambda db: update_tournament(1, TournamentUpdate(mode="double"), db, ADMIN),
+    ],
+    ids=["tournament", "participant", "reset", "mode"],
+)
+def test_deletes_take_results_out_incrementally(db, remove):
+    # Second tournoi, joué après : ses résultats sont rejoués sans le premier
+    db.add(Tournament(id=2, name="Cup", start_date=datetime(2025, 6, 1), mode="single"))
+    for user_id in (1, 2):
+        db.add(Participant(id=user_id + 2, tournament_id=2))
+        db.add(ParticipantMember(participant_id=user_id + 2, user_id=user_id))
+    db.add(Match(id=2, tournament_id=2, status="completed"))
+    db.add(MatchPlayer(match_id=2, participant_id=3, score=1))
+    db.add(MatchPlayer(match_id=2, participant_id=4, score=3))
+    db.flush()
+    replay_ratings(db)
+    rebuild_player_stats(db)
+    db.commit()
+
+    with (
+        patch("modules.api.tournaments.result_hooks.replay_ratings") as full_replay,
+        patch(
+            "modules.api.tournaments.result_hooks.rebuild_player_stats"
+        ) as full_rebuild,
+    ):
+        remove(db)
+    incremental = derived(db)
+
+    full_replay.assert_not_called()
+    full_rebuild.assert_not_called()
+    assert {match_id for _, match_id, _ in incremental[1]} == {2}
+    replay_ratings(db)
+    rebuild_player_stats(db)
+    assert derived(db) == incremental
@@ -0,0 +1,125 @@
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.tournaments.models import Tournament, TournamentRegistration
+from modules.api.stripe import routes
+from modules.api.stripe.models import CheckoutSession
+from modules.api.stripe.functions import process_stripe_events, record_stripe_event
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+class FakeStripe:
+    def __init__(self):
+        self.created = []
+        self.checkout = SimpleNamespace(Session=SimpleNamespace(create=self.create))
+
+    def create(self, **params):
+        self.created.append(params)
+        number = len(self.created)
+        return SimpleNamespace(id=f"cs_{number}", url=f"https://pay/{number}")
+
+
+@pytest.fixture
+def stripe(monkeypatch):
+    fake = FakeStripe()
+    monkeypatch.setattr(routes, "get_stripe", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setenv("TEST_MODE", "1")
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add_all(
+        [
+            User(id=1, nickname="p1", name="P 1", email="p1@x.fr", role_id=1),
+            User(id=2, nickname="p2", name="P 2", email="p2@x.fr", role_id=1),
+            User(id=3, nickname="p3", name="P 3", email="p3@x.fr", role_id=1),
+            Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1, 20)),
+        ]
+    )
+    session.add_all(
+        [TournamentRegistration(user_id=i, tournament_id=1) for i in (1, 2, 3)]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def pay(db, user_id=1, amount=300):
+    return asyncio.run(
+        routes.pay_for_tournament(
+            tournament_id=1,
+            checkout_data=routes.CheckoutCreate(amount=amount),
+            db=db,
+            current_user=db.get(User, user_id),
+        )
+    )
+
+
+def test_open_session_is_reused(db, stripe):
+    first = pay(db)
+    assert pay(db) == first == {"session_id": "cs_1", "url": "https://pay/1"}
+    assert len(stripe.created) == 1
+    assert stripe.created[0]["expires_at"] > datetime.utcnow().timestamp()
+
+    # Autre joueur : sa propre session
+    assert pay(db, user_id=2)["session_id"] == "cs_2"
+
+
+def test_new_session_when_amount_changes_or_expiry_is_near(db, stripe):
+    pay(db)
+    assert pay(db, amount=500)["session_id"] == "cs_2"
+
+    db.get(CheckoutSession, (1, 1)).expires_at = datetime.utcnow() + timedelta(
+        minutes=1
+    )
+    db.commit()
+    assert pay(db, amount=500)["session_id"] == "cs_3"
+    assert db.get(CheckoutSession, (1, 1)).session_id == "cs_3"
+
+
+def test_completed_payment_clears_session_and_shows_in_status(db, stripe):
+    pay(db)
+    pay(db, user_id=2)
+    record_stripe_event(
+        db,
+        {
+            "id": "evt_1",
+            "type": "checkout.session.completed",
+            "data": {
+                "object": {
+                    "id": "cs_1",
+                    "amount_total": 329,
+                    "metadata": {"user_id": "1", "tournament_id": "1"},
+                }
+            },
+        },
+    )
+    db.commit()
+    process_stripe_events(db)
+    assert db.get(CheckoutSession, (1, 1)) is None
+
+    statuses = asyncio.run(
+        routes.list_payment_statuses(tournament_id=1, db=db, current_user=None)
+    )
+    assert [(s.user_id, s.nickname, s.paid, s.checkout_open) for s in statuses] == [
+        (1, "p1", True, False),
+        (2, "p2", False, True),
+        (3, "p3", False, False),
+    ]
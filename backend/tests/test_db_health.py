@@ -0,0 +1,40 @@
+import sqlite3
+import pytest
+
+from modules.api.admin import db_admin
+from modules.database import health
+from modules.database.health import read_health_report, run_deep_check
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    db_path = tmp_path / "badarts.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE scores (id INTEGER PRIMARY KEY, value INTEGER)")
+        conn.execute("INSERT INTO scores (value) VALUES (1)")
+    conn.close()
+    monkeypatch.setattr(db_admin, "USERS_DATABASE_PATH", db_path)
+    monkeypatch.setattr(health, "HEALTH_REPORT_PATH", tmp_path / "health.json")
+    return db_path
+
+
+def test_health_serves_cached_checks_only(database):
+    # Avant le premier passage du scheduler : métriques seules, aucun check lancé
+    result = db_admin.get_db_health()
+    assert result["integrity_check"] is None
+    assert result["checks"] == {}
+    assert result["journal_mode"] == "wal"
+
+
+def test_scheduled_checks_are_reported(database):
+    assert run_deep_check("quick_check", database)["ok"]
+    run_deep_check("integrity_check", database)
+
+    report = read_health_report()
+    assert set(report) == {"quick_check", "integrity_check"}
+    assert report["quick_check"]["checked_at"]
+    assert db_admin.get_db_health()["integrity_check"] == "ok"
+
+    with pytest.raises(ValueError):
+        run_deep_check("vacuum", database)
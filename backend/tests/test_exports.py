@@ -0,0 +1,104 @@
+import asyncio
+import csv
+import gzip
+import io
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import utils.exports
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.users.schemas import TokenData
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Tournament,
+    TournamentRegistration,
+)
+from modules.api.tournaments.routes.exports import (
+    export_season_leaderboard,
+    export_tournament_matches,
+    export_tournament_registrations,
+)
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+ADMIN = TokenData(sub="admin", exp=0, role="admin", scopes=["admin"])
+
+
+@pytest.fixture
+def db(monkeypatch):
+    # Petits paquets : plusieurs lectures du curseur et plusieurs row groups
+    monkeypatch.setattr(utils.exports, "EXPORT_CHUNK_SIZE", 2)
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(
+        Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1), mode="single")
+    )
+    for i in (1, 2, 3):
+        session.add(User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1))
+        session.add(TournamentRegistration(id=i, user_id=i, tournament_id=1))
+        session.add(Participant(id=i, tournament_id=1))
+        session.add(ParticipantMember(participant_id=i, user_id=i))
+    for match_id, (a, b) in enumerate(((1, 2), (2, 3), (1, 3)), start=1):
+        session.add(Match(id=match_id, tournament_id=1, status="completed"))
+        session.add_all(
+            [
+                MatchPlayer(match_id=match_id, participant_id=a, score=3),
+                MatchPlayer(match_id=match_id, participant_id=b, score=1),
+            ]
+        )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def read_body(response) -> bytes:
+    async def collect():
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    return asyncio.run(collect())
+
+
+def test_match_log_streams_as_gzipped_csv(db):
+    response = export_tournament_matches(1, ("csv", True), db, ADMIN)
+
+    assert response.headers["content-disposition"].endswith('matches.csv.gz"')
+    rows = list(
+        csv.DictReader(io.StringIO(gzip.decompress(read_body(response)).decode()))
+    )
+    assert len(rows) == 6
+    assert rows[0]["participant_name"] == "p1"
+    assert [(r["match_id"], r["score"]) for r in rows[:2]] == [
+        ("1", "3.0"),
+        ("1", "1.0"),
+    ]
+
+
+def test_season_leaderboard_csv(db):
+    response = export_season_leaderboard(2025, ("csv", False), db, ADMIN)
+
+    rows = list(csv.DictReader(io.StringIO(read_body(response).decode())))
+    assert [r["nickname"] for r in rows] == ["p1", "p2", "p3"]
+    assert rows[0]["total_points"] == "8.0"
+
+
+def test_registrations_parquet(db):
+    pq = pytest.importorskip("pyarrow.parquet")
+    response = export_tournament_registrations(1, ("parquet", False), db, ADMIN)
+
+    parquet = pq.ParquetFile(io.BytesIO(read_body(response)))
+    assert parquet.metadata.num_row_groups == 2
+    table = parquet.read()
+    assert table.column("nickname").to_pylist() == ["p1", "p2", "p3"]
+    assert table.column("participant_id").to_pylist() == [1, 2, 3]
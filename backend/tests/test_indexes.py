@@ -0,0 +1,18 @@
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from modules.database.session import UsersBase
+from modules.database.indexes import explain_hot_queries
+from modules.api.users.models import User  # noqa: F401
+import modules.api.tournaments.models  # noqa: F401
+
+
+def test_hot_queries_use_indexes():
+    engine = create_engine("sqlite://")
+    UsersBase.metadata.create_all(bind=engine)
+
+    with Session(engine) as db:
+        report = explain_hot_queries(db)
+
+    assert report
+    assert [plan["query"] for plan in report if not plan["ok"]] == []
@@ -0,0 +1,228 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from unittest.mock import patch
+
+from modules.database.session import UsersBase
+from modules.database.migrations.runner import (
+    applied_revisions,
+    backfill,
+    load_revisions,
+    run_migrations,
+)
+from modules.api.users.models import User  # noqa: F401
+import modules.api.tournaments.models  # noqa: F401
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    UsersBase.metadata.create_all(bind=engine)
+    return engine
+
+
+def test_revisions_are_ordered_and_unique():
+    revisions = [module.revision for module in load_revisions()]
+    assert revisions == sorted(set(revisions))
+
+
+def test_run_migrations_on_existing_database(engine):
+    # Base créée avant l'ajout des index : doublons d'inscription possibles
+    with engine.begin() as conn:
+        conn.execute(text("DROP INDEX ux_registration_tournament_user"))
+        conn.execute(text("DROP INDEX ix_match_tournament_pool"))
+        conn.execute(
+            text(
+                "INSERT INTO tournament_registrations (user_id, tournament_id) "
+                "VALUES (1, 1), (1, 1), (2, 1), (2, 9)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO tournaments (id, name, start_date) "
+                "VALUES (1, 'Open', '2025-05-01')"
+            )
+        )
+
+    assert "0001" in run_migrations(engine)
+    assert run_migrations(engine) == []  # déjà à jour
+
+    index_names = {i["name"] for i in inspect(engine).get_indexes("matches")}
+    assert "ix_match_tournament_pool" in index_names
+    # Clés étrangères recréées avec ON DELETE CASCADE, orphelins (tournoi 9) retirés
+    foreign_keys = inspect(engine).get_foreign_keys("tournament_registrations")
+    tournament_fk = next(
+        fk for fk in foreign_keys if fk["referred_table"] == "tournaments"
+    )
+    assert tournament_fk["options"]["ondelete"] == "CASCADE"
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT COUNT(*) FROM tournament_registrations"))
+        assert count.scalar() == 2
+
+
+def test_stamp_only_records_without_running(engine):
+    with patch(
+        "modules.database.migrations.revisions.r0001_tournament_indexes.upgrade"
+    ) as upgrade:
+        run_migrations(engine, stamp_only=True)
+
+    upgrade.assert_not_called()
+    assert "0001" in applied_revisions(engine)
+
+
+def test_backfill_in_batches(engine):
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE source (id INTEGER PRIMARY KEY, value INT)"))
+        conn.execute(text("CREATE TABLE target (id INTEGER PRIMARY KEY, double INT)"))
+        conn.execute(
+            text("INSERT INTO source (id, value) VALUES (:id, :id)"),
+            [{"id": i} for i in range(1, 8)],
+        )
+
+    batches = []
+
+    def apply_batch(conn, rows):
+        batches.append(len(rows))
+        conn.execute(
+            text("INSERT INTO target (id, double) VALUES (:id, :double)"),
+            [{"id": row.id, "double": row.value * 2} for row in rows],
+        )
+
+    with patch("modules.database.migrations.runner.BACKFILL_PAUSE_SECONDS", 0):
+        done = backfill(
+            engine,
+            "double values",
+            "SELECT id, value FROM source WHERE id > :last_key "
+            "ORDER BY id LIMIT :batch_size",
+            apply_batch,
+            batch_size=3,
+        )
+
+    assert done == 7
+    assert batches == [3, 3, 1]
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT SUM(double) FROM target")).scalar() == 56
+
+
+def test_cli_upgrade_creates_tables_without_revision(tmp_path):
+    from modules.database.migrations.__main__ import main
+
+    path = tmp_path / "users.db"
+    file_engine = create_engine(f"sqlite:///{path}")
+    # Base existante, toutes révisions appliquées, sans table de cache
+    UsersBase.metadata.create_all(bind=file_engine)
+    run_migrations(file_engine, stamp_only=True)
+    with file_engine.begin() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS cache_versions"))
+
+    with (
+        patch("modules.api.users.create_db.users_engine", file_engine),
+        patch("modules.api.users.create_db.USERS_DATABASE_PATH", path),
+        patch(
+            "modules.database.migrations.runner.MIGRATIONS_LOCK_PATH",
+            tmp_path / "migrations.lock",
+        ),
+        patch("sys.argv", ["migrations", "upgrade"]),
+    ):
+        main()
+
+    assert "cache_versions" in inspect(file_engine).get_table_names()
+
+
+# Schéma des tables du tournoi avant toute révision (base en production à l'origine)
+BASELINE_SCHEMA = [
+    "CREATE TABLE roles (id INTEGER NOT NULL, role VARCHAR, PRIMARY KEY (id))",
+    "CREATE TABLE users (id INTEGER NOT NULL, name VARCHAR, "
+    "nickname VARCHAR NOT NULL, discord VARCHAR, email VARCHAR, "
+    "hashed_password VARCHAR, is_active BOOLEAN, role_id INTEGER NOT NULL, "
+    "PRIMARY KEY (id), FOREIGN KEY(role_id) REFERENCES roles (id))",
+    "CREATE TABLE refresh_tokens (id INTEGER NOT NULL, token VARCHAR NOT NULL, "
+    "user_id INTEGER NOT NULL, expires_at DATETIME NOT NULL, created_at DATETIME, "
+    "revoked BOOLEAN NOT NULL, PRIMARY KEY (id), UNIQUE (token), "
+    "FOREIGN KEY(user_id) REFERENCES users (id))",
+    "CREATE TABLE tournaments (id INTEGER NOT NULL, name VARCHAR NOT NULL, "
+    "description VARCHAR, start_date DATETIME NOT NULL, is_active BOOLEAN, "
+    "type VARCHAR, mode VARCHAR, status VARCHAR, PRIMARY KEY (id))",
+    "CREATE TABLE participants (id INTEGER NOT NULL, tournament_id INTEGER NOT NULL, "
+    "name VARCHAR, PRIMARY KEY (id), "
+    "FOREIGN KEY(tournament_id) REFERENCES tournaments (id))",
+    "CREATE TABLE participant_members (participant_id INTEGER NOT NULL, "
+    "user_id INTEGER NOT NULL, PRIMARY KEY (participant_id, user_id), "
+    "FOREIGN KEY(participant_id) REFERENCES participants (id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id))",
+    "CREATE TABLE pools (id INTEGER NOT NULL, tournament_id INTEGER NOT NULL, "
+    "name VARCHAR, PRIMARY KEY (id), "
+    "FOREIGN KEY(tournament_id) REFERENCES tournaments (id))",
+    "CREATE TABLE pool_participant_association (pool_id INTEGER NOT NULL, "
+    "participant_id INTEGER NOT NULL, PRIMARY KEY (pool_id, participant_id), "
+    "FOREIGN KEY(pool_id) REFERENCES pools (id), "
+    "FOREIGN KEY(participant_id) REFERENCES participants (id))",
+    "CREATE TABLE matches (id INTEGER NOT NULL, tournament_id INTEGER NOT NULL, "
+    "pool_id INTEGER, status VARCHAR, round INTEGER, PRIMARY KEY (id), "
+    "FOREIGN KEY(tournament_id) REFERENCES tournaments (id), "
+    "FOREIGN KEY(pool_id) REFERENCES pools (id))",
+    "CREATE TABLE match_players (match_id INTEGER NOT NULL, "
+    "participant_id INTEGER NOT NULL, score FLOAT, "
+    "PRIMARY KEY (match_id, participant_id), "
+    "FOREIGN KEY(match_id) REFERENCES matches (id), "
+    "FOREIGN KEY(participant_id) REFERENCES participants (id))",
+    "CREATE TABLE tournament_registrations (id INTEGER NOT NULL, "
+    "user_id INTEGER NOT NULL, tournament_id INTEGER NOT NULL, "
+    "registration_date DATETIME, PRIMARY KEY (id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id), "
+    "FOREIGN KEY(tournament_id) REFERENCES tournaments (id))",
+    "CREATE TABLE tournament_payments (user_id INTEGER NOT NULL, "
+    "tournament_id INTEGER NOT NULL, paid BOOLEAN, "
+    "PRIMARY KEY (user_id, tournament_id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id), "
+    "FOREIGN KEY(tournament_id) REFERENCES tournaments (id))",
+]
+
+BASELINE_DATA = [
+    "INSERT INTO roles (id, role) VALUES (1, 'player')",
+    "INSERT INTO users (id, nickname, role_id) "
+    "VALUES (1, 'p1', 1), (2, 'p2', 1), (3, 'p3', 1)",
+    "INSERT INTO tournaments (id, name, start_date, type, mode, status) "
+    "VALUES (1, 'Open', '2025-05-01 20:00:00', 'pool', 'single', 'finished'), "
+    "(2, 'Cup', '2025-06-01 20:00:00', 'pool', 'single', 'running')",
+    "INSERT INTO participants (id, tournament_id) "
+    "VALUES (1, 1), (2, 1), (3, 1), (4, 2), (5, 2)",
+    "INSERT INTO participant_members (participant_id, user_id) "
+    "VALUES (1, 1), (2, 2), (3, 3), (4, 1), (5, 2)",
+    "INSERT INTO pools (id, tournament_id, name) VALUES (1, 1, 'A'), (2, 2, 'A')",
+    "INSERT INTO pool_participant_association (pool_id, participant_id) "
+    "VALUES (1, 1), (1, 2), (1, 3), (2, 4), (2, 5)",
+    "INSERT INTO matches (id, tournament_id, pool_id, status, round) "
+    "VALUES (1, 1, 1, 'completed', 1), (2, 1, 1, 'completed', 1), "
+    "(3, 1, 1, 'completed', 1), (4, 2, 2, 'completed', 1)",
+    "INSERT INTO match_players (match_id, participant_id, score) "
+    "VALUES (1, 1, 3), (1, 2, 1), (2, 1, 3), (2, 3, 0), (3, 2, 3), (3, 3, 2), "
+    "(4, 4, 3), (4, 5, 2)",
+    "INSERT INTO tournament_registrations (user_id, tournament_id) "
+    "VALUES (1, 1), (2, 1), (3, 1), (1, 2), (2, 2)",
+]
+
+
+def test_upgrade_baseline_database_with_data(tmp_path):
+    import modules.api.ratings.models  # noqa: F401
+    import modules.api.stats.models  # noqa: F401
+
+    file_engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    with file_engine.begin() as conn:
+        for statement in BASELINE_SCHEMA + BASELINE_DATA:
+            conn.execute(text(statement))
+
+    # Même enchaînement que init_users_db sur une base existante
+    UsersBase.metadata.create_all(bind=file_engine)
+    revisions = run_migrations(file_engine)
+
+    assert revisions == [module.revision for module in load_revisions()]
+    with file_engine.connect() as conn:
+        archived = conn.execute(text("SELECT tournament_id FROM tournament_archives"))
+        assert archived.scalars().all() == [1]
+        # Classement final archivé : p1 vainqueur de l'Open
+        best = conn.execute(
+            text("SELECT user_id, best_finish FROM player_stats ORDER BY user_id")
+        ).all()
+        assert best == [(1, 1), (2, 2), (3, 3)]
+        rated = conn.execute(text("SELECT COUNT(*) FROM player_ratings")).scalar()
+        assert rated == 3
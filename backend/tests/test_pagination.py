@@ -0,0 +1,70 @@
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import patch
+
+from modules.database.session import UsersBase
+from modules.database.dependencies import get_users_db
+from modules.api.users.models import User  # noqa: F401
+from modules.api.tournaments.models import Tournament
+from modules.api.cache.functions import clear_response_cache
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def client():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    clear_response_cache()
+    session = TestingSessionLocal()
+    session.add_all(
+        Tournament(id=i, name=f"Open {i}", start_date=datetime(2025, 5, i))
+        for i in range(1, 6)
+    )
+    session.commit()
+
+    with patch("modules.api.main.init_users_db"):
+        from modules.api.main import app
+
+        app.dependency_overrides[get_users_db] = lambda: session
+        with TestClient(app) as c:
+            yield c
+        app.dependency_overrides.clear()
+    session.close()
+
+
+def test_keyset_pages(client):
+    response = client.get("/tournaments/?limit=2&with_total=true")
+    assert [t["id"] for t in response.json()] == [1, 2]
+    assert response.headers["x-next-cursor"] == "2"
+    assert response.headers["x-total-count"] == "5"
+
+    response = client.get("/tournaments/?limit=2&cursor=4")
+    assert [t["id"] for t in response.json()] == [5]
+    assert "x-next-cursor" not in response.headers
+
+
+def test_unpaginated_by_default(client):
+    assert len(client.get("/tournaments/").json()) == 5
+
+
+def test_field_selection(client):
+    response = client.get("/tournaments/?limit=1&fields=id,name")
+    assert response.json() == [{"id": 1, "name": "Open 1"}]
+
+    assert client.get("/tournaments/?fields=password").status_code == 400
+
+
+def test_limit_above_maximum_is_clamped(client):
+    with patch("utils.pagination.MAX_PAGE_SIZE", 2):
+        response = client.get("/tournaments/?limit=5000")
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()] == [1, 2]
+    assert response.headers["x-next-cursor"] == "2"
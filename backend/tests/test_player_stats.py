@@ -0,0 +1,202 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from fastapi import HTTPException
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.stats.models import HeadToHead, PlayerMatch, PlayerStats
+from modules.api.stats import functions as stats_functions
+from modules.api.stats.functions import rebuild_player_stats
+from modules.api.stats.routes import get_head_to_head
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Tournament,
+)
+from modules.api.tournaments.schemas import MatchUpdate
+from modules.api.tournaments.routes.matches import delete_match, update_match
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(
+        Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1), mode="single")
+    )
+    for i in (1, 2, 3):
+        session.add(User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1))
+        session.add(Participant(id=i, tournament_id=1))
+        session.add(ParticipantMember(participant_id=i, user_id=i))
+    for match_id, players in ((1, (1, 2)), (2, (2, 3)), (3, (1, 3))):
+        session.add(Match(id=match_id, tournament_id=1, status="pending"))
+        session.add_all(
+            MatchPlayer(match_id=match_id, participant_id=p) for p in players
+        )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def play(db, match_id, scores):
+    update_match(
+        match_id,
+        MatchUpdate(
+            status="completed",
+            scores=[{"participant_id": p, "score": s} for p, s in scores.items()],
+        ),
+        db,
+    )
+
+
+def snapshot(db):
+    stats = {
+        s.user_id: (
+            s.matches_played,
+            s.wins,
+            s.losses,
+            s.draws,
+            s.manches_for,
+            s.manches_against,
+            s.single_wins,
+            s.tournaments_entered,
+        )
+        for s in db.scalars(select(PlayerStats))
+    }
+    history = [
+        (m.user_id, m.match_id, m.result)
+        for m in db.scalars(select(PlayerMatch).order_by(PlayerMatch.id))
+    ]
+    return stats, sorted(history)
+
+
+def test_incremental_stats_match_full_rebuild(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 2, 3: 2})
+    play(db, 3, {1: 1, 3: 3})
+    incremental = snapshot(db)
+
+    assert incremental[0][1] == (2, 1, 1, 0, 4.0, 4.0, 1, 1)
+    assert incremental[0][2] == (2, 0, 1, 1, 3.0, 5.0, 0, 1)
+    assert rebuild_player_stats(db) == 3
+    assert snapshot(db) == incremental
+
+
+def test_edited_result_rebuilds_stats(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+
+    # Correction du premier match : les agrégats des deux joueurs s'inversent
+    play(db, 1, {1: 0, 2: 3})
+    stats, history = snapshot(db)
+
+    assert stats[1][:3] == (1, 0, 1)
+    assert stats[2][:3] == (2, 2, 0)
+    assert (1, 1, "loss") in history
+
+
+def test_head_to_head_records_and_rivals(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 3, {1: 1, 3: 3})
+    play(db, 2, {2: 2, 3: 2})
+    incremental = {
+        (h.user_id_low, h.user_id_high): (h.matches, h.low_wins, h.high_wins)
+        for h in db.scalars(select(HeadToHead))
+    }
+    rebuild_player_stats(db)
+
+    assert incremental == {(1, 2): (1, 1, 0), (1, 3): (1, 0, 1), (2, 3): (1, 0, 0)}
+    assert {
+        (h.user_id_low, h.user_id_high): (h.matches, h.low_wins, h.high_wins)
+        for h in db.scalars(select(HeadToHead))
+    } == incremental
+
+    # Même confrontation vue de chacun des deux joueurs
+    seen_from_3 = get_head_to_head(3, 1, db)
+    assert (seen_from_3.wins, seen_from_3.losses) == (1, 0)
+    assert (seen_from_3.manches_for, seen_from_3.manches_against) == (3.0, 1.0)
+    assert seen_from_3.opponent_nickname == "p1"
+    with pytest.raises(HTTPException) as exc:
+        get_head_to_head(1, 1, db)
+    assert exc.value.status_code == 404
+
+
+def head_to_head(db):
+    return {
+        (h.user_id_low, h.user_id_high): (
+            h.matches,
+            h.low_wins,
+            h.high_wins,
+            h.draws,
+            h.last_match_id,
+        )
+        for h in db.scalars(select(HeadToHead))
+    }
+
+
+def test_out_of_order_completions_adjust_by_delta(db):
+    with patch.object(stats_functions, "rebuild_player_stats") as full_rebuild:
+        play(db, 3, {1: 1, 3: 3})
+        play(db, 2, {2: 2, 3: 2})
+        play(db, 1, {1: 3, 2: 1})
+    incremental = snapshot(db), head_to_head(db)
+
+    full_rebuild.assert_not_called()
+    rebuild_player_stats(db)
+    assert (snapshot(db), head_to_head(db)) == incremental
+
+
+def test_edited_and_cancelled_results_adjust_by_delta(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+    play(db, 3, {1: 1, 3: 3})
+    history_ids = list(db.scalars(select(PlayerMatch.id).order_by(PlayerMatch.id)))
+
+    with patch.object(stats_functions, "rebuild_player_stats") as full_rebuild:
+        # Correction : les lignes d'historique sont mises à jour sur place
+        play(db, 1, {1: 0, 2: 3})
+        assert (
+            list(db.scalars(select(PlayerMatch.id).order_by(PlayerMatch.id)))
+            == history_ids
+        )
+        # Annulation : le match sort des agrégats et des confrontations
+        update_match(3, MatchUpdate(status="pending"), db)
+    adjusted = snapshot(db), head_to_head(db)
+
+    full_rebuild.assert_not_called()
+    assert adjusted[0][0][1][:3] == (1, 0, 1)
+    assert (1, 3) not in adjusted[1]
+    assert adjusted[1][(1, 2)] == (1, 0, 1, 0, 1)
+    rebuild_player_stats(db)
+    assert (snapshot(db), head_to_head(db)) == adjusted
+
+
+def test_deleted_match_is_subtracted(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+    play(db, 3, {1: 1, 3: 3})
+
+    with patch(
+        "modules.api.tournaments.result_hooks.rebuild_player_stats"
+    ) as full_rebuild:
+        delete_match(3, db)
+    deleted = snapshot(db), head_to_head(db)
+
+    full_rebuild.assert_not_called()
+    assert (1, 3) not in deleted[1]
+    rebuild_player_stats(db)
+    assert (snapshot(db), head_to_head(db)) == deleted
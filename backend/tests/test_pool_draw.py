@@ -0,0 +1,125 @@
+import orjson
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.users.schemas import TokenData
+from modules.api.licences.models import Licence
+from modules.api.tournaments.models import (
+    Participant,
+    ParticipantMember,
+    Pool,
+    Tournament,
+    pool_participant_association,
+)
+from modules.api.tournaments.schemas import DrawCreate
+from modules.api.tournaments.draw import normalize_name, snake_draw
+from modules.api.tournaments.routes.pools import draw_tournament_pools
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+ADMIN = TokenData(sub="admin@test.fr", exp=0, role="admin", scopes=["admin"])
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(
+        Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1), mode="single")
+    )
+    for i in range(1, 5):
+        session.add(User(id=i, nickname=f"p{i}", name=f"Joueur {i}", role_id=1))
+        session.add(Participant(id=i, tournament_id=1))
+        session.add(ParticipantMember(participant_id=i, user_id=i))
+    # Les deux meilleurs joueurs sont du même club
+    for i, club in ((1, "Metz"), (2, "Metz"), (3, "Nancy")):
+        session.add(
+            Licence(
+                ligue="GE",
+                comite="57",
+                club_number=i,
+                club_name=club,
+                name=f"{i}",
+                surname="Joueur",
+                category="S",
+                licence_number=i,
+                user_id=i,
+            )
+        )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_snake_draw():
+    assert snake_draw(list(range(1, 9)), 2, {}) == [[1, 4, 5, 8], [2, 3, 6, 7]]
+
+
+def test_snake_draw_separates_clubs():
+    clubs = {1: {"Metz"}, 3: {"Metz"}, 4: {"Metz"}}
+    # Sans contrainte : [[1, 6], [2, 5], [3, 4]]
+    assert snake_draw(list(range(1, 7)), 3, clubs) == [[1, 6], [2, 4], [3, 5]]
+
+
+def test_normalize_name():
+    assert normalize_name("DUPONT Jérôme") == normalize_name("jerome dupont")
+
+
+def test_draw_from_lsef_ranking(db, tmp_path):
+    ranking = tmp_path / "lsef.json"
+    ranking.write_bytes(
+        orjson.dumps(
+            {
+                "leaderboard": [
+                    {
+                        "category": "Individuel",
+                        "entries": [
+                            {"joueur": "JOUEUR 1", "pts": "30"},
+                            {"joueur": "JOUEUR 2", "pts": "20,5"},
+                            {"joueur": "Joueur 4", "pts": "10"},
+                        ],
+                    }
+                ]
+            }
+        )
+    )
+    data = DrawCreate(pool_count=2, source="lsef")
+    with patch.dict(
+        "modules.api.tournaments.draw.OFFICIAL_RANKINGS", {"lsef": str(ranking)}
+    ):
+        preview = draw_tournament_pools(
+            1, data.model_copy(update={"dry_run": True}), db, ADMIN
+        )
+        assert db.query(Pool).count() == 0
+        response = draw_tournament_pools(1, data, db, ADMIN)
+
+    assert [[p.id for p in pool.participants] for pool in preview.pools] == [
+        [1, 3],
+        [2, 4],
+    ]
+    assert preview.pools[1].participants[0].rating == 20.5
+    assert [pool.name for pool in response.pools] == ["Poule A", "Poule B"]
+    stored = db.execute(
+        select(
+            pool_participant_association.c.pool_id,
+            pool_participant_association.c.participant_id,
+        )
+    ).all()
+    assert sorted(stored) == [
+        (response.pools[0].pool_id, 1),
+        (response.pools[0].pool_id, 3),
+        (response.pools[1].pool_id, 2),
+        (response.pools[1].pool_id, 4),
+    ]
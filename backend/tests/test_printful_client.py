@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from modules.api.printful import client, routes
+
+
+class FakePrintful(BaseHTTPRequestHandler):
+    """Local stand-in for the Printful API: counts hits, optional delay."""
+
+    hits = []
+    delay = 0.0
+    version = 1
+
+    def do_GET(self):
+        FakePrintful.hits.append(self.path)
+        time.sleep(FakePrintful.delay)
+        if self.path == "/store/products/404":
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = orjson.dumps({"code": 200, "result": {"version": FakePrintful.version}})
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def printful(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakePrintful)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    FakePrintful.hits, FakePrintful.delay, FakePrintful.version = [], 0.0, 1
+    monkeypatch.setattr(client, "BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setattr(routes, "PRINTFUL", "token")
+    client.clear_cache()
+    try:
+        yield FakePrintful
+    finally:
+        server.shutdown()
+        server.server_close()
+        client.clear_cache()
+
+
+def run(scenario):
+    async def wrapped():
+        try:
+            return await scenario()
+        finally:
+            await client.close_client()
+
+    return asyncio.run(wrapped())
+
+
+def test_products_are_cached_and_misses_coalesced(printful):
+    async def scenario():
+        first = await asyncio.gather(*(routes.get_store_products() for _ in range(5)))
+        again = await routes.get_store_products()
+        return first, again
+
+    first, again = run(scenario)
+
+    assert printful.hits == ["/store/products"]
+    assert again == first[0] == {"code": 200, "result": {"version": 1}}
+
+
+def test_stale_entry_served_while_revalidating(printful, monkeypatch):
+    monkeypatch.setattr(client, "PRINTFUL_CACHE_TTL_SECONDS", 0.0)
+
+    async def scenario():
+        await routes.get_store_product(7)
+        printful.version, printful.delay = 2, 0.2
+        started = time.monotonic()
+        stale = await routes.get_store_product(7)
+        elapsed = time.monotonic() - started
+        await asyncio.gather(*client._inflight.values())
+        printful.delay = 0.0
+        return stale, elapsed, client._cache["/store/products/7"][1]
+
+    stale, elapsed, refreshed = run(scenario)
+
+    # Réponse immédiate avec l'ancienne version, rafraîchie en arrière-plan
+    assert stale["result"]["version"] == 1 and elapsed < 0.1
+    assert refreshed["result"]["version"] == 2
+
+
+def test_errors_are_not_cached(printful):
+    async def scenario():
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc:
+                await routes.get_store_product(404)
+            assert exc.value.status_code == 500
+
+    run(scenario)
+    assert printful.hits == ["/store/products/404"] * 2
@@ -0,0 +1,195 @@
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.ratings.models import PlayerRating, RatingHistory
+from modules.api.ratings import functions as rating_functions
+from modules.api.ratings.functions import rate_result, replay_ratings
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Tournament,
+)
+from modules.api.tournaments.results import MatchResult, Side
+from modules.api.tournaments.schemas import MatchUpdate
+from modules.api.tournaments.routes.matches import delete_match, update_match
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(
+        Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1), mode="single")
+    )
+    for i in (1, 2, 3):
+        session.add(User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1))
+        session.add(Participant(id=i, tournament_id=1))
+        session.add(ParticipantMember(participant_id=i, user_id=i))
+    for match_id, players in ((1, (1, 2)), (2, (2, 3)), (3, (1, 3))):
+        session.add(Match(id=match_id, tournament_id=1, status="pending"))
+        session.add_all(
+            MatchPlayer(match_id=match_id, participant_id=p) for p in players
+        )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def play(db, match_id, scores):
+    update_match(
+        match_id,
+        MatchUpdate(
+            status="completed",
+            scores=[{"participant_id": p, "score": s} for p, s in scores.items()],
+        ),
+        db,
+    )
+
+
+def snapshot(db):
+    ratings = {
+        r.user_id: (round(r.rating, 6), r.matches_played)
+        for r in db.scalars(select(PlayerRating))
+    }
+    history = [
+        (h.user_id, h.match_id, round(h.rating_after, 6))
+        for h in db.scalars(select(RatingHistory).order_by(RatingHistory.id))
+    ]
+    return ratings, history
+
+
+def test_rate_result_doubles():
+    ratings = {1: 1600.0, 2: 1400.0}
+    result = MatchResult(
+        1, 1, datetime(2025, 5, 1), [Side(1, 3, [1, 2]), Side(2, 1, [3, 4])]
+    )
+    changes = rate_result(ratings, result)
+
+    # Équipes à 1500 de moyenne : +16 / -16 pour chaque membre
+    assert [(u, round(after - before, 6)) for u, before, after in changes] == [
+        (1, 16.0),
+        (2, 16.0),
+        (3, -16.0),
+        (4, -16.0),
+    ]
+
+
+def test_incremental_updates_match_full_replay(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+    play(db, 3, {1: 1, 3: 3})
+    incremental = snapshot(db)
+
+    assert incremental[0][1][1] == 2
+    assert replay_ratings(db) == 3
+    assert snapshot(db) == incremental
+
+
+def test_edited_result_replays_later_matches(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+
+    # Correction du premier match : le second est recalculé à partir de là
+    play(db, 1, {1: 0, 2: 3})
+    edited = snapshot(db)
+    replay_ratings(db)
+
+    assert snapshot(db) == edited
+    assert edited[0][2][0] > edited[0][1][0]
+
+
+def test_out_of_order_completions_rate_one_match_each(db):
+    rated = []
+    replay_from = rating_functions.replay_ratings_from
+
+    def spy(db, sequence):
+        rated.append(replay_from(db, sequence))
+        return rated[-1]
+
+    with (
+        patch.object(rating_functions, "replay_ratings_from", side_effect=spy),
+        patch.object(rating_functions, "replay_ratings") as full_replay,
+    ):
+        play(db, 3, {1: 1, 3: 3})
+        play(db, 2, {2: 3, 3: 2})
+        play(db, 1, {1: 3, 2: 1})
+    incremental = snapshot(db)
+
+    # Chaque match terminé est le dernier : aucun rejeu de l'historique
+    assert rated == [1, 1, 1]
+    full_replay.assert_not_called()
+    assert [match_id for _, match_id, _ in incremental[1]][::2] == [3, 2, 1]
+    replay_ratings(db)
+    assert snapshot(db) == incremental
+
+
+def test_edited_result_keeps_earlier_history(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+    play(db, 3, {1: 1, 3: 3})
+    first = list(
+        db.scalars(select(RatingHistory.id).where(RatingHistory.match_id == 1))
+    )
+
+    # Correction du deuxième match : seuls les matchs 2 et 3 sont rejoués
+    with patch.object(rating_functions, "replay_ratings") as full_replay:
+        play(db, 2, {2: 1, 3: 3})
+    edited = snapshot(db)
+
+    full_replay.assert_not_called()
+    assert (
+        list(db.scalars(select(RatingHistory.id).where(RatingHistory.match_id == 1)))
+        == first
+    )
+    replay_ratings(db)
+    assert snapshot(db) == edited
+
+
+def test_cancelled_result_is_rolled_back(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+    update_match(2, MatchUpdate(status="pending"), db)
+    cancelled = snapshot(db)
+
+    assert cancelled[0] == {1: (cancelled[0][1][0], 1), 2: (cancelled[0][2][0], 1)}
+    assert {match_id for _, match_id, _ in cancelled[1]} == {1}
+    replay_ratings(db)
+    assert snapshot(db) == cancelled
+
+
+def test_deleted_match_replays_from_its_rank(db):
+    play(db, 1, {1: 3, 2: 1})
+    play(db, 2, {2: 3, 3: 2})
+    play(db, 3, {1: 1, 3: 3})
+    first = list(
+        db.scalars(select(RatingHistory.id).where(RatingHistory.match_id == 1))
+    )
+
+    with patch("modules.api.tournaments.result_hooks.replay_ratings") as full_replay:
+        delete_match(2, db)
+    deleted = snapshot(db)
+
+    full_replay.assert_not_called()
+    assert {match_id for _, match_id, _ in deleted[1]} == {1, 3}
+    assert (
+        list(db.scalars(select(RatingHistory.id).where(RatingHistory.match_id == 1)))
+        == first
+    )
+    replay_ratings(db)
+    assert snapshot(db) == deleted
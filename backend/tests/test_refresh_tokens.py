@@ -0,0 +1,82 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+import orjson
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.auth.models import RefreshToken
+from modules.api.auth.functions import prune_refresh_tokens, store_refresh_token
+from modules.api.auth.routes import list_refresh_tokens
+from utils.pagination import PageParams
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add_all(
+        [User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1) for i in (1, 2)]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def tokens(db):
+    return db.execute(
+        select(RefreshToken.token, RefreshToken.revoked).order_by(RefreshToken.id)
+    ).all()
+
+
+def test_prune_removes_expired_and_revoked_tokens_in_batches(db):
+    later = datetime.now(UTC) + timedelta(days=7)
+    store_refresh_token(db, 1, "a1", later)
+    store_refresh_token(db, 1, "a2", later)  # a1 révoqué
+    store_refresh_token(db, 2, "b1", datetime.now(UTC) - timedelta(minutes=1))
+    store_refresh_token(db, 2, "b2", later)  # b1 révoqué et expiré
+    db.add(RefreshToken(token="b0", user_id=2, expires_at=datetime(2020, 1, 1)))
+    db.commit()
+
+    assert prune_refresh_tokens(db, batch_size=2) == 2
+    assert prune_refresh_tokens(db, batch_size=2) == 1
+    assert prune_refresh_tokens(db, batch_size=2) == 0
+    db.commit()
+    assert tokens(db) == [("a2", False), ("b2", False)]
+
+
+def listing(db, user_id=None, revoked=None, limit=100):
+    return list_refresh_tokens(
+        user_id=user_id,
+        revoked=revoked,
+        params=PageParams(limit=limit),
+        db=db,
+        current_user=SimpleNamespace(role="admin"),
+    )
+
+
+def test_listing_is_paginated_and_filtered(db):
+    later = datetime.now(UTC) + timedelta(days=7)
+    for token in ("a1", "a2", "a3"):
+        store_refresh_token(db, 1, token, later)
+    store_refresh_token(db, 2, "b1", later)
+
+    rows = orjson.loads(listing(db, user_id=1).body)
+    assert [row["user_id"] for row in rows] == [1, 1, 1]
+    rows = orjson.loads(listing(db, user_id=1, revoked=False).body)
+    assert [row["id"] for row in rows] == [3]
+
+    page = listing(db, limit=2)
+    assert len(orjson.loads(page.body)) == 2
+    assert page.headers["X-Next-Cursor"] == "2"
@@ -0,0 +1,94 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.users.schemas import TokenData
+from modules.api.tournaments.models import (
+    Participant,
+    ParticipantMember,
+    Tournament,
+    TournamentRegistration,
+)
+from modules.api.tournaments.routes.tournaments import get_registered_users
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+ADMIN = TokenData(sub="admin@test.fr", exp=0, role="admin", scopes=["admin"])
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add_all(
+        [
+            Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1)),
+            Tournament(id=2, name="Other", start_date=datetime(2025, 6, 1)),
+            User(id=1, nickname="alice", name="Alice", role_id=1),
+            User(id=2, nickname="bob", name="Bob", role_id=1),
+            User(id=3, nickname="carol", name="Carol", role_id=1),
+            TournamentRegistration(user_id=1, tournament_id=1),
+            TournamentRegistration(user_id=2, tournament_id=1),
+            TournamentRegistration(user_id=3, tournament_id=1),
+            Participant(id=1, tournament_id=1, name="Duo"),
+            ParticipantMember(participant_id=1, user_id=1),
+            ParticipantMember(participant_id=1, user_id=2),
+            # Participation à un autre tournoi : ignorée
+            Participant(id=2, tournament_id=2, name="Elsewhere"),
+            ParticipantMember(participant_id=2, user_id=3),
+        ]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_registered_users_single_query(db):
+    statements = []
+
+    def listener(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        users = get_registered_users(1, db, ADMIN)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert users == [
+        {
+            "id": 1,
+            "name": "Alice",
+            "nickname": "alice",
+            "participant_id": 1,
+            "participant_name": "Duo",
+            "teammate": {"id": 2, "name": "Bob", "nickname": "bob"},
+        },
+        {
+            "id": 2,
+            "name": "Bob",
+            "nickname": "bob",
+            "participant_id": 1,
+            "participant_name": "Duo",
+            "teammate": {"id": 1, "name": "Alice", "nickname": "alice"},
+        },
+        {
+            "id": 3,
+            "name": "Carol",
+            "nickname": "carol",
+            "participant_id": None,
+            "participant_name": None,
+            "teammate": None,
+        },
+    ]
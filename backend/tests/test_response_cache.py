@@ -0,0 +1,95 @@
+import pytest
+from datetime import datetime
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import patch
+
+from modules.database.session import UsersBase
+from modules.database.dependencies import get_users_db
+from modules.api.users.models import Role, User
+from modules.api.users.routes import admin_update_user
+from modules.api.users.schemas import UserUpdate
+from modules.api.tournaments.models import Participant, ParticipantMember, Tournament
+from modules.api.cache.functions import bump_tournament, clear_response_cache
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    clear_response_cache()
+    session = TestingSessionLocal()
+    session.add(Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1)))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    with patch("modules.api.main.init_users_db"):
+        from modules.api.main import app
+
+        app.dependency_overrides[get_users_db] = lambda: db
+        with TestClient(app) as c:
+            yield c
+        app.dependency_overrides.clear()
+
+
+def test_etag_and_not_modified(client):
+    response = client.get("/tournaments/1")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Open"
+    etag = response.headers["etag"]
+
+    response = client.get("/tournaments/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_bump_invalidates_cached_response(client, db):
+    etag = client.get("/tournaments/1").headers["etag"]
+
+    db.query(Tournament).filter(Tournament.id == 1).update({"name": "Renamed"})
+    # Sans bump la réponse en cache est toujours servie
+    assert client.get("/tournaments/1").json()["name"] == "Open"
+
+    bump_tournament(db, 1, listing=True)
+    db.commit()
+
+    response = client.get("/tournaments/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["name"] == "Renamed"
+    assert response.headers["etag"] != etag
+
+
+def test_missing_tournament_is_not_cached(client):
+    assert client.get("/tournaments/42").status_code == 404
+
+
+def test_renamed_player_invalidates_tournament_views(client, db):
+    db.add(Role(id=1, role="user"))
+    db.add(User(id=1, nickname="p1", name="P 1", role_id=1))
+    db.add(Participant(id=1, tournament_id=1))
+    db.add(ParticipantMember(participant_id=1, user_id=1))
+    db.commit()
+    etag = client.get("/tournaments/1/details").headers["etag"]
+    admin = type("Admin", (), {"scopes": ["admin"]})()
+
+    # Champ non affiché : les vues en cache restent valides
+    admin_update_user(1, UserUpdate(discord="p1#0001"), admin, db)
+    response = client.get("/tournaments/1/details", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    admin_update_user(1, UserUpdate(nickname="renamed"), admin, db)
+    response = client.get("/tournaments/1/details", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
@@ -0,0 +1,44 @@
+import fcntl
+import threading
+import pytest
+from unittest.mock import patch
+
+import scheduler
+
+
+@pytest.fixture
+def lock_path(tmp_path):
+    path = tmp_path / "scheduler.lock"
+    with (
+        patch("scheduler.SCHEDULER_LOCK_PATH", path),
+        patch("scheduler._lease_file", None),
+    ):
+        yield path
+
+
+def test_acquire_scheduler_lease_is_exclusive(lock_path):
+    assert scheduler.acquire_scheduler_lease() is True
+    assert scheduler.is_scheduler_leader()
+
+    # Un autre worker (autre descripteur) ne peut pas prendre le verrou
+    with open(lock_path, "a+") as other:
+        with pytest.raises(OSError):
+            fcntl.flock(other.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    scheduler._lease_file.close()
+
+
+def test_follower_does_not_start_scheduler(lock_path):
+    with open(lock_path, "a+") as leader:
+        fcntl.flock(leader.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        with patch("scheduler._run_scheduler") as mock_run:
+            try:
+                scheduler.start_scheduler()
+                mock_run.assert_not_called()
+                assert not scheduler.is_scheduler_leader()
+            finally:
+                # Sans arrêt, le thread pourrait prendre le verrou pendant d'autres tests
+                scheduler.stop_lease_wait()
+        assert not any(
+            thread.name == "scheduler-lease" for thread in threading.enumerate()
+        )
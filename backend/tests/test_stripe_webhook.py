@@ -0,0 +1,172 @@
+import hashlib
+import hmac
+import time
+import orjson
+import pytest
+from datetime import datetime
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.database.dependencies import get_users_db
+from modules.api.users.models import User
+from modules.api.tournaments.models import Tournament, TournamentPayment
+from modules.api.stripe import functions, routes
+from modules.api.stripe.models import StripeEvent
+from modules.api.stripe.functions import process_stripe_events, record_stripe_event
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+SECRET = "whsec_test"
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setenv("TEST_MODE", "1")
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(User(id=1, nickname="p1", name="P 1", role_id=1))
+    session.add(Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1)))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def checkout_event(event_id, user_id=1, tournament_id=1):
+    return {
+        "id": event_id,
+        "object": "event",
+        "type": "checkout.session.completed",
+        "data": {
+            "object": {
+                "id": f"cs_{event_id}",
+                "amount_total": 325,
+                "metadata": {
+                    "user_id": str(user_id),
+                    "tournament_id": str(tournament_id),
+                },
+            }
+        },
+    }
+
+
+def paid(db):
+    return db.scalars(select(TournamentPayment.paid)).all()
+
+
+def test_events_are_stored_once_and_processed_once(db):
+    assert record_stripe_event(db, checkout_event("evt_1"))
+    assert not record_stripe_event(db, checkout_event("evt_1"))
+    record_stripe_event(db, checkout_event("evt_2", tournament_id=99))
+    db.commit()
+
+    assert process_stripe_events(db) == 2
+    assert paid(db) == [True]
+    assert db.get(StripeEvent, "evt_2").last_error == "User or tournament not found"
+
+    # Rejeu après traitement : ni nouvelle ligne, ni nouveau traitement
+    assert not record_stripe_event(db, checkout_event("evt_1"))
+    assert process_stripe_events(db) == 0
+    assert db.get(StripeEvent, "evt_1").attempts == 1
+
+
+def test_failed_batch_is_released_for_retry(db, monkeypatch):
+    record_stripe_event(db, checkout_event("evt_1"))
+    db.commit()
+
+    def broken(db, events):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("modules.api.stripe.functions._apply_events", broken)
+    assert process_stripe_events(db) == 1
+    event = db.get(StripeEvent, "evt_1")
+    assert (event.processed_at, event.attempts, event.last_error) == (
+        None,
+        1,
+        "boom",
+    )
+
+    monkeypatch.undo()
+    monkeypatch.setenv("TEST_MODE", "1")
+    assert process_stripe_events(db) == 1
+    assert paid(db) == [True]
+
+
+def test_failing_event_does_not_charge_its_batch(db, monkeypatch):
+    db.add(User(id=2, nickname="p2", name="P 2", role_id=1))
+    for event in (
+        checkout_event("evt_1"),
+        checkout_event("evt_bad"),
+        checkout_event("evt_3", user_id=2),
+    ):
+        record_stripe_event(db, event)
+    db.commit()
+
+    apply_events = functions._apply_events
+
+    def poisoned(db, events):
+        if any(event.id == "evt_bad" for event in events):
+            raise RuntimeError("boom")
+        return apply_events(db, events)
+
+    monkeypatch.setattr(functions, "_apply_events", poisoned)
+    assert process_stripe_events(db) == 3
+
+    # Les autres paiements sont enregistrés, seul l'événement fautif est relâché
+    assert paid(db) == [True, True]
+    states = {
+        event.id: (event.processed_at is None, event.attempts, event.last_error)
+        for event in db.scalars(select(StripeEvent))
+    }
+    assert states == {
+        "evt_1": (False, 1, None),
+        "evt_bad": (True, 1, "boom"),
+        "evt_3": (False, 1, None),
+    }
+
+
+def test_webhook_acknowledges_before_processing(db, monkeypatch):
+    monkeypatch.setenv("STRIPE_WEBHOOK_SECRET", SECRET)
+    processed = []
+    monkeypatch.setattr(
+        routes,
+        "process_pending_stripe_events",
+        lambda: processed.append(process_stripe_events(db)),
+    )
+    app = FastAPI()
+    app.include_router(routes.payments_router)
+    app.dependency_overrides[get_users_db] = lambda: db
+
+    payload = orjson.dumps(checkout_event("evt_1"))
+    timestamp = int(time.time())
+    signature = hmac.new(
+        SECRET.encode(), f"{timestamp}.".encode() + payload, hashlib.sha256
+    ).hexdigest()
+    headers = {"stripe-signature": f"t={timestamp},v1={signature}"}
+
+    with TestClient(app) as client:
+        first = client.post(
+            "/payments/tournament_webhook", content=payload, headers=headers
+        )
+        again = client.post(
+            "/payments/tournament_webhook", content=payload, headers=headers
+        )
+        forged = client.post(
+            "/payments/tournament_webhook",
+            content=payload,
+            headers={"stripe-signature": f"t={timestamp},v1=00"},
+        )
+
+    assert first.json() == {"status": "success"}
+    assert again.json() == {"status": "duplicate"}
+    assert forged.status_code == 400
+    assert processed == [1]
+    assert paid(db) == [True]
@@ -0,0 +1,130 @@
+import pytest
+from datetime import datetime
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase, set_sqlite_pragmas
+from modules.api.users.models import Role, User
+from modules.api.users.schemas import TokenData
+from modules.api.tournaments.models import (
+    MatchPlayer,
+    Match,
+    Participant,
+    ParticipantMember,
+    Tournament,
+    TournamentArchiveResult,
+    TournamentRegistration,
+)
+from modules.api.tournaments.schemas import SwapPlayersBatchRequest, SwapPlayersRequest
+from modules.api.tournaments.routes.tournaments import swap_players, swap_players_batch
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+event.listen(engine, "connect", set_sqlite_pragmas)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+ADMIN = TokenData(sub="admin@test.fr", exp=0, role="admin", scopes=["admin"])
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(Role(id=1, role="user"))
+    session.flush()
+    session.add_all(
+        User(id=i, nickname=f"p{i}", name=f"P {i}", role_id=1) for i in range(1, 4)
+    )
+    session.add(
+        Tournament(
+            id=1,
+            name="Open",
+            start_date=datetime(2025, 5, 1),
+            mode="single",
+            status="finished",
+        )
+    )
+    for user_id in (1, 2):
+        session.add(TournamentRegistration(user_id=user_id, tournament_id=1))
+        session.add(Participant(id=user_id, tournament_id=1))
+        session.add(ParticipantMember(participant_id=user_id, user_id=user_id))
+    session.add(Match(id=1, tournament_id=1, status="completed"))
+    session.add(MatchPlayer(match_id=1, participant_id=1, score=3))
+    session.add(MatchPlayer(match_id=1, participant_id=2, score=1))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def members(db):
+    return dict(
+        db.execute(select(ParticipantMember.participant_id, ParticipantMember.user_id))
+        .tuples()
+        .all()
+    )
+
+
+def registered(db):
+    return set(db.scalars(select(TournamentRegistration.user_id)))
+
+
+def test_swap_keeps_participant_and_scores(db):
+    swap_players(
+        1, SwapPlayersRequest(wrong_participant_id=1, correct_user_id=3), db, ADMIN
+    )
+
+    assert members(db) == {1: 3, 2: 2}
+    assert registered(db) == {2, 3}
+    scores = dict(
+        db.execute(select(MatchPlayer.participant_id, MatchPlayer.score)).all()
+    )
+    assert scores == {1: 3, 2: 1}
+    # Archive du tournoi terminé recalculée avec le bon joueur
+    winner = db.get(TournamentArchiveResult, (1, 3))
+    assert winner is not None and winner.single_wins == 1.0
+
+
+def test_batch_swaps_two_players(db):
+    response = swap_players_batch(
+        1,
+        SwapPlayersBatchRequest(
+            swaps=[
+                {"wrong_participant_id": 1, "correct_user_id": 2},
+                {"wrong_participant_id": 2, "correct_user_id": 1},
+            ]
+        ),
+        db,
+        ADMIN,
+    )
+
+    assert [(s.wrong_user_id, s.correct_user_id) for s in response.swapped] == [
+        (1, 2),
+        (2, 1),
+    ]
+    assert members(db) == {1: 2, 2: 1}
+    assert registered(db) == {1, 2}
+
+
+def test_batch_is_all_or_nothing(db):
+    with pytest.raises(HTTPException) as exc:
+        swap_players_batch(
+            1,
+            SwapPlayersBatchRequest(
+                swaps=[
+                    {"wrong_participant_id": 1, "correct_user_id": 3},
+                    {"wrong_participant_id": 2, "correct_user_id": 99},
+                ]
+            ),
+            db,
+            ADMIN,
+        )
+
+    assert exc.value.status_code == 404
+    db.rollback()
+    assert members(db) == {1: 1, 2: 2}
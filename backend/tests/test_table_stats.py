@@ -0,0 +1,62 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.api.admin.db_admin import get_table_stats
+from modules.database.table_stats import analyze_database
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    with engine.begin() as conn:
+        for table in ("scores", "notes", "empty"):
+            conn.exec_driver_sql(f"DROP TABLE IF EXISTS {table}")
+        conn.exec_driver_sql("DROP TABLE IF EXISTS sqlite_stat1")
+        conn.exec_driver_sql("CREATE TABLE scores (id INTEGER PRIMARY KEY, v INT)")
+        conn.exec_driver_sql("CREATE INDEX ix_scores_v ON scores (v)")
+        conn.exec_driver_sql("CREATE TABLE notes (body TEXT)")
+        conn.exec_driver_sql("CREATE TABLE empty (id INTEGER PRIMARY KEY)")
+        conn.execute(
+            text("INSERT INTO scores (v) VALUES (:v)"), [{"v": i} for i in range(50)]
+        )
+        conn.execute(text("INSERT INTO notes VALUES ('a'), ('b')"))
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def table_stats(db, **flags):
+    flags = {"exact": False, "sizes": False, **flags}
+    result = get_table_stats(db=db, **flags)
+    return result, {entry["table"]: entry for entry in result["tables"]}
+
+
+def test_counts_come_from_analyze(db):
+    result, tables = table_stats(db)
+    assert not result["analyzed"]
+    assert tables["scores"]["rows"] is None
+
+    analyze_database(engine)
+    result, tables = table_stats(db)
+    assert result["analyzed"]
+    assert (tables["scores"]["rows"], tables["notes"]["rows"]) == (50, 2)
+    # Table vide : absente de sqlite_stat1
+    assert tables["empty"]["rows"] is None
+
+
+def test_exact_counts_and_sizes(db):
+    db.execute(text("INSERT INTO notes VALUES ('c')"))
+    db.commit()
+    result, tables = table_stats(db, exact=True, sizes=True)
+
+    assert result["exact"]
+    assert (tables["notes"]["rows"], tables["empty"]["rows"]) == (3, 0)
+    assert tables["scores"]["pages"] >= 1
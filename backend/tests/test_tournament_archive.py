@@ -0,0 +1,113 @@
+import pytest
+from unittest.mock import patch
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Tournament,
+    TournamentArchive,
+)
+from modules.api.tournaments.archive import archived_or_build, sync_archive
+from modules.api.tournaments.routes.leaderboards import (
+    build_season_leaderboard,
+    build_tournament_leaderboard,
+)
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add_all(
+        [
+            User(id=1, nickname="alice", name="Alice", role_id=1),
+            User(id=2, nickname="bob", name="Bob", role_id=1),
+        ]
+    )
+    for t_id in (1, 2):
+        session.add(
+            Tournament(
+                id=t_id,
+                name=f"Open {t_id}",
+                start_date=datetime(2025, 5, t_id),
+                mode="single",
+                status="running",
+            )
+        )
+        for user_id in (1, 2):
+            p_id = t_id * 10 + user_id
+            session.add(Participant(id=p_id, tournament_id=t_id))
+            session.add(ParticipantMember(participant_id=p_id, user_id=user_id))
+        session.add(Match(id=t_id, tournament_id=t_id, status="completed"))
+        session.add(MatchPlayer(match_id=t_id, participant_id=t_id * 10 + 1, score=3))
+        session.add(MatchPlayer(match_id=t_id, participant_id=t_id * 10 + 2, score=1))
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def finish(db, tournament_id):
+    db.get(Tournament, tournament_id).status = "finished"
+    sync_archive(db, tournament_id)
+    db.commit()
+
+
+def test_finished_tournament_is_served_from_archive(db):
+    live = build_tournament_leaderboard(db, 1).model_dump()
+    assert live["leaderboard"][0]["nickname"] == "alice"
+
+    finish(db, 1)
+    # Les tables « chaudes » ne sont plus lues pour un tournoi archivé
+    db.query(MatchPlayer).filter(MatchPlayer.match_id == 1).delete()
+    db.commit()
+
+    archived = archived_or_build(db, 1, "leaderboard", build_tournament_leaderboard)
+    assert archived == live
+
+
+def test_season_leaderboard_merges_archived_and_live(db):
+    expected = build_season_leaderboard(db, 2025).model_dump()
+
+    finish(db, 1)
+
+    assert build_season_leaderboard(db, 2025).model_dump() == expected
+    alice = expected["leaderboard"][0]
+    assert alice["nickname"] == "alice"
+    assert alice["single_wins"] == 2.0
+
+
+def test_reopened_tournament_drops_archive(db):
+    finish(db, 1)
+    finish(db, 1)  # nouveau snapshot, remplace le précédent
+    assert db.query(TournamentArchive).count() == 1
+
+    db.get(Tournament, 1).status = "running"
+    sync_archive(db, 1)
+    db.commit()
+
+    assert db.query(TournamentArchive).count() == 0
+
+
+def test_live_tournament_change_skips_best_finishes(db):
+    with patch("modules.api.tournaments.archive.refresh_best_finishes") as refresh:
+        sync_archive(db, 2)  # score saisi dans un tournoi en cours
+        refresh.assert_not_called()
+
+        finish(db, 2)
+        refresh.assert_called_once_with(db, 2)
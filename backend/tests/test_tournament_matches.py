@@ -0,0 +1,67 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from modules.database.session import UsersBase
+from modules.api.users.models import User
+from modules.api.tournaments.models import (
+    Match,
+    MatchPlayer,
+    Participant,
+    ParticipantMember,
+    Tournament,
+)
+from modules.api.tournaments.routes.matches import build_tournament_matches
+
+engine = create_engine(
+    "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False)
+
+
+@pytest.fixture
+def db():
+    UsersBase.metadata.drop_all(bind=engine)
+    UsersBase.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    session.add(Tournament(id=1, name="Open", start_date=datetime(2025, 5, 1)))
+    session.add_all(
+        [
+            User(id=1, nickname="alice", name="Alice", role_id=1),
+            User(id=2, nickname="bob", name="Bob", role_id=1),
+            Participant(id=1, tournament_id=1, name="Team A"),
+            Participant(id=2, tournament_id=1),
+            Participant(id=3, tournament_id=1),
+            ParticipantMember(participant_id=2, user_id=2),
+            ParticipantMember(participant_id=2, user_id=1),
+            Match(id=1, tournament_id=1, status="completed"),
+            MatchPlayer(match_id=1, participant_id=1, score=3),
+            MatchPlayer(match_id=1, participant_id=2, score=1),
+            Match(id=2, tournament_id=1, status="pending", round=2),
+            MatchPlayer(match_id=2, participant_id=3),
+            Match(id=3, tournament_id=1, status="pending"),
+        ]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_build_tournament_matches(db):
+    matches = build_tournament_matches(db, 1).items
+
+    assert [m["id"] for m in matches] == [1, 2, 3]
+    # Nom du participant, sinon celui du premier membre, sinon "Inconnu"
+    assert matches[0]["participants"] == [
+        {"participant_id": 1, "name": "Team A", "score": 3.0},
+        {"participant_id": 2, "name": "Bob", "score": 1.0},
+    ]
+    assert matches[1]["participants"] == [
+        {"participant_id": 3, "name": "Inconnu", "score": None}
+    ]
+    assert matches[1]["round"] == 2
+    assert matches[2]["participants"] == []
@@ -0,0 +1,177 @@
+import csv
+import io
+import os
+import zlib
+from typing import Iterable, Iterator, List, Literal, Sequence, Tuple
+from fastapi import HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Boolean, Date, DateTime, Float, Integer, Numeric
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+from sqlalchemy.types import TypeEngine
+from dotenv import load_dotenv
+
+load_dotenv()
+
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+ExportFormat = Literal["csv", "parquet"]
+Columns = List[Tuple[str, TypeEngine]]
+
+
+def export_params(
+    format: ExportFormat = Query("csv", description="csv or parquet"),
+    gzip: bool = Query(False, description="Gzip the file"),
+) -> Tuple[str, bool]:
+    return format, gzip
+
+
+def query_columns(stmt: Select) -> Columns:
+    """Name and type of each column of a query, for the file header/schema."""
+    return [(column.name, column.type) for column in stmt.selected_columns]
+
+
+def stream_query(db: Session, stmt: Select) -> Iterator[Sequence[tuple]]:
+    """
+    Rows of a query in chunks of EXPORT_CHUNK_SIZE, read from a cursor kept
+    open while the response streams. The request session is closed once the
+    route returns: the rows are read from a session of their own.
+    """
+    session = Session(bind=db.get_bind())
+    try:
+        result = session.execute(stmt.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        for rows in result.partitions():
+            yield rows
+    finally:
+        session.close()
+
+
+def chunked(rows: Sequence[tuple]) -> Iterator[Sequence[tuple]]:
+    """Rows already in memory, in chunks of EXPORT_CHUNK_SIZE."""
+    for start in range(0, len(rows), EXPORT_CHUNK_SIZE):
+        yield rows[start : start + EXPORT_CHUNK_SIZE]
+
+
+def csv_chunks(columns: Columns, chunks: Iterable[Sequence[tuple]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+    for rows in chunks:
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # En-tête seul si aucune ligne
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+class _Sink(io.RawIOBase):
+    """
+    Write-only file emptied after each chunk, which still reports the absolute
+    position (the Parquet footer records offsets from the start of the file).
+    """
+
+    def __init__(self):
+        self.chunks, self.position = [], 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _arrow_type(pa, sql_type: TypeEngine):
+    if isinstance(sql_type, Boolean):
+        return pa.bool_()
+    if isinstance(sql_type, Integer):
+        return pa.int64()
+    if isinstance(sql_type, (Float, Numeric)):
+        return pa.float64()
+    if isinstance(sql_type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(sql_type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def parquet_chunks(
+    columns: Columns, chunks: Iterable[Sequence[tuple]]
+) -> Iterator[bytes]:
+    """One Parquet row group per chunk, flushed to the response as it is written."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, _arrow_type(pa, type_)) for name, type_ in columns])
+    sink = _Sink()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in chunks:
+            writer.write_table(
+                pa.Table.from_arrays(
+                    [
+                        pa.array([row[index] for row in rows], type=field.type)
+                        for index, field in enumerate(schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield sink.drain()
+    yield sink.drain()
+
+
+def gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_response(
+    filename: str,
+    columns: Columns,
+    chunks: Iterable[Sequence[tuple]],
+    params: Tuple[str, bool],
+) -> StreamingResponse:
+    """
+    Stream rows as a CSV or Parquet attachment, optionally gzipped, without
+    building the whole file (nor any response model) in memory.
+    """
+    fmt, gzip = params
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(
+                status_code=501, detail="Parquet export requires pyarrow"
+            )
+        body = parquet_chunks(columns, chunks)
+    else:
+        body = csv_chunks(columns, chunks)
+
+    filename = f"{filename}.{fmt}"
+    if gzip:
+        body = gzip_chunks(body)
+        filename += ".gz"
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,9 @@
+from typing import Iterable
+from sqlalchemy.engine import Row
+
+
+def rows_to_dicts(rows: Iterable[Row]) -> list:
+    """
+    Convert query rows to plain dicts (column label -> value), without model validation.
+    """
+    return [dict(row._mapping) for row in rows]
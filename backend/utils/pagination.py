@@ -0,0 +1,127 @@
+import os
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional
+from fastapi import HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+
+load_dotenv()
+
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+
+@dataclass
+class PageParams:
+    cursor: Optional[int] = None
+    limit: Optional[int] = None
+    fields: Optional[List[str]] = None
+    with_total: bool = False
+
+    def check_fields(self, allowed: Iterable[str]):
+        """
+        Reject unknown field names with a 400 (allowed: fields of the response model).
+        """
+        if not self.fields:
+            return
+        unknown = sorted(set(self.fields) - set(allowed))
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+            )
+
+
+@dataclass
+class Page:
+    items: list
+    next_cursor: Optional[int] = None
+    total: Optional[int] = None
+    fields: Optional[List[str]] = None
+
+    def headers(self) -> dict:
+        headers = {}
+        if self.next_cursor is not None:
+            headers["X-Next-Cursor"] = str(self.next_cursor)
+        if self.total is not None:
+            headers["X-Total-Count"] = str(self.total)
+        return headers
+
+
+def page_params(default_limit: Optional[int] = None):
+    """
+    Build the query-parameter dependency shared by the paginated list endpoints.
+    Without `limit` the whole list is returned, as before pagination existed;
+    a `limit` above MAX_PAGE_SIZE is lowered to it rather than rejected.
+    """
+
+    def dependency(
+        cursor: Optional[int] = Query(
+            None, ge=0, description="Id of the last item of the previous page"
+        ),
+        limit: Optional[int] = Query(default_limit, ge=1),
+        fields: Optional[str] = Query(
+            None, description="Comma-separated list of fields to return"
+        ),
+        with_total: bool = Query(
+            False, description="Return the total count in X-Total-Count"
+        ),
+    ) -> PageParams:
+        return PageParams(
+            cursor=cursor,
+            limit=min(limit, MAX_PAGE_SIZE) if limit is not None else None,
+            fields=[f.strip() for f in fields.split(",") if f.strip()]
+            if fields
+            else None,
+            with_total=with_total,
+        )
+
+    return dependency
+
+
+def paginate(
+    db: Session, stmt, key, params: PageParams, offset: Optional[int] = None
+) -> Page:
+    """
+    Run `stmt` one page at a time, ordered by the unique column `key`.
+
+    Pages are fetched with `key > cursor` (keyset) so that page N costs the same
+    as page 1; `offset` is only used by legacy callers when no cursor is given.
+    The returned page holds the rows and the cursor of the next page, if any.
+    """
+    total = None
+    if params.with_total:
+        total = db.execute(
+            select(func.count()).select_from(stmt.order_by(None).subquery())
+        ).scalar()
+
+    if params.cursor is not None:
+        stmt = stmt.where(key > params.cursor)
+    elif offset:
+        stmt = stmt.offset(offset)
+    stmt = stmt.order_by(key)
+    if params.limit is not None:
+        stmt = stmt.limit(params.limit + 1)
+
+    rows = db.execute(stmt).all()
+    next_cursor = None
+    if params.limit is not None and len(rows) > params.limit:
+        rows = rows[: params.limit]
+        next_cursor = rows[-1]._mapping[key.key]
+
+    return Page(items=rows, next_cursor=next_cursor, total=total, fields=params.fields)
+
+
+def select_fields(items: List[dict], fields: Optional[List[str]]) -> List[dict]:
+    if not fields:
+        return items
+    return [{name: item.get(name) for name in fields} for item in items]
+
+
+def page_response(page: Page, items: Optional[List[Any]] = None) -> ORJSONResponse:
+    """
+    Serialize a page of plain dicts with orjson, with the pagination headers.
+    `items` replaces the raw rows when the caller reshaped them.
+    """
+    items = page.items if items is None else items
+    return ORJSONResponse(select_fields(items, page.fields), headers=page.headers())
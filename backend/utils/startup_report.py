@@ -0,0 +1,38 @@
+import importlib
+import sys
+import time
+
+# Dépendances lourdes qui ne doivent être chargées qu'à la première utilisation
+HEAVY_MODULES = ("pandas", "pdfplumber", "fuzzywuzzy", "openpyxl", "stripe")
+
+import_report = []
+
+
+def timed_import(module_path: str):
+    """
+    Importe un module et enregistre le temps d'import (cumulé, dépendances comprises).
+    Seul le premier import est mesuré.
+    """
+    if module_path in sys.modules:
+        return sys.modules[module_path]
+
+    start = time.perf_counter()
+    module = importlib.import_module(module_path)
+    import_report.append(
+        {
+            "module": module_path,
+            "import_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
+    )
+    return module
+
+
+def get_startup_report() -> dict:
+    """
+    Retourne le temps d'import de chaque module de routes et l'état des dépendances lourdes.
+    """
+    return {
+        "total_import_ms": round(sum(entry["import_ms"] for entry in import_report), 2),
+        "modules": sorted(import_report, key=lambda e: e["import_ms"], reverse=True),
+        "heavy_modules_loaded": {name: name in sys.modules for name in HEAVY_MODULES},
+    }